@@ -48,7 +48,6 @@ del hard_dependencies, soft_dependencies, dependency, missing_dependencies
 from pygaps.data import DATABASE
 from pygaps.data import ADSORBATE_LIST
 from pygaps.data import MATERIAL_LIST
-from pygaps.data import load_data
 
 # Thermodynamic backend
 from pygaps.utilities.coolprop_utilities import thermodynamic_backend
@@ -61,9 +60,5 @@ from pygaps.core.material import Material
 from pygaps.core.pointisotherm import PointIsotherm
 from pygaps.core.modelisotherm import ModelIsotherm
 
-# Data load
-load_data()
-del load_data
-
 # Other user-facing functions
 # from .api import *
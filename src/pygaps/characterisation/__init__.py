@@ -8,6 +8,7 @@ from .area_bet import area_BET_raw
 from .area_lang import area_langmuir
 from .area_lang import area_langmuir_raw
 from .dr_da_plots import da_plot
+from .dr_da_plots import da_plot_batch
 from .dr_da_plots import dr_plot
 from .enth_sorp_whittaker import enthalpy_sorption_whittaker
 from .initial_enth import initial_enthalpy_comp
@@ -17,6 +18,7 @@ from .initial_henry import initial_henry_virial
 from .isosteric_enth import isosteric_enthalpy
 from .isosteric_enth import isosteric_enthalpy_raw
 from .psd_kernel import psd_dft
+from .psd_kernel import psd_dft_batch
 from .psd_meso import psd_mesoporous
 from .psd_micro import psd_microporous
 from .t_plots import t_plot
@@ -19,6 +19,7 @@ def area_BET(
     isotherm: "PointIsotherm | ModelIsotherm",
     branch: str = 'ads',
     p_limits: "tuple[float, float]" = None,
+    scan: bool = False,
     verbose: bool = False,
 ):
     r"""
@@ -26,7 +27,9 @@ def area_BET(
 
     The optional ``p_limits`` parameter allows to specify the upper and lower
     pressure limits to calculate the BET area, otherwise the limits will be
-    automatically selected based on the Rouquerol rules.
+    automatically selected based on the Rouquerol rules. With ``scan``, every
+    contiguous region within the limits is evaluated instead, and the largest
+    region which satisfies all the consistency criteria is used.
 
     Parameters
     ----------
@@ -36,6 +39,9 @@ def area_BET(
         Branch of the isotherm to use. It defaults to adsorption.
     p_limits : tuple[float, float], optional
         Pressure range in which to perform the calculation.
+    scan : bool, optional
+        Whether to select the BET region from all the valid regions of the
+        isotherm, see :func:`bet_windows`.
     verbose : bool, optional
         Prints extra information and plots graphs of the calculation.
 
@@ -53,6 +59,9 @@ def area_BET(
         - ``bet_slope`` (float) : slope of the BET plot
         - ``bet_intercept`` (float) : intercept of the BET plot
         - ``corr_coef`` (float) : correlation coefficient of the linear region in the BET plot
+        - ``p_limit_indices`` (tuple[int, int]) : indices of the first and last points of the BET region
+        - ``windows`` (dict) : if ``scan`` is set, all the valid BET regions, as returned by
+          :func:`bet_windows`
 
     Raises
     ------
@@ -112,7 +121,10 @@ def area_BET(
     * The loading at the statistical monolayer should be situated within the
       limits of the BET region.
 
-    This module implements all these checks.
+    This module implements all these checks. By default, the BET region
+    ends where the Rouquerol plot first decreases. Alternatively, in the
+    manner of BETSI [#]_, all possible regions can be scanned and ranked,
+    keeping those which pass the checks and are linear.
 
     Regardless, the BET surface area should still be interpreted carefully. The following
     assumptions are implicitly made in this approach:
@@ -131,10 +143,14 @@ def area_BET(
        P. H. Emmett and E. Teller, J. Amer. Chem. Soc., 60, 309 (1938)
     .. [#] "Adsorption by Powders & Porous Solids", F. Rouquerol, J Rouquerol
        and K. Sing, Academic Press, 1999
+    .. [#] "Surface Area Determination of Porous Materials Using the
+       Brunauer-Emmett-Teller (BET) Method: Limitations and Improvements",
+       J. W. M. Osterrieth et al., Adv. Mater., 34, 2201502 (2022)
 
     See Also
     --------
     pygaps.characterisation.area_bet.area_BET_raw : low level method
+    pygaps.characterisation.area_bet.bet_windows : scan of all BET regions
 
     """
     # get adsorbate properties
@@ -160,11 +176,13 @@ def area_BET(
         minimum,
         maximum,
         corr_coef,
+        *windows,
     ) = area_BET_raw(
         pressure,
         loading,
         cross_section,
         p_limits,
+        scan,
     )
 
     if verbose:
@@ -205,7 +223,7 @@ def area_BET(
             roq_transform(p_monolayer, n_monolayer),
         )
 
-    return {
+    result = {
         'area': bet_area,
         'c_const': c_const,
         'n_monolayer': n_monolayer,
@@ -215,6 +233,10 @@ def area_BET(
         'corr_coef': corr_coef,
         'p_limit_indices': (minimum, maximum),
     }
+    if scan:
+        result['windows'] = windows[0]
+
+    return result
 
 
 def area_BET_raw(
@@ -222,6 +244,7 @@ def area_BET_raw(
     loading: "list[float]",
     cross_section: float,
     p_limits: "tuple[float,float]" = None,
+    scan: bool = False,
 ):
     """
     Calculate BET-determined surface area.
@@ -240,6 +263,9 @@ def area_BET_raw(
         Adsorbed cross-section of the molecule of the adsorbate, in nm.
     p_limits : tuple[float, float], optional
         Pressure range in which to perform the calculation.
+    scan : bool, optional
+        Whether to use the first of the valid regions found by
+        :func:`bet_windows`, instead of the first Rouquerol region.
 
     Returns
     -------
@@ -261,6 +287,9 @@ def area_BET_raw(
         Maximum point taken for the linear region.
     corr_coef : float
         Correlation coefficient of the straight line in the BET plot.
+    windows : dict
+        Only returned if ``scan`` is set, the regions evaluated by
+        :func:`bet_windows`, indexed on the input arrays.
 
     """
     # Check lengths
@@ -274,10 +303,24 @@ def area_BET_raw(
     pressure = numpy.asarray(pressure)
 
     # select the maximum and minimum of the points and the pressure associated
-    minimum = 0
-    maximum = len(pressure) - 1  # As we want absolute position
+    minimum, maximum = _limit_indices(pressure, p_limits)
+
+    if scan:
+        windows = bet_windows(
+            pressure[minimum:maximum + 1],
+            loading[minimum:maximum + 1],
+            cross_section,
+        )
+        if len(windows['minimum']) == 0:
+            raise CalculationError(
+                "No region of the isotherm satisfies the BET consistency criteria. "
+                "Unable to calculate BET area."
+            )
+        windows['minimum'] += minimum
+        windows['maximum'] += minimum
+        minimum, maximum = windows['minimum'][0], windows['maximum'][0]
 
-    if p_limits is None:
+    elif p_limits is None:
         # Generate the Rouquerol array
         roq_t_array = roq_transform(pressure, loading)
 
@@ -293,12 +336,6 @@ def area_BET_raw(
         min_p = pressure[maximum] * 0.1
         minimum = numpy.searchsorted(pressure, min_p)
 
-    else:
-        if p_limits[0]:
-            minimum = numpy.searchsorted(pressure, p_limits[0])
-        if p_limits[1]:
-            maximum = numpy.searchsorted(pressure, p_limits[1]) - 1
-
     if maximum - minimum < 2:  # (for 3 point minimum)
         raise CalculationError(
             "The isotherm does not have enough points (at least 3) "
@@ -332,7 +369,7 @@ def area_BET_raw(
     if not loading[0] < n_monolayer < loading[-1]:
         logger.warning("The monolayer point is not within the BET region")
 
-    return (
+    result = (
         bet_area,
         c_const,
         n_monolayer,
@@ -343,6 +380,21 @@ def area_BET_raw(
         maximum,
         corr_coef,
     )
+    if scan:
+        return result + (windows, )
+    return result
+
+
+def _limit_indices(pressure, p_limits):
+    """Return the indices of the first and last points within pressure limits."""
+    minimum = 0
+    maximum = len(pressure) - 1  # As we want absolute position
+    if p_limits is not None:
+        if p_limits[0]:
+            minimum = numpy.searchsorted(pressure, p_limits[0])
+        if p_limits[1]:
+            maximum = numpy.searchsorted(pressure, p_limits[1]) - 1
+    return minimum, maximum
 
 
 def roq_transform(pressure, loading):
@@ -361,6 +413,102 @@ def bet_fit(pressure, bet_points):
     return slope, intercept, corr_coef
 
 
+def bet_windows(
+    pressure: "list[float]",
+    loading: "list[float]",
+    cross_section: float,
+    min_points: int = 3,
+    min_corr: float = 0.99,
+) -> dict:
+    """
+    Evaluate every contiguous region of the isotherm as a BET region.
+
+    All regions are fitted at once, from cumulative sums of the BET plot.
+    A region is valid if its points are all in the BET plot, the Rouquerol
+    plot does not decrease within it, the C constant is positive, the
+    monolayer loading lies within its loadings and the correlation coefficient
+    is at least ``min_corr``. The valid regions are ranked with the regions
+    with the most points first, then by correlation coefficient.
+
+    Parameters
+    ----------
+    pressure : list[float]
+        Pressures, relative, in increasing order.
+    loading : list[float]
+        Loadings, in mol/basis.
+    cross_section : float
+        Adsorbed cross-section of the molecule of the adsorbate, in nm.
+    min_points : int, optional
+        Smallest number of points in a region, default 3.
+    min_corr : float, optional
+        Smallest correlation coefficient of a region, default 0.99.
+
+    Returns
+    -------
+    dict
+        Arrays with an element for each valid region, in rank order:
+        ``minimum`` and ``maximum`` (indices of the first and last points),
+        ``points``, ``slope``, ``intercept``, ``corr_coef``, ``c_const``,
+        ``n_monolayer``, ``p_monolayer`` and ``area``.
+
+    """
+    pressure = numpy.asarray(pressure, dtype=float)
+    loading = numpy.asarray(loading, dtype=float)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        bet_points = bet_transform(pressure, loading)
+    finite = numpy.isfinite(bet_points)
+
+    # first and last point of every region
+    minimum, maximum = numpy.triu_indices(len(pressure), max(min_points, 2) - 1)
+    points = maximum - minimum + 1
+
+    def region_sum(values):
+        total = numpy.concatenate([[0], numpy.cumsum(values)])
+        return total[maximum + 1] - total[minimum]
+
+    # least squares fits of all regions, on centred data to limit round-off
+    x_mean = pressure.mean()
+    y_mean = bet_points[finite].mean() if finite.any() else 0
+    x = pressure - x_mean
+    y = numpy.where(finite, bet_points - y_mean, 0)
+    s_x, s_y, s_xx, s_xy, s_yy = (region_sum(v) for v in (x, y, x * x, x * y, y * y))
+    cov = points * s_xy - s_x * s_y
+    var_x = points * s_xx - s_x**2
+    var_y = points * s_yy - s_y**2
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        slope = cov / var_x
+        intercept = (s_y - slope * s_x) / points + y_mean - slope * x_mean
+        corr_coef = cov / numpy.sqrt(var_x * var_y)
+        n_monolayer, p_monolayer, c_const, area = bet_parameters(slope, intercept, cross_section)
+
+        # Rouquerol and consistency criteria, counting decreasing steps in each region
+        decreasing = numpy.concatenate([[0], numpy.cumsum(numpy.diff(roq_transform(pressure, loading)) < 0)])
+        valid = (
+            (region_sum(~finite) == 0)
+            & (decreasing[maximum] == decreasing[minimum])
+            & (c_const > 0)
+            & (corr_coef >= min_corr)
+            & (loading[minimum] < n_monolayer)
+            & (n_monolayer < loading[maximum])
+        )
+
+    order = numpy.flatnonzero(valid)
+    order = order[numpy.lexsort((-corr_coef[order], -points[order]))]
+    return {
+        'minimum': minimum[order],
+        'maximum': maximum[order],
+        'points': points[order],
+        'slope': slope[order],
+        'intercept': intercept[order],
+        'corr_coef': corr_coef[order],
+        'c_const': c_const[order],
+        'n_monolayer': n_monolayer[order],
+        'p_monolayer': p_monolayer[order],
+        'area': area[order],
+    }
+
+
 def bet_parameters(slope, intercept, cross_section):
     """Calculate the BET parameters from slope and intercept."""
     c_const = (slope / intercept) + 1
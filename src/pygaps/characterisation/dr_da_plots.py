@@ -2,8 +2,6 @@
 
 import numpy
 from scipy import constants
-from scipy import optimize
-from scipy import stats
 
 from pygaps import logger
 from pygaps.core.adsorbate import Adsorbate
@@ -13,6 +11,8 @@ from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
 
+_BATCH_SIZE = 256  # Fits searched for an exponent together
+
 
 def dr_plot(
     isotherm: "PointIsotherm | ModelIsotherm",
@@ -285,6 +285,139 @@ def da_plot(
     return res
 
 
+def da_plot_batch(
+    isotherms: "list[PointIsotherm | ModelIsotherm]",
+    exp: float = None,
+    branch: str = "ads",
+    p_limits: "tuple[float, float] | list[tuple[float, float]]" = None,
+):
+    """
+    Calculate Dubinin-Astakov (DA) fits on many isotherms, or
+    pressure ranges, at once.
+
+    Each fit is the same as :func:`da_plot` on one isotherm and pressure
+    range, but all the linear regressions, and the search for the best
+    exponent, are done together on arrays.
+
+    Parameters
+    ----------
+    isotherms : list of PointIsotherm or ModelIsotherm
+        The isotherms to use for the DA plots. A single isotherm
+        is fitted in each of the ``p_limits`` ranges.
+    exp : float, optional
+        The exponent to use in the DA equation, for all fits.
+        If not specified a best fit exponent will be calculated
+        between 1 and 3 for each fit.
+    branch : {'ads', 'des'}, optional
+        Branch of the isotherms to use. It defaults to adsorption.
+    p_limits : [float, float] or list of [float, float], optional
+        Pressure range in which to perform the calculation,
+        the same for all isotherms, or one for each isotherm.
+
+    Returns
+    -------
+    dict
+        Dictionary of results with arrays of one value for each fit:
+
+        - ``pore_volume`` (array) : calculated total micropore volume, cm3/material unit
+        - ``adsorption_potential`` (array) : calculated adsorption potential, in kJ/mol
+        - ``exponent`` (array) : the exponent, unitless
+        - ``corr_coef``, ``slope``, ``intercept`` (array) : the DA line fit
+        - ``p_limits`` (array) : first and last point taken
+
+        Where no exponent gives a valid line, the results are NaN.
+
+    Raises
+    ------
+    ParameterError
+        When something is wrong with the function parameters.
+    CalculationError
+        When the calculation itself fails.
+
+    See Also
+    --------
+    pygaps.characterisation.dr_da_plots.da_plot : Dubinin-Astakov plot of a single isotherm
+
+    """
+    isotherms = list(isotherms)
+    if not isotherms:
+        raise ParameterError("No isotherms were passed.")
+    if exp is not None and exp < 0:
+        raise ParameterError("Exponent cannot be negative.")
+
+    # Match isotherms and pressure ranges
+    if p_limits is None or numpy.ndim(p_limits[0]) == 0:
+        p_limits = [p_limits] * len(isotherms)
+    elif len(isotherms) == 1:
+        isotherms = isotherms * len(p_limits)
+    if len(p_limits) != len(isotherms):
+        raise ParameterError("Pass either one pressure range, or one for each isotherm.")
+
+    # Read data in, once for each isotherm
+    data = {}
+    fits = []
+    for isotherm, limits in zip(isotherms, p_limits):
+        if id(isotherm) not in data:
+            adsorbate = Adsorbate.find(isotherm.adsorbate)
+            pressure, loading = get_iso_loading_and_pressure_ordered(
+                isotherm, branch, {
+                    "loading_basis": "molar",
+                    "loading_unit": "mol"
+                }, {"pressure_mode": "relative"}
+            )
+            data[id(isotherm)] = (
+                pressure,
+                -numpy.log(pressure),
+                log_v_adj(
+                    loading,
+                    adsorbate.molar_mass(),
+                    adsorbate.liquid_density(isotherm.temperature),
+                ),
+                isotherm.temperature,
+            )
+        pressure, log_p, logv, iso_temp = data[id(isotherm)]
+        minimum, maximum = _da_limits(pressure, limits)
+        fits.append((log_p[minimum:maximum + 1], logv[minimum:maximum + 1], iso_temp, minimum, maximum))
+
+    # Stack the points of all fits, padding shorter ones with zero weights
+    size = max(len(fit[0]) for fit in fits)
+    log_p = numpy.ones((len(fits), size))
+    logv = numpy.zeros((len(fits), size))
+    weights = numpy.zeros((len(fits), size))
+    for index, fit in enumerate(fits):
+        log_p[index, :len(fit[0])] = fit[0]
+        logv[index, :len(fit[0])] = fit[1]
+        weights[index, :len(fit[0])] = 1
+
+    if exp is None:
+        exps = numpy.concatenate([
+            _da_exponent(log_p[start:start + _BATCH_SIZE], logv[start:start + _BATCH_SIZE],
+                         weights[start:start + _BATCH_SIZE])
+            for start in range(0, len(fits), _BATCH_SIZE)
+        ])
+    else:
+        exps = numpy.full(len(fits), float(exp))
+
+    slope, intercept, corr_coef, _ = (
+        value[:, 0] for value in _da_regression(log_p, logv, weights, exps[:, None])
+    )
+
+    # Calculate final result values
+    iso_temp = numpy.array([fit[2] for fit in fits])
+    with numpy.errstate(invalid='ignore'):
+        potential = (constants.gas_constant * iso_temp) / (-slope)**(1 / exps) / 1000
+
+    return {
+        "pore_volume": numpy.exp(intercept),
+        "adsorption_potential": potential,
+        "exponent": exps,
+        "corr_coef": corr_coef,
+        "slope": slope,
+        "intercept": intercept,
+        "p_limits": numpy.array([fit[3:] for fit in fits]),
+    }
+
+
 def da_plot_raw(
     pressure: list,
     loading: list,
@@ -348,46 +481,22 @@ def da_plot_raw(
     loading = numpy.asarray(loading)
     pressure = numpy.asarray(pressure)
 
-    # select the maximum and minimum of the points and the pressure associated
-    minimum = 0
-    maximum = len(pressure) - 1  # As we want absolute position
-
-    # Set default values
-    if p_limits is None:
-        p_limits = (None, None)
-
-    if p_limits[0]:
-        minimum = numpy.searchsorted(pressure, p_limits[0])
-    if p_limits[1]:
-        maximum = numpy.searchsorted(pressure, p_limits[1]) - 1
-    if maximum - minimum < 2:  # (for 3 point minimum)
-        raise CalculationError(
-            "The isotherm does not have enough points (at least 3) "
-            "in the selected region."
-        )
+    minimum, maximum = _da_limits(pressure, p_limits)
     pressure = pressure[minimum:maximum + 1]
     loading = loading[minimum:maximum + 1]
 
     # Calculate x-axis points
+    log_p = -numpy.log(pressure)
     logv = log_v_adj(loading, molar_mass, liquid_density)
-
-    def dr_fit(exp, ret=False):
-        """Linear fit."""
-        slope, intercept, corr_coef, p_val, stderr = stats.linregress(
-            log_p_exp(pressure, exp), logv
-        )
-
-        if ret:
-            return slope, intercept, corr_coef
-        return stderr
+    weights = numpy.ones(len(log_p))
 
     if exp is None:
-        res = optimize.minimize_scalar(dr_fit, bounds=[1, 3], method='bounded')
-        if not res.success:
+        exp = float(_da_exponent(log_p, logv, weights))
+        if numpy.isnan(exp):
             raise CalculationError("""Could not obtain a linear fit on the data provided.""")
-        exp = res.x
 
-    slope, intercept, corr_coef = dr_fit(exp, ret=True)
+    fit = _da_regression(log_p, logv, weights, numpy.array([exp]))
+    slope, intercept, corr_coef = (float(value[0]) for value in fit[:3])
 
     # Calculate final result values
     microp_volume = numpy.exp(intercept)
@@ -405,6 +514,90 @@ def da_plot_raw(
     )
 
 
+def _da_limits(pressure, p_limits):
+    """Positions of the first and last point in the pressure limits."""
+    # select the maximum and minimum of the points and the pressure associated
+    minimum = 0
+    maximum = len(pressure) - 1  # As we want absolute position
+
+    # Set default values
+    if p_limits is None:
+        p_limits = (None, None)
+
+    if p_limits[0]:
+        minimum = numpy.searchsorted(pressure, p_limits[0])
+    if p_limits[1]:
+        maximum = numpy.searchsorted(pressure, p_limits[1]) - 1
+    if maximum - minimum < 2:  # (for 3 point minimum)
+        raise CalculationError(
+            "The isotherm does not have enough points (at least 3) "
+            "in the selected region."
+        )
+    return minimum, maximum
+
+
+def _da_regression(log_p, logv, weights, exps):
+    """
+    Linear regression of the DA line for several exponents at once.
+
+    The points are in the last axis of ``log_p``, ``logv`` and ``weights``,
+    which is 0 for points outside the fit, and the exponents in the last
+    axis of ``exps``. Any leading axes are broadcast together. Returns the
+    slope, intercept, correlation coefficient and standard error of the
+    slope, as `scipy.stats.linregress`, for each exponent.
+    """
+    weights = weights[..., None, :]
+    count = weights.sum(axis=-1)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        x = numpy.where(weights > 0, log_p[..., None, :]**exps[..., None], 0)
+        y = logv[..., None, :]
+
+        dx = x - (weights * x).sum(axis=-1, keepdims=True) / count[..., None]
+        dy = y - (weights * y).sum(axis=-1, keepdims=True) / count[..., None]
+        ssxm = (weights * dx * dx).sum(axis=-1)
+        ssym = (weights * dy * dy).sum(axis=-1)
+        ssxym = (weights * dx * dy).sum(axis=-1)
+
+        slope = ssxym / ssxm
+        intercept = (weights * (y - slope[..., None] * x)).sum(axis=-1) / count
+        corr_coef = numpy.clip(ssxym / numpy.sqrt(ssxm * ssym), -1, 1)
+        stderr = numpy.sqrt((1 - corr_coef**2) * ssym / ssxm / (count - 2))
+
+    return slope, intercept, corr_coef, stderr
+
+
+def _da_exponent(log_p, logv, weights, bounds=(1, 3), points=41, xtol=1e-5):
+    """
+    Find the DA exponent with the smallest standard error of the slope.
+
+    The standard error is evaluated on a grid of exponents within the
+    bounds, then on finer grids around the best exponent until it is
+    known within ``xtol``. Any leading axes of the data are separate fits.
+    Returns NaN where no exponent gives a valid fit.
+    """
+    shape = numpy.shape(log_p)[:-1]
+    lower = numpy.full(shape, bounds[0], dtype=float)
+    upper = numpy.full(shape, bounds[1], dtype=float)
+    step = numpy.linspace(0, 1, points)
+
+    while True:
+        exps = lower[..., None] + (upper - lower)[..., None] * step
+        stderr = _da_regression(log_p, logv, weights, exps)[3]
+        invalid = numpy.all(numpy.isnan(stderr), axis=-1)
+        best = numpy.argmin(numpy.where(numpy.isnan(stderr), numpy.inf, stderr), axis=-1)
+        exp = numpy.take_along_axis(exps, best[..., None], axis=-1)[..., 0]
+        width = (upper - lower) / (points - 1)
+        if numpy.all(width < xtol):
+            break
+        # zoom to the grid points on either side of the best exponent
+        lower = numpy.maximum(exp - width, bounds[0])
+        upper = numpy.minimum(exp + width, bounds[1])
+        step = numpy.linspace(0, 1, 9)
+        points = len(step)
+
+    return numpy.where(invalid, numpy.nan, exp)
+
+
 def log_v_adj(loading, molar_mass, liquid_density):
     """Log of volumetric uptake."""
     return numpy.log(loading * molar_mass / liquid_density)
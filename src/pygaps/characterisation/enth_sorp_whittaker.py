@@ -141,34 +141,31 @@ def enthalpy_sorption_whittaker(
         T_c = isotherm.adsorbate.t_critical()
         p_sat = p_c * ((T / T_c)**2)
 
-    loading_final = []
-    whittaker_enth = []
+    loading = np.asarray(loading, dtype=float)
+    loading = loading[loading != 0]
+    p = np.asarray(isotherm.pressure_at(loading, pressure_unit='Pa'), dtype=float)
 
-    first_bracket = p_sat / (b**(1 / t))  # don't need to calculate every time
-    for n in loading:
-        if n == 0:
-            continue
+    # check that it is possible to calculate h_vap
+    with np.errstate(invalid='ignore'):
+        valid = ~np.isnan(p) & (p >= 0) & (p <= p_c) & (p <= p_sat)
+    loading, p = loading[valid], p[valid]
 
-        p = isotherm.pressure_at(n, pressure_unit='Pa')
-        # check that it is possible to calculate h_vap
-        if np.isnan(p) or p < 0 or p > p_c or p > p_sat:
-            continue
+    # Cap pressure for h_vap determination to the triple point pressure
+    p = np.maximum(p, p_t)
 
-        # Cap pressure for h_vap determination to the triple point pressure
-        p = max(p, p_t)
+    # equation requires enthalpies in J, evaluated for all pressures at once
+    h_vap = isotherm.adsorbate.enthalpy_vaporisation(press=p) * 1000
 
-        # equation requires enthalpies in J
-        h_vap = isotherm.adsorbate.enthalpy_vaporisation(press=p, ) * 1000
+    theta = loading / n_m  # second bracket of d_lambda
+    theta_t = theta**t
+    first_bracket = p_sat / (b**(1 / t))
+    second_bracket = (theta_t / (1 - theta_t))**((t - 1) / t)
+    d_lambda = RT * np.log(first_bracket * second_bracket)
 
-        theta = n / n_m  # second bracket of d_lambda
-        theta_t = theta**t
-        second_bracket = (theta_t / (1 - theta_t))**((t - 1) / t)
-        d_lambda = RT * np.log(first_bracket * second_bracket)
+    h_st = d_lambda + h_vap + RT
 
-        h_st = d_lambda + h_vap + RT
-
-        loading_final.append(n)
-        whittaker_enth.append(h_st / 1000)  # return enthalpies to kJ
+    loading_final = loading.tolist()
+    whittaker_enth = (h_st / 1000).tolist()  # return enthalpies to kJ
 
     if verbose:
         from pygaps.graphing.calc_graphs import isosteric_enthalpy_plot
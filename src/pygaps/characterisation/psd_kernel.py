@@ -4,6 +4,13 @@ kernel. Please note that calculation of DFT/NLDFT/QSDFT kernels is outside the
 scope of this program.
 """
 
+import collections
+import hashlib
+import io
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy
 import pandas
 from scipy import interpolate
@@ -16,6 +23,8 @@ from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.utilities.math_utilities import bspline
 from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
+from pygaps.utilities.python_utilities import cache_load
+from pygaps.utilities.python_utilities import cache_store
 
 _LOADED = {}  # We will keep loaded kernels here
 
@@ -27,6 +36,8 @@ def psd_dft(
     p_limits: "tuple[float, float]" = None,
     kernel_units: dict = None,
     bspline_order: int = 2,
+    solver: "str | callable" = 'nnls',
+    solver_params: dict = None,
     verbose: bool = False
 ):
     """
@@ -49,6 +60,11 @@ def psd_dft(
         A dictionary specifying kernel basis and units, contains ``loading_basis``,
         ``loading_unit``, ``material_basis``, ``material_unit``, ``pressure_mode``
         and "pressure_unit". Defaults to mmol/g vs. relative pressure.
+    solver : str or callable
+        The method used to fit the kernel, see
+        :func:`~pygaps.characterisation.psd_kernel.psd_dft_kernel_fit`.
+    solver_params : dict
+        Extra parameters passed to the solver.
     verbose : bool
         Prints out extra information on the calculation and graphs the results.
 
@@ -90,8 +106,9 @@ def psd_dft(
 
     Using the kernel, the isotherm obtained through experimental means can be
     modelled. The contributions of each kernel isotherm to the overall data is
-    determined through a minimisation function. The contributions and their
-    corresponding pore size form the pore size distribution of the material.
+    determined through a non-negative least squares fit, optionally regularised.
+    The contributions and their corresponding pore size form the pore size
+    distribution of the material.
 
     The program accepts kernel files in a CSV format with the following structure:
 
@@ -108,6 +125,13 @@ def psd_dft(
     have a range of pressures that is wide enough to cover possible experimental
     values.
 
+    A kernel file is only parsed once: it is kept in memory, and in binary
+    form in the pyGAPS cache folder (set by the ``PYGAPS_CACHE_DIR``
+    environment variable) until its contents change. The kernel loadings at
+    the pressure points of an isotherm are also kept, so that isotherms
+    measured on the same pressure points are fitted without interpolating
+    the kernel again.
+
     *Limitations*
 
     The accuracy of predicting pore size through DFT kernels is only as good as
@@ -195,6 +219,8 @@ def psd_dft(
         loading,
         kernel_path,
         bspline_order,
+        solver,
+        solver_params,
     )  # mmol/g
 
     if verbose:
@@ -230,11 +256,194 @@ def psd_dft(
     }
 
 
+def psd_dft_batch(
+    isotherms: "list[PointIsotherm | ModelIsotherm]",
+    kernel: str = 'DFT-N2-77K-carbon-slit',
+    branch: str = 'ads',
+    p_limits: "tuple[float, float]" = None,
+    kernel_units: dict = None,
+    bspline_order: int = 2,
+    regularization: float = 0,
+    n_jobs: int = None,
+):
+    r"""
+    Calculate the pore size distributions of many isotherms with a DFT kernel.
+
+    All isotherms are fitted on the same pressure points, those of the kernel
+    itself in the pressure range common to all isotherms, so that the
+    kernel is interpolated and its normal equations are formed only once.
+    The result is equivalent to calling
+    :func:`~pygaps.characterisation.psd_kernel.psd_dft` with the
+    ``active-set`` solver on each isotherm resampled on these points.
+
+    Parameters
+    ----------
+    isotherms : list of PointIsotherm or ModelIsotherm
+        The isotherms for which the pore size distributions will be calculated.
+    kernel : str
+        The name of the kernel, or the path where it can be found.
+    branch : {'ads', 'des'}, optional
+        Branch of the isotherms to use. It defaults to adsorption.
+    p_limits : [float, float]
+        Pressure range in which to calculate PSD, defaults to the
+        range common to all isotherms.
+    kernel_units : dict
+        A dictionary specifying kernel basis and units, contains ``loading_basis``,
+        ``loading_unit``, ``material_basis``, ``material_unit``, ``pressure_mode``
+        and "pressure_unit". Defaults to mmol/g vs. relative pressure.
+    bspline_order : int
+        The smoothing order of the b-splines fit to the data.
+        If set to 0, data will be returned as-is.
+    regularization : float
+        Tikhonov regularisation parameter, the same for all isotherms.
+        Defaults to no regularisation.
+    n_jobs : int, optional
+        Number of processes used to fit the isotherms. The default, None,
+        fits them in this process, -1 uses all processors.
+
+    Raises
+    ------
+    ParameterError
+        When something is wrong with the function parameters.
+    CalculationError
+        When the calculation itself fails.
+
+    Returns
+    -------
+    dict
+        A dictionary with the pore widths and the pore distributions, of the form:
+
+        - ``pore_widths`` (array) : the widths of the pores
+        - ``pore_distribution`` (array) : contribution of each pore width to the
+          overall pore distribution, with one row for each isotherm
+        - ``pore_volume_cumulative`` (array) : cumulative pore volume, with one
+          row for each isotherm
+        - ``kernel_loading`` (array) : the fitted loading, with one row for
+          each isotherm
+        - ``pressure`` (array) : the pressure points of the fit
+
+    Notes
+    -----
+    With a kernel matrix :math:`A` and the loadings of all isotherms as columns
+    of a matrix :math:`B`, the fit of each isotherm is a non-negative least
+    squares problem which only depends on :math:`A^T A` and on its column of
+    :math:`A^T B`. Both are computed at once for all isotherms, and each
+    problem is then solved on these small (pore widths by pore widths) normal
+    equations.
+
+    Isotherms should not need to be extrapolated to cover the common pressure
+    range, so the fit is only as wide as the narrowest isotherm. Isotherms of
+    very different ranges are better fitted separately.
+
+    See Also
+    --------
+    pygaps.characterisation.psd_kernel.psd_dft : pore size distribution of a single isotherm
+
+    """
+    # Check kernel
+    if kernel is None:
+        raise ParameterError(
+            "An existing kernel name or a path to a user kernel to be used must be specified."
+        )
+    isotherms = list(isotherms)
+    if not isotherms:
+        raise ParameterError("No isotherms were passed.")
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+
+    kernel_path = KERNELS.get(kernel, kernel)
+    kernel_obj = _load_kernel(kernel_path)
+
+    # Get units
+    if kernel_units is None:
+        kernel_units = {}
+
+    loading_units = {
+        "loading_basis": kernel_units.get('loading_basis', 'molar'),
+        "loading_unit": kernel_units.get('loading_unit', 'mmol'),
+        "material_basis": kernel_units.get('material_basis', 'mass'),
+        "material_unit": kernel_units.get('material_unit', 'g'),
+    }
+    pressure_units = {
+        "pressure_mode": kernel_units.get('pressure_mode', 'relative'),
+        "pressure_unit": kernel_units.get('pressure_unit', None),
+    }
+
+    # The fit uses the kernel points in the range common to all isotherms
+    minimum, maximum = 0, numpy.inf
+    for isotherm in isotherms:
+        iso_pressure = isotherm.pressure(branch=branch, **pressure_units)
+        if iso_pressure is None or len(iso_pressure) == 0:
+            raise ParameterError(f"An isotherm does not have a '{branch}' branch.")
+        minimum = max(minimum, numpy.min(iso_pressure))
+        maximum = min(maximum, numpy.max(iso_pressure))
+    if p_limits is not None:
+        if p_limits[0]:
+            minimum = max(minimum, p_limits[0])
+        if p_limits[1]:
+            maximum = min(maximum, p_limits[1])
+
+    pressure = kernel_obj.pressure[(kernel_obj.pressure >= minimum) &
+                                   (kernel_obj.pressure <= maximum)]
+    pressure = pressure[pressure > 0]
+    if len(pressure) < 3:
+        raise CalculationError(
+            "The isotherms do not have a common pressure range covering "
+            "enough kernel points (at least 3)."
+        )
+
+    # Resample each isotherm on the common points
+    loading = numpy.empty((len(isotherms), len(pressure)))
+    for index, isotherm in enumerate(isotherms):
+        loading[index] = isotherm.loading_at(
+            pressure, branch=branch, **pressure_units, **loading_units
+        )
+    if not numpy.all(numpy.isfinite(loading)):
+        raise CalculationError("Could not get the loading of all isotherms at the kernel points.")
+
+    # The normal equations of all isotherms share the kernel product
+    kernel_matrix = kernel_obj.matrix(pressure)
+    gram = kernel_matrix.T @ kernel_matrix
+    if regularization:
+        gram = gram + regularization**2 * numpy.eye(len(gram))
+    projections = loading @ kernel_matrix
+
+    if n_jobs is None or n_jobs <= 1:
+        contributions = _nnls_normal_many(gram, projections)
+    else:
+        chunks = numpy.array_split(projections, min(n_jobs, len(projections)))
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            contributions = numpy.concatenate(
+                list(executor.map(_nnls_normal_many, [gram] * len(chunks), chunks))
+            )
+
+    # convert from preponderance to distribution
+    pore_widths = kernel_obj.pore_widths
+    kernel_final_loading = contributions @ kernel_matrix.T
+    pore_dist = contributions / numpy.ediff1d(pore_widths, to_begin=pore_widths[0])
+    if bspline_order:
+        smoothed = [bspline(pore_widths, dist, degree=bspline_order) for dist in pore_dist]
+        pore_widths = smoothed[0][0]
+        pore_dist = numpy.array([dist for _, dist in smoothed])
+    dpore_widths = numpy.ediff1d(pore_widths, to_begin=pore_widths[0])
+    pore_vol_cum = numpy.cumsum(pore_dist * dpore_widths, axis=1)
+
+    return {
+        'pore_widths': pore_widths,
+        'pore_distribution': pore_dist,
+        'pore_volume_cumulative': pore_vol_cum,
+        'kernel_loading': kernel_final_loading,
+        'pressure': pressure,
+    }
+
+
 def psd_dft_kernel_fit(
     pressure: "list[float]",
     loading: "list[float]",
     kernel_path: str,
     bspline_order: int = 2,
+    solver: "str | callable" = 'nnls',
+    solver_params: dict = None,
 ):
     r"""
     Fit a DFT kernel on experimental adsorption data.
@@ -250,6 +459,20 @@ def psd_dft_kernel_fit(
     bspline_order : int
         The smoothing order of the b-splines fit to the data.
         If set to 0, data will be returned as-is.
+    solver : str or callable
+        The method used to fit the kernel contributions, one of:
+
+        - ``nnls`` : non-negative least squares with `scipy.optimize.nnls` (default)
+        - ``active-set`` : active-set non-negative least squares on the normal
+          equations of the kernel
+        - ``tikhonov`` : non-negative least squares with Tikhonov regularisation,
+          with the ``regularization`` parameter, or chosen from the L-curve
+        - ``slsqp`` : minimisation of the sum of squares with `scipy.optimize.minimize`
+
+        A function can also be passed, which takes the kernel matrix (pressure points
+        by pore widths) and the loading, and returns the contributions.
+    solver_params : dict
+        Extra parameters passed to the solver.
 
     Returns
     -------
@@ -263,16 +486,23 @@ def psd_dft_kernel_fit(
     Notes
     -----
     The function will take the data in the form of pressure and loading. It will
-    then load the kernel either from disk or from memory and define a minimsation
-    function as the sum of squared differences of the sum of all individual kernel
-    isotherm loadings multiplied by their contribution as per the following function:
+    then load the kernel either from disk or from memory, and find the
+    contribution of each kernel isotherm which minimises the sum of squared
+    differences to the experimental loading:
 
     .. math::
 
         f(x) = \sum_{p=p_0}^{p=p_x} (n_{p,exp} - \sum_{w=w_0}^{w=w_y} n_{p, kernel} X_w )^2
 
-    The function is then minimised using the `scipy.optimise.minimise` module, with the
-    constraint that the contribution of each kernel isotherm cannot be negative.
+    with the constraint that the contribution of each kernel isotherm cannot be
+    negative. This is a linear non-negative least squares problem on the kernel
+    matrix, which is solved directly rather than by a general minimisation.
+
+    As the kernel isotherms are similar, the solution can be sensitive to noise
+    in the data. Tikhonov regularisation adds a penalty :math:`\lambda^2 \sum X_w^2`
+    to the function, which leads to a smoother distribution. If not given,
+    :math:`\lambda` is chosen at the corner of the L-curve, where the solution
+    size stops decreasing faster than the residual increases.
 
     """
     # Check lengths
@@ -281,57 +511,37 @@ def psd_dft_kernel_fit(
     if len(pressure) != len(loading):
         raise ParameterError("The length of the pressure and loading arrays do not match.")
 
+    # Check solver
+    if not callable(solver):
+        if solver not in _DFT_SOLVERS:
+            raise ParameterError(
+                f"Solver '{solver}' not an option for DFT fitting. "
+                f"Select one of {list(_DFT_SOLVERS)}, or pass a function."
+            )
+        solver = _DFT_SOLVERS[solver]
+    if solver_params is None:
+        solver_params = {}
+
     # get the interpolation kernel
     kernel = _load_kernel(kernel_path)
 
-    # generate the numpy arrays
+    # generate the kernel loadings at the isotherm points
     try:
-        kernel_points = numpy.asarray([kernel[size](pressure) for size in kernel])
+        kernel_matrix = kernel.matrix(pressure)
     except ValueError as err:
         raise CalculationError(
             "Could not get kernel values at isotherm points. "
             "Does your kernel pressure range apply to this isotherm?"
         ) from err
-    pore_widths = numpy.asarray(list(kernel.keys()), dtype='float64')
-
-    # define the minimization function
-    def kernel_loading(pore_dist):
-        return numpy.multiply(
-            kernel_points,
-            pore_dist[:, numpy.newaxis]  # -> multiply each loading with its contribution
-        ).sum(axis=0)  # -> add the contributions together at each pressure
-
-    def sum_squares(pore_dist):
-        return numpy.square(  # -> square the difference
-            numpy.subtract(  # -> between calculated and isotherm
-                kernel_loading(pore_dist),
-                loading)).sum(axis=0)  # -> then sum the squares together
-
-    # define the constraints (x>0)
-    cons = [{
-        'type': 'ineq',
-        'fun': lambda x: x,
-    }]
-
-    # # run the optimisation algorithm
-    guess = numpy.array([0 for pore in pore_widths])
-    bounds = [(0, None) for pore in pore_widths]
-    result = optimize.minimize(
-        sum_squares,
-        guess,
-        method='SLSQP',
-        bounds=bounds,
-        constraints=cons,
-        options={'ftol': 1e-04}
-    )
+    pore_widths = kernel.pore_widths
 
-    if not result.success:
-        raise CalculationError(f"Minimization of DFT failed with error: {result.message}")
+    # fit the contributions of each kernel isotherm
+    contributions = solver(kernel_matrix, numpy.asarray(loading, dtype='float64'), **solver_params)
 
     # convert from preponderance to distribution
     # TODO double check variable naming
-    kernel_final_loading = kernel_loading(result.x)
-    pore_dist = result.x / numpy.ediff1d(pore_widths, to_begin=pore_widths[0])
+    kernel_final_loading = kernel_matrix @ contributions
+    pore_dist = contributions / numpy.ediff1d(pore_widths, to_begin=pore_widths[0])
     pore_widths, pore_dist = bspline(pore_widths, pore_dist, degree=bspline_order)
     dpore_widths = numpy.ediff1d(pore_widths, to_begin=pore_widths[0])
     pore_vol_cum = numpy.cumsum(pore_dist * dpore_widths)
@@ -339,14 +549,185 @@ def psd_dft_kernel_fit(
     return pore_widths, pore_dist, pore_vol_cum, kernel_final_loading
 
 
+def _solve_nnls(matrix, loading, max_iter=None):
+    """Non-negative least squares with `scipy.optimize.nnls`."""
+    try:
+        contributions, _ = optimize.nnls(matrix, loading, maxiter=max_iter)
+    except RuntimeError as err:
+        raise CalculationError(f"Fitting of DFT kernel failed with error: {err}") from err
+    return contributions
+
+
+def _solve_active_set(matrix, loading, tolerance=None, max_iter=None):
+    """
+    Active-set non-negative least squares on the normal equations, after
+    Lawson-Hanson as modified by Bro and De Jong. The kernel matrix is only
+    used through its (pore widths by pore widths) product with itself, which
+    is small and fast to solve for many pore widths in the passive set.
+    """
+    gram = matrix.T @ matrix
+    projection = matrix.T @ loading
+    return _nnls_normal(gram, projection, tolerance, max_iter)
+
+
+def _nnls_normal(gram, projection, tolerance=None, max_iter=None):
+    """Solve a non-negative least squares problem given its normal equations."""
+    size = len(projection)
+    if tolerance is None:
+        tolerance = 10 * numpy.finfo(float).eps * numpy.abs(gram).sum(axis=0).max() * size
+    if max_iter is None:
+        max_iter = 3 * size
+
+    def solve_passive(passive):
+        solution = numpy.zeros(size)
+        try:
+            solution[passive] = numpy.linalg.solve(gram[numpy.ix_(passive, passive)], projection[passive])
+        except numpy.linalg.LinAlgError:
+            solution[passive] = numpy.linalg.lstsq(
+                gram[numpy.ix_(passive, passive)], projection[passive], rcond=None
+            )[0]
+        return solution
+
+    passive = numpy.zeros(size, dtype=bool)
+    contributions = numpy.zeros(size)
+    gradient = projection.copy()
+    iterations = 0
+
+    # move the variable with the steepest descent to the passive set
+    while not passive.all() and numpy.max(gradient[~passive]) > tolerance:
+        passive[numpy.argmax(numpy.where(passive, -numpy.inf, gradient))] = True
+        solution = solve_passive(passive)
+
+        # step back towards the feasible region until all are positive
+        while numpy.min(solution[passive]) <= 0:
+            iterations += 1
+            if iterations > max_iter:
+                raise CalculationError(
+                    "Fitting of DFT kernel failed to converge in the maximum number of iterations."
+                )
+            negative = passive & (solution <= 0)
+            alpha = numpy.min(contributions[negative] / (contributions[negative] - solution[negative]))
+            contributions += alpha * (solution - contributions)
+            passive &= contributions > tolerance
+            solution = solve_passive(passive)
+
+        contributions = solution
+        gradient = projection - gram @ contributions
+
+    return contributions
+
+
+def _nnls_normal_many(gram, projections):
+    """Solve the normal equations with one right-hand side per row."""
+    return numpy.array([_nnls_normal(gram, projection) for projection in projections])
+
+
+def _solve_tikhonov(matrix, loading, regularization=None, n_regularization=25):
+    """
+    Non-negative least squares with Tikhonov regularisation, solved on the
+    normal equations. The regularisation parameter is chosen from the
+    L-curve if not given.
+    """
+    gram = matrix.T @ matrix
+    projection = matrix.T @ loading
+    identity = numpy.eye(len(projection))
+
+    def solve(regularization):
+        return _nnls_normal(gram + regularization**2 * identity, projection)
+
+    if regularization is None:
+        # the corner of the L-curve has the largest curvature in log-log space
+        scale = numpy.linalg.norm(matrix, 2)
+        regularizations = numpy.logspace(-6, 0, n_regularization) * scale
+        solutions = [solve(reg) for reg in regularizations]
+        residual = numpy.log([numpy.linalg.norm(matrix @ sol - loading) for sol in solutions])
+        norm = numpy.log([numpy.linalg.norm(sol) for sol in solutions])
+        d_res, d_norm = numpy.gradient(residual), numpy.gradient(norm)
+        dd_res, dd_norm = numpy.gradient(d_res), numpy.gradient(d_norm)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            curvature = (d_res * dd_norm - dd_res * d_norm) / (d_res**2 + d_norm**2)**1.5
+        return solutions[numpy.nanargmax(curvature)]
+
+    return solve(regularization)
+
+
+def _solve_slsqp(matrix, loading, ftol=1e-04):
+    """Minimise the sum of squares with SLSQP, with an analytic gradient."""
+
+    def sum_squares(contributions):
+        return numpy.sum(numpy.square(matrix @ contributions - loading))
+
+    def sum_squares_gradient(contributions):
+        return 2 * matrix.T @ (matrix @ contributions - loading)
+
+    result = optimize.minimize(
+        sum_squares,
+        numpy.zeros(matrix.shape[1]),
+        jac=sum_squares_gradient,
+        method='SLSQP',
+        bounds=[(0, None)] * matrix.shape[1],
+        options={'ftol': ftol},
+    )
+    if not result.success:
+        raise CalculationError(f"Minimization of DFT failed with error: {result.message}")
+    return result.x
+
+
+_DFT_SOLVERS = {
+    'nnls': _solve_nnls,
+    'active-set': _solve_active_set,
+    'tikhonov': _solve_tikhonov,
+    'slsqp': _solve_slsqp,
+}
+
+
+class _Kernel():
+    """
+    A DFT kernel, as a table of the loading of each pore width against
+    pressure, with a cubic spline through all the isotherms at once.
+
+    The kernel loadings at the pressure points of an isotherm are kept,
+    so isotherms measured at the same points reuse them.
+    """
+
+    #: Number of pressure grids for which the kernel loadings are kept.
+    matrix_cache_size = 32
+
+    def __init__(self, pressure, pore_widths, loading):
+        self.pressure = pressure
+        self.pore_widths = pore_widths
+        self.loading = loading
+        self._spline = interpolate.interp1d(pressure, loading, kind='cubic', axis=0)
+        self._matrices = collections.OrderedDict()
+
+    def matrix(self, pressure):
+        """
+        Return the kernel loadings at pressure points, as a read-only
+        array of pressure points by pore widths.
+        """
+        pressure = numpy.ascontiguousarray(pressure, dtype='float64')
+        key = hashlib.sha1(pressure.tobytes()).digest()
+        if key in self._matrices:
+            self._matrices.move_to_end(key)
+            return self._matrices[key]
+
+        matrix = self._spline(pressure)
+        matrix.setflags(write=False)
+        self._matrices[key] = matrix
+        while len(self._matrices) > self.matrix_cache_size:
+            self._matrices.popitem(last=False)
+        return matrix
+
+
 def _load_kernel(path: str):
     """
     Load a kernel from disk or from memory.
 
     Essentially takes a kernel stored as a pressure-loading
-    table, creates an interpolator for each
-    isotherm, then stores them as a dictionary of
-    pore-size keys to interpolator values.
+    table and creates an interpolator for all the
+    isotherms in it. The parsed table is also stored
+    in the pyGAPS cache folder, so that the CSV file is
+    only parsed again if its contents change.
 
     Parameters
     ----------
@@ -355,32 +736,39 @@ def _load_kernel(path: str):
 
     Returns
     -------
-    dict
-        The kernel with its pore size components as keys.
+    _Kernel
+        The kernel, with its pore widths and interpolator.
     """
     if path in _LOADED:
         return _LOADED[path]
 
-    with open(path, encoding="utf8") as fp:
-        raw_kernel = pandas.read_csv(fp, index_col=0)
-
-    # add a 0 in the dataframe for interpolation between lowest values
-    raw_kernel = pandas.concat([
-        pandas.DataFrame(
-            [[0 for col in raw_kernel.columns]],
-            index=[0],
-            columns=raw_kernel.columns,
-        ),
-        raw_kernel,
-    ])
-
-    kernel = {}
-    for pore_size in raw_kernel:
-        interpolator = interpolate.interp1d(
-            raw_kernel[pore_size].index, raw_kernel[pore_size].values, kind='cubic'
+    with open(path, 'rb') as fp:
+        content = fp.read()
+    name = f"kernel-{pathlib.Path(str(path)).stem}-{hashlib.sha1(content).hexdigest()[:16]}"
+
+    stored = cache_load(name)
+    if stored is not None and {'pressure', 'pore_widths', 'loading'} <= stored.keys():
+        kernel = _Kernel(stored['pressure'], stored['pore_widths'], stored['loading'])
+
+    else:
+        raw_kernel = pandas.read_csv(io.StringIO(content.decode('utf8')), index_col=0)
+
+        # add a 0 in the dataframe for interpolation between lowest values
+        raw_kernel = pandas.concat([
+            pandas.DataFrame(
+                [[0 for col in raw_kernel.columns]],
+                index=[0],
+                columns=raw_kernel.columns,
+            ),
+            raw_kernel,
+        ])
+
+        kernel = _Kernel(
+            raw_kernel.index.to_numpy(dtype='float64'),
+            raw_kernel.columns.to_numpy(dtype='float64'),
+            raw_kernel.to_numpy(dtype='float64'),
         )
-
-        kernel.update({pore_size: interpolator})
+        cache_store(name, pressure=kernel.pressure, pore_widths=kernel.pore_widths, loading=kernel.loading)
 
     # Save the kernel in memory
     _LOADED[path] = kernel
@@ -3,8 +3,6 @@ This module contains 'classical' methods of calculating a pore size distribution
 pores in the micropore range (<2 nm). These are derived from the Horvath-Kawazoe models.
 """
 
-import math
-
 import numpy
 from scipy import constants
 from scipy import optimize
@@ -540,23 +538,19 @@ def psd_horvath_kawazoe(
             (n_ads * a_ads + n_mat * a_mat) / (d_eff * 1e-9)**4  # d_eff must be in SI
 
         # to avoid unnecessary recalculations, we cache a_k and b_k values
-        a_ks, b_ks = [1], [1]
-        for k in range(1, 2000):
-            a_ks.append(((-4.5 - k) / k)**2 * a_ks[k - 1])
-            b_ks.append(((-1.5 - k) / k)**2 * b_ks[k - 1])
+        a_ks, b_ks = _k_coefficients(2000)
 
         def potential(l_pore):
 
-            d_over_r = d_eff / l_pore  # dimensionless
+            d_over_r = (d_eff / l_pore)[:, None]  # dimensionless
             d_over_r_p4 = d_over_r**4  # d/L ^ 4
             d_over_r_p10_k = 0.65625 * d_over_r**10  # 21/32 * d/L ^ 4
 
-            k_sum = d_over_r_p10_k - d_over_r_p4  # first value at K=0
-
             # 25 * pore radius ensures that layer convergence is achieved
-            for k in range(1, int(l_pore * 25)):
-                k_sum = k_sum + ((1 / (k + 1) * (1 - d_over_r)**(2 * k)) *
-                                 (a_ks[k] * d_over_r_p10_k - b_ks[k] * d_over_r_p4))
+            ks = numpy.arange(int(numpy.max(l_pore) * 25))
+            terms = ((1 / (ks + 1) * (1 - d_over_r)**(2 * ks)) *
+                     (a_ks[ks] * d_over_r_p10_k - b_ks[ks] * d_over_r_p4))
+            k_sum = numpy.sum(terms, axis=1, where=ks < (l_pore * 25).astype(int)[:, None])
 
             return const_coeff * k_sum
 
@@ -906,10 +900,11 @@ def psd_horvath_kawazoe_ry(
 
         def potential(l_pore):
             n_layer = (l_pore - d_mat) / d_ads
-            if n_layer < 2:
-                return N_over_RT * potential_twosurface(l_pore)
-            else:
-                return N_over_RT * potential_average(n_layer)
+            return N_over_RT * numpy.where(
+                n_layer < 2,
+                potential_twosurface(l_pore),
+                potential_average(n_layer),
+            )
 
         if use_cy:
             pore_widths = _solve_hk_cy(pressure, loading, potential, 2 * d_eff, 1)
@@ -925,64 +920,52 @@ def psd_horvath_kawazoe_ry(
         max_k = 25  # Maximum K summed
         cached_k = 2000  # Maximum K's cached
         # to avoid unnecessary recalculations, we cache a_k and b_k values
-        a_ks, b_ks = [1], [1]
-        for k in range(1, cached_k):
-            a_ks.append(((-4.5 - k) / k)**2 * a_ks[k - 1])
-            b_ks.append(((-1.5 - k) / k)**2 * b_ks[k - 1])
-
-        def a_k_sum(r2, max_k_pore):
-            k_sum_t = 1
-            for k in range(1, max_k_pore):
-                k_sum_t = k_sum_t + (a_ks[k] * r2**(2 * k))
-            return k_sum_t
-
-        def b_k_sum(r2, max_k_pore):
-            k_sum_t = 1
-            for k in range(1, max_k_pore):
-                k_sum_t = k_sum_t + (b_ks[k] * r2**(2 * k))
-            return k_sum_t
+        a_ks, b_ks = _k_coefficients(cached_k)
+
+        def k_sum(k_coefficients, r2, max_k_pore):
+            ks = numpy.arange(numpy.max(max_k_pore))
+            terms = k_coefficients[ks] * r2[:, None]**(2 * ks)
+            return numpy.sum(terms, axis=1, where=ks < max_k_pore[:, None])
 
         def potential_general(l_pore, d_x, n_x, a_x, r1):
             # determine maximum summation as a function of pore length
-            max_k_pore = int(l_pore * max_k)
-            max_k_pore = max_k_pore if max_k_pore < 2000 else 2000
+            max_k_pore = numpy.minimum((l_pore * max_k).astype(int), cached_k)
             # the b constant is 1-a
             r2 = 1 - r1
             # 0.65625 is (21 / 32), constant
             return (
-                0.75 * constants.pi * n_x * a_x / ((d_x * 1e-9)**4) *
-                (0.65625 * r1**10 * a_k_sum(r2, max_k_pore) - r1**4 * b_k_sum(r2, max_k_pore))
+                0.75 * constants.pi * n_x * a_x / ((d_x * 1e-9)**4) * (
+                    0.65625 * r1**10 * k_sum(a_ks, r2, max_k_pore) -
+                    r1**4 * k_sum(b_ks, r2, max_k_pore)
+                )
             )
 
         def potential(l_pore):
-            n_layers = int(((2 * l_pore - d_mat) / d_ads - 1) / 2) + 1
-            layer_populations = []
-            layer_potentials = []
+            n_layers = (((2 * l_pore - d_mat) / d_ads - 1) / 2).astype(int) + 1
+            populations = numpy.zeros_like(l_pore)
+            potentials = numpy.zeros_like(l_pore)
 
-            for layer in range(1, n_layers + 1):
-                width = 2 * (l_pore - d_eff - (layer - 1) * d_ads)
-                if d_ads <= width:
-                    layer_population = constants.pi / math.asin(d_ads / width)
-                else:
-                    layer_population = 1
+            # each layer is only calculated for the pores which contain it
+            for layer in range(1, numpy.max(n_layers) + 1):
+                inside = layer <= n_layers
+                l_layer = l_pore[inside]
+
+                width = 2 * (l_layer - d_eff - (layer - 1) * d_ads)
+                layer_population = numpy.ones_like(l_layer)
+                wide = d_ads <= width
+                layer_population[wide] = constants.pi / numpy.arcsin(d_ads / width[wide])
 
                 if layer == 1:  # potential with surface (first layer)
-                    r1 = d_eff / l_pore
-                    layer_potential = potential_general(l_pore, d_eff, n_mat, a_mat, r1)
+                    r1 = d_eff / l_layer
+                    layer_potential = potential_general(l_layer, d_eff, n_mat, a_mat, r1)
                 else:  # inter-adsorbate potential (subsequent layers)
-                    r1 = d_ads / (l_pore - d_eff - (layer - 2) * d_ads)
-                    layer_potential = potential_general(l_pore, d_ads, n_ads, a_ads, r1)
+                    r1 = d_ads / (l_layer - d_eff - (layer - 2) * d_ads)
+                    layer_potential = potential_general(l_layer, d_ads, n_ads, a_ads, r1)
 
-                layer_populations.append(layer_population)
-                layer_potentials.append(layer_potential)
+                populations[inside] += layer_population
+                potentials[inside] += layer_population * layer_potential
 
-            layer_populations = numpy.asarray(layer_populations)
-            layer_potentials = numpy.asarray(layer_potentials)
-
-            return (
-                N_over_RT * numpy.sum(layer_populations * layer_potentials) /
-                numpy.sum(layer_populations)
-            )
+            return N_over_RT * potentials / populations
 
         if use_cy:
             pore_widths = _solve_hk_cy(pressure, loading, potential, d_eff, 1)
@@ -1006,35 +989,30 @@ def psd_horvath_kawazoe_ry(
                                   (r1**12 / (10 * r2) * ((1 - r2)**(-10) - (1 + r2)**(-10))))
             )
 
+        def layer_population(l_pore, layer):
+            return 4 * constants.pi * ((l_pore - d_eff - (layer - 1) * d_ads) * 1e-9)**2 * n_ads
+
         def potential(l_pore):
-            n_layers = int(((2 * l_pore - d_mat) / d_ads - 1) / 2) + 1
-            layer_populations = []
-            layer_potentials = []
+            n_layers = (((2 * l_pore - d_mat) / d_ads - 1) / 2).astype(int) + 1
 
-            # potential with surface (first layer)
-            layer_population = 4 * constants.pi * (l_pore * 1e-9)**2 * n_mat
+            # potential with surface (first layer), E1
             r1 = d_eff / l_pore
-            layer_potential = potential_general(layer_population, p_12, r1)
-            layer_potentials.append(layer_potential)  # add E1
-
-            # inter-adsorbate potential (subsequent layers)
-            layer_populations = [
-                (4 * constants.pi * ((l_pore - d_eff - (layer - 1) * d_ads) * 1e-9)**2 * n_ads)
-                for layer in range(1, n_layers + 1)
-            ]  # [N1...Nm]
-
-            for layer, layer_population in zip(range(2, n_layers + 1), layer_populations):
-                r1 = d_ads / (l_pore - d_eff - (layer - 2) * d_ads)
-                layer_potential = potential_general(layer_population, p_22, r1)
-                layer_potentials.append(layer_potential)  # add [E2...Em]
-
-            layer_populations = numpy.asarray(layer_populations)
-            layer_potentials = numpy.asarray(layer_potentials)
+            surface_population = 4 * constants.pi * (l_pore * 1e-9)**2 * n_mat
+            populations = layer_population(l_pore, 1)  # N1
+            potentials = populations * potential_general(surface_population, p_12, r1)
+
+            # inter-adsorbate potential (subsequent layers), [E2...Em]
+            # each layer is only calculated for the pores which contain it
+            for layer in range(2, numpy.max(n_layers) + 1):
+                inside = layer <= n_layers
+                l_layer = l_pore[inside]
+                r1 = d_ads / (l_layer - d_eff - (layer - 2) * d_ads)
+                populations[inside] += layer_population(l_layer, layer)  # [N2...Nm]
+                potentials[inside] += layer_population(l_layer, layer) * potential_general(
+                    layer_population(l_layer, layer - 1), p_22, r1
+                )
 
-            return (
-                N_over_RT * numpy.sum(layer_populations * layer_potentials) /
-                numpy.sum(layer_populations)
-            )
+            return N_over_RT * potentials / populations
 
         if use_cy:
             pore_widths = _solve_hk_cy(pressure, loading, potential, d_eff, 1)
@@ -1063,30 +1041,11 @@ def psd_horvath_kawazoe_ry(
 
 def _solve_hk(pressure, hk_fun, bound, geo):
     """
-    I personally found that simple Brent minimization
-    gives good results. There may be other, more efficient
-    algorithms, like conjugate gradient, but optimization is a moot point
-    as long as average total runtime is short.
-    The minimisation runs with bounds of [d_eff < x < 50].
-    Maximum determinable pore size is limited at ~2.5 nm anyway.
+    Find the pore sizes where the potential function is equal to the
+    logarithm of each pressure point.
     """
-
-    p_w = []
-    p_w_max = 10 / geo
-
-    for p_point in pressure:
-
-        def fun(l_pore):
-            return (numpy.exp(hk_fun(l_pore)) - p_point)**2
-
-        res = optimize.minimize_scalar(fun, method='bounded', bounds=(bound, 50))
-        p_w.append(res.x)
-
-        # we will stop if reaching unrealistic pore sizes
-        if res.x > p_w_max:
-            break
-
-    return p_w
+    with numpy.errstate(divide='ignore'):
+        return _invert_hk(numpy.log(pressure), hk_fun, bound, geo)
 
 
 def _solve_hk_cy(pressure, loading, hk_fun, bound, geo):
@@ -1094,28 +1053,85 @@ def _solve_hk_cy(pressure, loading, hk_fun, bound, geo):
     In this case, the SF correction factor is subtracted
     from the original function.
     """
-
-    p_w = []
-    p_w_max = 10 / geo
+    pressure = numpy.asarray(pressure)
     coverage = loading / (max(loading) * 1.01)
 
-    for p_point, c_point in zip(pressure, coverage):
+    with numpy.errstate(divide='ignore'):
+        sf_corr = 1 + 1 / coverage * numpy.log(1 - coverage)
+        return _invert_hk(numpy.log(pressure) + sf_corr, hk_fun, bound, geo)
 
-        sf_corr = 1 + 1 / c_point * numpy.log(1 - c_point)
+
+def _invert_hk(target, hk_fun, bound, geo, points=256, max_iter=50):
+    """
+    Invert the potential function for all points at once.
+
+    The potential decreases to a minimum just above its lower bound, then
+    increases monotonically. It is tabulated once on this increasing
+    branch, up to the largest realistic pore size, and each point is
+    located in the table by a binary search. The pore sizes are then
+    refined with Newton steps, using the slope of the table interval,
+    safeguarded by bisection.
+    Points below the minimum of the potential are assigned the pore
+    size at the minimum.
+
+    As the pressure points increase, we stop after the first pore size
+    larger than the table. It is found by a bounded minimisation in
+    the range [d_eff < x < 50].
+    """
+    target = numpy.atleast_1d(target)
+    p_w_max = 10 / geo
+
+    # nodes are spaced geometrically away from the lower bound
+    nodes = bound + numpy.geomspace(1e-6, 1, points) * (p_w_max - bound)
+    values = hk_fun(nodes)
+    start = numpy.nanargmin(values)
+    nodes, values = nodes[start:], numpy.maximum.accumulate(values[start:])
+
+    # we will stop if reaching unrealistic pore sizes
+    beyond = numpy.flatnonzero(~(target <= values[-1]))
+    inside = target[:beyond[0]] if len(beyond) else target
+
+    index = numpy.clip(numpy.searchsorted(values, inside), 1, len(nodes) - 1)
+    low, high = nodes[index - 1], nodes[index]
+    slope = (values[index] - values[index - 1]) / (high - low)
+    slope[slope == 0] = numpy.inf
+
+    # points below the minimum keep the lower node
+    active = inside > values[0]
+    p_w = numpy.where(active, low + (inside - values[index - 1]) / slope, low)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        residual = hk_fun(p_w[active]) - inside[active]
+        # the potential has discontinuities as the number of terms changes,
+        # so the root is kept bracketed, bisecting when a step leaves it
+        low[active] = numpy.where(residual < 0, p_w[active], low[active])
+        high[active] = numpy.where(residual > 0, p_w[active], high[active])
+        step = residual / slope[active]
+        p_w[active] -= step
+        outside = (p_w < low) | (p_w > high)
+        p_w[outside] = (low[outside] + high[outside]) / 2
+        active[active] = (numpy.abs(step) >= 1e-10) & (high[active] - low[active] >= 1e-10)
+
+    if len(beyond):
 
         def fun(l_pore):
-            return (numpy.exp(hk_fun(l_pore) - sf_corr) - p_point)**2
+            return (numpy.exp(hk_fun(numpy.array([l_pore]))[0]) - numpy.exp(target[beyond[0]]))**2
 
         res = optimize.minimize_scalar(fun, method='bounded', bounds=(bound, 50))
-        p_w.append(res.x)
-
-        # we will stop if reaching unrealistic pore sizes
-        if res.x > p_w_max:
-            break
+        p_w = numpy.append(p_w, res.x)
 
     return p_w
 
 
+def _k_coefficients(n_k):
+    """Return the first n_k alpha_k and beta_k coefficients of the cylinder series."""
+    ks = numpy.arange(1, n_k)
+    a_ks = numpy.cumprod(numpy.concatenate([[1], ((-4.5 - ks) / ks)**2]))
+    b_ks = numpy.cumprod(numpy.concatenate([[1], ((-1.5 - ks) / ks)**2]))
+    return a_ks, b_ks
+
+
 def _dispersion_from_dict(ads_dict, mat_dict):
 
     p_ads = ads_dict['polarizability'] * 1e-27  # to m3
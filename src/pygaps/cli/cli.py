@@ -19,7 +19,8 @@ def main():
       for the BET area for example)
     * attempt to model the isotherm using a requested model or guess the best
       fitting model (``-md/--model guess``) and save the resulting isotherm
-      model using the ``-o/--outfile`` path.
+      model using the ``-o/--outfile`` path. Models can be guessed in parallel
+      (``-w/--workers 4``) and stop at a target RMSE (``--rmse-cutoff 0.01``).
     * convert the isotherm to any unit/basis
       (``-cv/--convert pressure_mode=absolute,pressure_unit=bar``) and save the
       resulting isotherm model using the ``-o/--outfile`` path.
@@ -55,6 +56,17 @@ def main():
         choices=['guess', 'henry', 'langmuir', 'dslangmuir', 'bet'],
         help='model an isotherm, saved as the file specified at \'-o\'',
     )
+    prs.add_argument(
+        '-w',
+        '--workers',
+        type=int,
+        help='number of processes used when guessing a model',
+    )
+    prs.add_argument(
+        '--rmse-cutoff',
+        type=float,
+        help='stop guessing models once one fits with a lower RMSE',
+    )
     prs.add_argument(
         '-cv',
         '--convert',
@@ -124,7 +136,13 @@ def main():
     elif args.model:
         import pygaps.modelling as pgm
         plot = args.verbose
-        out_iso = pgm.model_iso(iso, model=args.model, verbose=args.verbose)
+        out_iso = pgm.model_iso(
+            iso,
+            model=args.model,
+            workers=args.workers,
+            rmse_cutoff=args.rmse_cutoff,
+            verbose=args.verbose,
+        )
 
     # convert an isotherm to a different basis/unit
     elif args.convert:
@@ -1,10 +1,14 @@
 """Contains the adsorbate class."""
 
+import numpy
+
 from pygaps import logger
 from pygaps.data import ADSORBATE_LIST
 from pygaps.units.converter_unit import _PRESSURE_UNITS
 from pygaps.units.converter_unit import c_unit
 from pygaps.utilities.coolprop_utilities import CP
+from pygaps.utilities.coolprop_utilities import PropertyCache
+from pygaps.utilities.coolprop_utilities import SaturationTable
 from pygaps.utilities.coolprop_utilities import thermodynamic_backend
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
@@ -95,6 +99,14 @@ class Adsorbate():
 
         adsorbate.backend.p_critical()
 
+    Properties on the saturation curve can instead be interpolated from tables,
+    which are built once from the thermodynamic backend and stored on disk,
+    by setting ``fast_thermo``, either on a single adsorbate or on the class.
+    The largest interpolation errors are found in the table ``errors``::
+
+        adsorbate.fast_thermo = True
+        adsorbate.saturation_table().errors
+
     """
     # special reserved parameters
     _reserved_params = [
@@ -102,8 +114,13 @@ class Adsorbate():
         "alias",
         "_state",
         "_backend_mode",
+        "_cache",
+        "_tables",
     ]
 
+    #: Whether to interpolate saturation properties from stored tables.
+    fast_thermo = False
+
     def __init__(
         self,
         name: str,
@@ -137,6 +154,8 @@ class Adsorbate():
         # CoolProp interaction variables, only generate when called
         self._state = None
         self._backend_mode = None
+        self._cache = PropertyCache()
+        self._tables = {}
 
         # Store reference in internal list
         if store:
@@ -169,6 +188,21 @@ class Adsorbate():
         """Overload rev addition operator to use name."""
         return other + self.name
 
+    def __getstate__(self):
+        """Pickle without the CoolProp state, which is regenerated when called."""
+        state = self.__dict__.copy()
+        state['_state'] = None
+        state['_backend_mode'] = None
+        state.pop('_cache', None)
+        state.pop('_tables', None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore from pickle, with an empty property cache."""
+        self.__dict__.update(state)
+        self._cache = PropertyCache()
+        self._tables = {}
+
     def print_info(self):
         """Print a short summary of all the adsorbate parameters."""
         string = f"pyGAPS Adsorbate: '{self.name}'\n"
@@ -206,14 +240,14 @@ class Adsorbate():
         if not isinstance(name, str):
             raise ParameterError("Pass a string as an adsorbate name.")
 
-        # See if adsorbate exists in master list
-        try:
-            return next(ads for ads in ADSORBATE_LIST if ads == name)
-        except StopIteration:
+        # See if adsorbate exists in master list, indexed by alias
+        adsorbate = ADSORBATE_LIST.get(name)
+        if adsorbate is None:
             raise ParameterError(
                 f"Adsorbate '{name}' does not exist in list of adsorbates. "
                 "First populate pygaps.ADSORBATE_LIST with required adsorbate class."
-            ) from None
+            )
+        return adsorbate
 
     @property
     def backend(self):
@@ -224,6 +258,64 @@ class Adsorbate():
 
         return self._state
 
+    def _saturated(self, quality: float, temp: float = None, press: float = None):
+        """Return the backend state on the saturation curve."""
+        state = self.backend
+        if temp is not None:
+            state.update(CP.QT_INPUTS, quality, temp)
+        else:
+            state.update(CP.PQ_INPUTS, press, quality)
+        return state
+
+    def saturation_table(self):
+        """
+        Return the saturation curve tables of the adsorbate for the current
+        thermodynamic backend, or None if they cannot be built.
+        """
+        backend = thermodynamic_backend()
+        if backend not in self._tables:
+            try:
+                self._tables[backend] = SaturationTable.load(backend, self.backend_name, self.backend)
+            except BaseException as err:
+                logger.debug(f"Could not tabulate saturation curve of '{self.name}': {err}")
+                self._tables[backend] = None
+        return self._tables[backend]
+
+    def _calculate(self, prop: str, value, calculate, press: bool = False):
+        """
+        Calculate a property with the backend, through the property cache,
+        at a single state point or at an array of them. The state points
+        are temperatures, or pressures if ``press`` is set.
+        """
+        if self.fast_thermo:
+            table = self.saturation_table()
+            if table is not None:
+                result = table.lookup(prop, press=value) if press else table.lookup(prop, temp=value)
+                if result is not None:
+                    return result
+
+        if numpy.ndim(value) == 0:
+            return self._cache.get((prop, press, value), lambda: calculate(value))
+
+        # Each distinct state point is only calculated once
+        values, inverse = numpy.unique(numpy.asarray(value, dtype=float), return_inverse=True)
+        results = numpy.array([
+            self._cache.get((prop, press, point), lambda point=point: calculate(point))
+            for point in values
+        ])
+        return results[inverse].reshape(numpy.shape(value))
+
+    def cache_info(self):
+        """
+        Return the hit and miss statistics of the cache of properties
+        calculated with the thermodynamic backend.
+        """
+        return self._cache.info()
+
+    def cache_clear(self):
+        """Clear the cache of properties calculated with the thermodynamic backend."""
+        self._cache.clear()
+
     @property
     def formula(self) -> str:
         """Return the adsorbate formula."""
@@ -489,7 +581,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the pressure is desired in K.
         unit : str
             Unit in which to return the saturation pressure.
@@ -500,7 +592,7 @@ class Adsorbate():
 
         Returns
         -------
-        float
+        float or array
             Pressure in unit requested.
 
         Raises
@@ -524,7 +616,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the pressure is desired in K.
         unit : str
             Unit in which to return the saturation pressure.
@@ -535,7 +627,7 @@ class Adsorbate():
 
         Returns
         -------
-        float
+        float or array
             Pressure in unit requested.
 
         Raises
@@ -549,9 +641,11 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 0.0, temp)
-                sat_p = state.p()
+                sat_p = self._calculate(
+                    'saturation_pressure',
+                    temp,
+                    lambda temp: self._saturated(0.0, temp).p(),
+                )
             except BaseException as err:
                 _warn_reading_params(err)
                 sat_p = self.saturation_pressure(temp, unit=unit, calculate=False)
@@ -575,7 +669,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the surface_tension is desired in K.
         calculate : bool, optional
             Whether to calculate the property or look it up in the properties
@@ -583,7 +677,7 @@ class Adsorbate():
 
         Returns
         -------
-        float
+        float or array
             Surface tension in mN/m.
 
         Raises
@@ -597,9 +691,11 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 0.0, temp)
-                return state.surface_tension() * 1000
+                return self._calculate(
+                    'surface_tension',
+                    temp,
+                    lambda temp: self._saturated(0.0, temp).surface_tension() * 1000,
+                )
 
             except BaseException as err:
                 _warn_reading_params(err)
@@ -620,7 +716,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the liquid density is desired in K.
         calculate : bool, optional.
             Whether to calculate the property or look it up in the properties
@@ -628,7 +724,7 @@ class Adsorbate():
 
         Returns
         -------
-        float
+        float or array
             Liquid density in g/cm3.
 
         Raises
@@ -642,9 +738,11 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 0.0, temp)
-                return state.rhomass() / 1000
+                return self._calculate(
+                    'liquid_density',
+                    temp,
+                    lambda temp: self._saturated(0.0, temp).rhomass() / 1000,
+                )
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.liquid_density(temp, calculate=False)
@@ -664,7 +762,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the liquid density is desired in K.
         calculate : bool, optional.
             Whether to calculate the property or look it up in the properties
@@ -672,7 +770,7 @@ class Adsorbate():
 
         Returns
         -------
-        float
+        float or array
             Molar liquid density in mol/cm3.
 
         Raises
@@ -686,9 +784,11 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 0.0, temp)
-                return state.rhomolar() / 1e6
+                return self._calculate(
+                    'liquid_molar_density',
+                    temp,
+                    lambda temp: self._saturated(0.0, temp).rhomolar() / 1e6,
+                )
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.liquid_molar_density(temp, calculate=False)
@@ -708,7 +808,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the gas density is desired in K.
         calculate : bool, optional.
             Whether to calculate the property or look it up in the properties
@@ -716,7 +816,7 @@ class Adsorbate():
 
         Returns
         -------
-        float
+        float or array
             Gas density in g/cm3.
 
         Raises
@@ -730,9 +830,11 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 1.0, temp)
-                return state.rhomass() / 1000
+                return self._calculate(
+                    'gas_density',
+                    temp,
+                    lambda temp: self._saturated(1.0, temp).rhomass() / 1000,
+                )
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.gas_density(temp, calculate=False)
@@ -752,7 +854,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the gas density is desired in K.
         calculate : bool, optional.
             Whether to calculate the property or look it up in the properties
@@ -760,7 +862,7 @@ class Adsorbate():
 
         Returns
         -------
-        float
+        float or array
             Molar gas density in mol/cm3.
 
         Raises
@@ -774,9 +876,11 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 1.0, temp)
-                return state.rhomolar() / 1e6
+                return self._calculate(
+                    'gas_molar_density',
+                    temp,
+                    lambda temp: self._saturated(1.0, temp).rhomolar() / 1e6,
+                )
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.gas_molar_density(temp, calculate=False)
@@ -797,15 +901,18 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the enthalpy of vaporisation is desired, in K.
+        press : float or array
+            Pressure at which the enthalpy of vaporisation is desired, in Pa.
+            Only one of temperature or pressure can be specified.
         calculate : bool, optional
             Whether to calculate the property or look it up in the properties
             dictionary, default - True.
 
         Returns
         -------
-        float
+        float or array
             Enthalpy of vaporisation in kJ/mol.
 
         Raises
@@ -830,15 +937,18 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the enthalpy of liquefaction is desired, in K.
+        press : float or array
+            Pressure at which the enthalpy of liquefaction is desired, in Pa.
+            Only one of temperature or pressure can be specified.
         calculate : bool, optional
             Whether to calculate the property or look it up in the properties
             dictionary, default - True.
 
         Returns
         -------
-        float
+        float or array
             Enthalpy of liquefaction in kJ/mol.
 
         Raises
@@ -851,25 +961,35 @@ class Adsorbate():
 
         """
         if calculate:
-            if temp and press:
+            if temp is not None and press is not None:
                 raise CalculationError(
                     "Can only specify one intensive variable, either temperature or pressure."
                 )
-            try:
-                state = self.backend
-                if temp:
-                    state.update(CP.QT_INPUTS, 0.0, temp)
-                    h_liq = state.hmolar()
-                    state.update(CP.QT_INPUTS, 1.0, temp)
-                    h_vap = state.hmolar()
-                elif press:
-                    state.update(CP.PQ_INPUTS, press, 0.0)
+
+            def enthalpy(temp=None, press=None):
+                state = self._saturated(0.0, temp, press)
+                try:
+                    # both phases are known after a single update
+                    h_liq = state.saturated_liquid_keyed_output(CP.iHmolar)
+                    h_vap = state.saturated_vapor_keyed_output(CP.iHmolar)
+                except ValueError:
                     h_liq = state.hmolar()
-                    state.update(CP.PQ_INPUTS, press, 1.0)
-                    h_vap = state.hmolar()
-                else:
-                    raise CalculationError("Neither pressure nor temperature specified.")
+                    h_vap = self._saturated(1.0, temp, press).hmolar()
                 return (h_vap - h_liq) / 1000
+
+            try:
+                if temp is not None:
+                    return self._calculate(
+                        'enthalpy_liquefaction', temp, lambda temp: enthalpy(temp=temp)
+                    )
+                if press is not None:
+                    return self._calculate(
+                        'enthalpy_liquefaction',
+                        press,
+                        lambda press: enthalpy(press=press),
+                        press=True,
+                    )
+                raise CalculationError("Neither pressure nor temperature specified.")
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.enthalpy_liquefaction(temp, calculate=False)
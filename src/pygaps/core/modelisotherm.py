@@ -1,6 +1,11 @@
 """Class representing a model of and isotherm."""
 
+import copy
+import os
 import typing as t
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 
 import numpy
 import pandas
@@ -216,6 +221,7 @@ class ModelIsotherm(BaseIsotherm):
                 optimization_params,
                 verbose,
             )
+            self.model.fit_data = (pressure, loading)
 
         # Plot fit if verbose
         if verbose and other_properties.pop('plot_fit', True):
@@ -302,6 +308,9 @@ class ModelIsotherm(BaseIsotherm):
         param_guess: dict = None,
         param_bounds: dict = None,
         optimization_params: dict = None,
+        workers: int = None,
+        executor: Executor = None,
+        rmse_cutoff: float = None,
         verbose: bool = False
     ):
         """
@@ -327,6 +336,12 @@ class ModelIsotherm(BaseIsotherm):
             Dictionary to be passed to the minimization function to use in fitting model to data.
             See `here
             <https://docs.scipy.org/doc/scipy/reference/optimize.html#module-scipy.optimize>`__.
+        workers : int, optional
+            When guessing, number of processes used to fit the models concurrently.
+        executor : concurrent.futures.Executor, optional
+            When guessing, an executor on which to fit the models concurrently.
+        rmse_cutoff : float, optional
+            When guessing, stop fitting further models once one has a RMSE lower than this value.
         verbose : bool
             Prints out extra information about steps taken.
         """
@@ -354,6 +369,9 @@ class ModelIsotherm(BaseIsotherm):
             branch=branch,
             models=model,
             optimization_params=optimization_params,
+            workers=workers,
+            executor=executor,
+            rmse_cutoff=rmse_cutoff,
             verbose=verbose,
             **iso_params
         )
@@ -369,6 +387,9 @@ class ModelIsotherm(BaseIsotherm):
         branch: str = 'ads',
         models='guess',
         optimization_params: dict = None,
+        workers: int = None,
+        executor: Executor = None,
+        rmse_cutoff: float = None,
         verbose: bool = False,
         **other_properties
     ):
@@ -377,6 +398,8 @@ class ModelIsotherm(BaseIsotherm):
         then return the one with the best RMS fit.
 
         May take a long time depending on the number of datapoints.
+        The models can be fitted concurrently by passing a number of
+        ``workers`` for a process pool, or an existing ``executor``.
 
         Parameters
         ----------
@@ -406,12 +429,21 @@ class ModelIsotherm(BaseIsotherm):
             The branch on which the model isotherm is based on. It is assumed to be the
             adsorption branch, as it is the most commonly modelled part, although may
             set to desorption as well.
+        workers : int, optional
+            Number of processes used to fit the models concurrently.
+            By default, models are fitted one after another.
+        executor : concurrent.futures.Executor, optional
+            An executor on which to fit the models concurrently, for example an
+            existing process pool. Takes precedence over ``workers``.
+        rmse_cutoff : float, optional
+            Stop fitting further models once one has a RMSE lower than this value.
+            The best of the models fitted until then is returned. When fitting
+            concurrently, the models which are already running are still completed.
         verbose : bool, optional
             Prints out extra information about steps taken.
         other_properties:
             Any other parameters of the isotherm which should be stored internally.
         """
-        attempts = []
         if models == 'guess':
             guess_models = _GUESS_MODELS
         else:
@@ -422,28 +454,45 @@ class ModelIsotherm(BaseIsotherm):
             if len(guess_models) != len(models):
                 raise ParameterError('Not all models correspond to internal models.')
 
-        for model in guess_models:
-            try:
-                isotherm = cls(
-                    pressure=pressure,
-                    loading=loading,
-                    isotherm_data=isotherm_data,
-                    pressure_key=pressure_key,
-                    loading_key=loading_key,
-                    model=model,
-                    param_guess=None,
-                    param_bounds=None,
-                    optimization_params=optimization_params,
-                    branch=branch,
-                    verbose=verbose,
-                    plot_fit=False,  # we don't want to plot at this stage
-                    **other_properties
-                )
+        iso_params = dict(
+            pressure=pressure,
+            loading=loading,
+            isotherm_data=isotherm_data,
+            pressure_key=pressure_key,
+            loading_key=loading_key,
+            param_guess=None,
+            param_bounds=None,
+            optimization_params=optimization_params,
+            branch=branch,
+            verbose=verbose,
+            plot_fit=False,  # we don't want to plot at this stage
+            **other_properties
+        )
 
-                attempts.append(isotherm)
+        def cutoff_reached(isotherm):
+            return isotherm is not None and rmse_cutoff is not None \
+                and isotherm.model.rmse < rmse_cutoff
 
-            except CalculationError as err:
-                logger.info(f"Modelling using {model} failed.")
+        results = {}
+        if executor is None and workers is not None and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = cls._guess_concurrent(pool, guess_models, iso_params, cutoff_reached)
+        elif executor is not None:
+            results = cls._guess_concurrent(executor, guess_models, iso_params, cutoff_reached)
+        else:
+            for index, model in enumerate(guess_models):
+                results[index] = _fit_model(cls, model, iso_params)
+                if cutoff_reached(results[index][0]):
+                    break
+
+        # keep the same order as the list of models
+        attempts = []
+        for index in sorted(results):
+            isotherm, err = results[index]
+            if isotherm is not None:
+                attempts.append(isotherm)
+            else:
+                logger.info(f"Modelling using {guess_models[index]} failed.")
                 if verbose:
                     logger.info(f"\n{err}")
 
@@ -463,6 +512,22 @@ class ModelIsotherm(BaseIsotherm):
 
         return best_fit
 
+    @classmethod
+    def _guess_concurrent(cls, executor, guess_models, iso_params, cutoff_reached):
+        """Fit each model on an executor, stopping early if the cutoff is reached."""
+        futures = {
+            executor.submit(_fit_model, cls, model, iso_params): index
+            for index, model in enumerate(guess_models)
+        }
+        results = {}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if cutoff_reached(results[futures[future]][0]):
+                for pending in futures:
+                    pending.cancel()
+                break
+        return results
+
     ###########################################################
     #   Info function
 
@@ -1073,3 +1138,241 @@ class ModelIsotherm(BaseIsotherm):
 
         # calculate based on model
         return self.model.spreading_pressure(pressure)
+
+    def pressure_at_spreading_pressure(
+        self,
+        spreading_pressure: t.Union[float, t.List[float]],
+        branch: str = None,
+        pressure_unit: str = None,
+        pressure_mode: str = None,
+    ):
+        r"""
+        Calculate the bulk adsorbate pressure at a reduced spreading pressure.
+
+        This is the inverse of :meth:`spreading_pressure_at`, computed
+        from a cached table of the model.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            Spreading pressure, :math:`\Pi`, in internal isotherm loading units.
+        branch : {'ads', 'des'}
+            The branch of the use for calculation. Defaults to adsorption.
+        pressure_unit : str
+            Unit the pressure is returned in. If ``None``, it defaults to
+            internal isotherm units.
+        pressure_mode : str
+            The mode the pressure is returned in. If ``None``, it defaults to
+            internal isotherm mode.
+
+        Returns
+        -------
+        float or array
+            Pressure at which the spreading pressure is reached.
+
+        """
+        if branch and branch != self.branch:
+            raise ParameterError(
+                f"ModelIsotherm is based on an '{self.branch}' branch "
+                f"(while parameter supplied was '{branch}')."
+            )
+
+        # calculate based on model
+        pressure = self.model.pressure_at_spreading_pressure(spreading_pressure)
+
+        # Ensure pressure is in correct units and mode requested
+        if pressure_mode or pressure_unit:
+            if not pressure_mode:
+                pressure_mode = self.pressure_mode
+
+            pressure = c_pressure(
+                pressure,
+                mode_from=self.pressure_mode,
+                mode_to=pressure_mode,
+                unit_from=self.pressure_unit,
+                unit_to=pressure_unit,
+                adsorbate=self.adsorbate,
+                temp=self.temperature
+            )
+
+        return pressure
+
+    def fit_uncertainty(
+        self,
+        n_samples: int = 1000,
+        method: str = 'residuals',
+        confidence: float = 0.95,
+        pressure: t.List[float] = None,
+        n_jobs: int = None,
+        seed: int = None,
+        optimization_params: dict = None,
+    ) -> dict:
+        """
+        Estimate the uncertainty of the model parameters by bootstrapping.
+
+        The isotherm data is resampled ``n_samples`` times and the model is
+        refitted to each sample, starting from the current parameters.
+        Models with a kernel are refitted together in a single vectorised
+        routine (see :meth:`~pygaps.modelling.base_model.IsothermBaseModel.fit_samples`).
+
+        Parameters
+        ----------
+        n_samples : int, optional
+            Number of resampled datasets, default 1000.
+        method : {'residuals', 'pairs'}, optional
+            Either add resampled fit residuals to the model curve, or resample
+            the (pressure, loading) points with replacement. For models which
+            calculate pressure, residuals are taken on the logarithm of pressure.
+        confidence : float, optional
+            Confidence level of the returned intervals, default 0.95.
+        pressure : array, optional
+            Pressures at which to calculate the loading confidence band, in
+            internal isotherm units. Defaults to 50 points on the model range.
+        n_jobs : int, optional
+            Number of processes to split the samples over, or -1 to use all
+            processors. Defaults to fitting in the current process.
+        seed : int, optional
+            Seed of the random number generator, for reproducible results.
+        optimization_params : dict, optional
+            Custom parameters to pass to SciPy.optimize.least_squares,
+            if any samples are fitted individually.
+
+        Returns
+        -------
+        dict
+            A dictionary with the fitted ``params`` of each sample, their
+            ``params_interval`` at the requested confidence, the ``pressure``,
+            model ``loading`` and ``loading_interval`` of the confidence band
+            and the number of samples where fitting failed, ``n_failed``.
+
+        Raises
+        ------
+        ParameterError
+            When the data the model was fitted on is not available or
+            the options are incorrect.
+
+        """
+        if self.model.fit_data is None:
+            raise ParameterError(
+                "Uncertainty can only be estimated for a model fitted on isotherm "
+                "data in this session, the fitted data is not saved."
+            )
+        if not 0 < confidence < 1:
+            raise ParameterError("Confidence level must be between 0 and 1.")
+
+        # generate the resampled datasets
+        rng = numpy.random.default_rng(seed)
+        data_pressure, data_loading = self.model.fit_data
+        if self.model.calculates == 'pressure':
+            # zero points are not used by models fitted on pressure
+            nonzero = (data_pressure > 0) & (data_loading > 0)
+            data_pressure, data_loading = data_pressure[nonzero], data_loading[nonzero]
+        n_points = len(data_pressure)
+        weights = None
+        if method == 'residuals':
+            if self.model.calculates == 'loading':
+                fitted = self.model.loading(data_pressure)
+                data_loading = fitted + rng.choice(data_loading - fitted, (n_samples, n_points))
+            else:
+                ln_fitted = numpy.log(self.model.pressure(data_loading))
+                residuals = numpy.log(data_pressure) - ln_fitted
+                data_pressure = numpy.exp(ln_fitted + rng.choice(residuals, (n_samples, n_points)))
+        elif method == 'pairs':
+            weights = rng.multinomial(n_points, numpy.full(n_points, 1 / n_points), n_samples)
+        else:
+            raise ParameterError("Bootstrap method must be either 'residuals' or 'pairs'.")
+
+        # refit the model to each sample
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+        if n_jobs is None or n_jobs <= 1:
+            theta = self.model.fit_samples(
+                data_pressure,
+                data_loading,
+                weights,
+                optimization_params=optimization_params,
+            )
+        else:
+            chunks = numpy.array_split(numpy.arange(n_samples), n_jobs)
+
+            def sample_chunk(data, chunk):
+                return data if numpy.ndim(data) < 2 else data[chunk]
+
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [
+                    executor.submit(
+                        self.model.fit_samples,
+                        sample_chunk(data_pressure, chunk),
+                        sample_chunk(data_loading, chunk),
+                        sample_chunk(weights, chunk),
+                        optimization_params=optimization_params,
+                    ) for chunk in chunks
+                ]
+                theta = numpy.vstack([future.result() for future in futures])
+
+        valid = numpy.isfinite(theta).all(axis=1)
+        if not valid.any():
+            raise CalculationError("The model could not be fitted to any of the resampled data.")
+        theta = theta[valid]
+        quantiles = [(1 - confidence) / 2, (1 + confidence) / 2]
+
+        # loading confidence band
+        if pressure is None:
+            pressure = numpy.linspace(*self.model.pressure_range, 50)
+        pressure = numpy.asarray(pressure, dtype=float)
+        loadings = self._loading_samples(pressure, theta)
+        loading = self._loading_samples(pressure, self.model.param_array[None])[0]
+        loading_interval = numpy.full((2, pressure.size), numpy.nan)
+        band = numpy.isfinite(loadings).any(axis=0)
+        loading_interval[:, band] = numpy.nanquantile(loadings[:, band], quantiles, axis=0)
+
+        return {
+            'params': dict(zip(self.model.param_names, theta.T)),
+            'params_interval': {
+                param: tuple(numpy.quantile(values, quantiles))
+                for param, values in zip(self.model.param_names, theta.T)
+            },
+            'pressure': pressure,
+            'loading': loading,
+            'loading_interval': tuple(loading_interval),
+            'n_failed': int(numpy.count_nonzero(~valid)),
+        }
+
+    def _loading_samples(self, pressure, theta):
+        """Calculate the model loading for an array of parameter sets, NaN where invalid."""
+        with numpy.errstate(all='ignore'):
+            if self.model.loading_kernel is not None:
+                return self.model.loading_kernel(pressure, theta)
+
+            loadings = numpy.full((len(theta), pressure.size), numpy.nan)
+            if self.model.pressure_kernel is not None:
+                # invert the pressure of each sample on a grid of loadings
+                loading_grid = numpy.linspace(0, 1.5 * self.model.loading_range[1], 500)[1:]
+                pressures = self.model.pressure_kernel(loading_grid, theta)
+                for index, row in enumerate(pressures):
+                    increasing = numpy.diff(row, prepend=0) > 0
+                    stop = increasing.size if increasing.all() else numpy.argmin(increasing)
+                    loadings[index] = numpy.interp(
+                        pressure,
+                        numpy.r_[0, row[:stop]],
+                        numpy.r_[0, loading_grid[:stop]],
+                        right=numpy.nan,
+                    )
+                return loadings
+
+            model = copy.deepcopy(self.model)
+            for index, params in enumerate(theta):
+                model.params = dict(zip(model.param_names, params))
+                try:
+                    loadings[index] = model.loading(pressure)
+                except CalculationError:
+                    pass
+            return loadings
+
+
+def _fit_model(cls, model, iso_params):
+    """Fit a single model, returning the isotherm or the fitting error."""
+    try:
+        return cls(model=model, **iso_params), None
+    except CalculationError as err:
+        return None, err
@@ -17,6 +17,7 @@ from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.utilities.exceptions import pgError
 from pygaps.utilities.isotherm_interpolator import IsothermInterpolator
+from pygaps.utilities.isotherm_interpolator import SpreadingPressureInterpolator
 
 
 class PointIsotherm(BaseIsotherm):
@@ -94,6 +95,7 @@ class PointIsotherm(BaseIsotherm):
         'data_raw',
         'l_interpolator',
         'p_interpolator',
+        's_interpolator',
         'loading_key',
         'pressure_key',
         'other_keys',
@@ -201,6 +203,9 @@ class PointIsotherm(BaseIsotherm):
         # The internal interpolator for pressure given loading.
         self.p_interpolator = None
 
+        # The internal spreading pressure table.
+        self.s_interpolator = None
+
     @classmethod
     def from_isotherm(
         cls,
@@ -426,6 +431,7 @@ class PointIsotherm(BaseIsotherm):
         # Reset interpolators
         self.l_interpolator = None
         self.p_interpolator = None
+        self.s_interpolator = None
 
         if verbose:
             logger.info(f"Changed pressure to mode '{mode_to}', unit '{unit_to}'.")
@@ -488,6 +494,7 @@ class PointIsotherm(BaseIsotherm):
         # Reset interpolators
         self.l_interpolator = None
         self.p_interpolator = None
+        self.s_interpolator = None
 
         if verbose:
             logger.info(f"Changed loading to basis '{basis_to}', unit '{unit_to}'.")
@@ -576,6 +583,7 @@ class PointIsotherm(BaseIsotherm):
         # Reset interpolators
         self.l_interpolator = None
         self.p_interpolator = None
+        self.s_interpolator = None
 
         if verbose:
             logger.info(f"Changed material to basis '{basis_to}', unit '{unit_to}'.")
@@ -1173,6 +1181,16 @@ class PointIsotherm(BaseIsotherm):
 
         return loading
 
+    def _spreading_pressure_table(self, branch: str) -> SpreadingPressureInterpolator:
+        """Return the cached spreading pressure integral of a branch, building it if needed."""
+        if self.s_interpolator is None or self.s_interpolator.interp_branch != branch:
+            self.s_interpolator = SpreadingPressureInterpolator(
+                self.pressure(branch=branch),
+                self.loading(branch=branch),
+                interp_branch=branch,
+            )
+        return self.s_interpolator
+
     def spreading_pressure_at(
         self,
         pressure: t.List[float],
@@ -1196,28 +1214,37 @@ class PointIsotherm(BaseIsotherm):
             \Pi(p) = \int_0^p \frac{q(\hat{p})}{ \hat{p}} d\hat{p}.
 
         In this integral, the isotherm :math:`q(\hat{p})` is represented by a
-        linear interpolation of the data.
+        linear interpolation of the data, with Henry's law assumed below the
+        first point. The integral up to each datapoint is calculated once per
+        branch and cached, until the isotherm is converted.
 
         For in-detail explanations, check reference [#]_.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             Pressure (in corresponding units as data in instantiation).
+            An array of pressures is evaluated in a single vectorised call.
         branch : {'ads', 'des'}
             The branch of the use for calculation. Defaults to adsorption.
-        loading_unit : str
-            Unit the loading is specified in. If ``None``, it defaults to
-            internal isotherm units.
         pressure_unit : str
-            Unit the pressure is returned in. If ``None``, it defaults to
+            Unit the pressure is specified in. If ``None``, it defaults to
             internal isotherm units.
-        material_basis : str
-            The basis the loading is passed in. If ``None``, it defaults to
-            internal isotherm basis.
         pressure_mode : str
-            The mode the pressure is returned in. If ``None``, it defaults to
+            The mode the pressure is passed in. If ``None``, it defaults to
             internal isotherm mode.
+        loading_unit : str
+            Unit in which the spreading pressure should be returned. If ``None``,
+            it defaults to internal isotherm loading units.
+        loading_basis : {None, 'mass', 'molar', 'volume_gas', 'volume_liquid'}
+            The basis on which to return the spreading pressure. If ``None``,
+            returns on the basis the isotherm is currently in.
+        material_unit : str, optional
+            Material unit in which the data should be returned. If ``None``
+            it defaults to which loading unit the isotherm is currently in.
+        material_basis : {None, 'mass', 'volume', 'molar'}
+            Material basis on which to return the data, if possible. If ``None``,
+            returns on the basis the isotherm is currently in.
         interp_fill : array-like or (array-like, array_like) or “extrapolate”, optional
             Parameter to determine what to do outside data bounds.
             Passed to the scipy.interpolate.interp1d function as ``fill_value``.
@@ -1225,7 +1252,7 @@ class PointIsotherm(BaseIsotherm):
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure, :math:`\Pi`.
 
         References
@@ -1234,28 +1261,39 @@ class PointIsotherm(BaseIsotherm):
            Theory (IAST) Python Package. Computer Physics Communications.
 
         """
-        # Get all data points
-        pressures = self.pressure(
-            branch=branch, pressure_unit=pressure_unit, pressure_mode=pressure_mode
-        )
-        loadings = self.loading(
-            branch=branch,
-            loading_unit=loading_unit,
-            loading_basis=loading_basis,
-            material_unit=material_unit,
-            material_basis=material_basis
-        )
+        # Convert to numpy array just in case
+        pressure = numpy.asarray(pressure)
+        table = self._spreading_pressure_table(branch)
+
+        # Ensure pressure is in correct units and mode for the internal model
+        if pressure_mode or pressure_unit:
+            if not pressure_mode:
+                pressure_mode = self.pressure_mode
+            if pressure_mode == 'absolute' and not pressure_unit:
+                raise ParameterError(
+                    "Must specify a pressure unit if the input is in an absolute mode."
+                )
+
+            pressure = c_pressure(
+                pressure,
+                mode_from=pressure_mode,
+                mode_to=self.pressure_mode,
+                unit_from=pressure_unit,
+                unit_to=self.pressure_unit,
+                adsorbate=self.adsorbate,
+                temp=self.temperature
+            )
 
         # throw exception if interpolating outside the range.
-        if (self.l_interpolator is not None and self.l_interpolator.interp_fill is None) & \
-                (pressure > pressures.max() or pressure < pressures.min()):
+        max_pressure = table.pressure[-1]
+        if interp_fill is None and numpy.any(pressure > max_pressure):
             raise CalculationError(
                 textwrap.dedent(
                     f"""
                 To compute the spreading pressure at this bulk adsorbate pressure,
-                we would need to extrapolate the isotherm since this pressure ({pressure:.3g} {self.pressure_unit})
+                we would need to extrapolate the isotherm since this pressure ({numpy.max(pressure):.3g} {self.pressure_unit})
                 is outside the range of the highest pressure in your pure-component
-                isotherm data ({pressures.max()} {self.pressure_unit}).
+                isotherm data ({max_pressure} {self.pressure_unit}).
 
                 At present, the PointIsotherm class is set to throw an exception
                 when this occurs, as we do not have data outside this pressure range
@@ -1264,7 +1302,7 @@ class PointIsotherm(BaseIsotherm):
                 Option 1: fit an analytical model to extrapolate the isotherm
                 Option 2: pass a `interp_fill` to the spreading pressure function of the
                     PointIsotherm object. Then, that PointIsotherm will
-                    assume that the uptake beyond {pressures.max()} {self.pressure_unit} is given by
+                    assume that the uptake beyond {max_pressure} {self.pressure_unit} is given by
                     `interp_fill`. This is reasonable if your isotherm data exhibits
                     a plateau at the highest pressures.
                 Option 3: Go back to the lab or computer to collect isotherm data
@@ -1273,49 +1311,111 @@ class PointIsotherm(BaseIsotherm):
                 )
             )
 
-        # approximate loading up to first pressure point with Henry's law
-        # loading = henry_const * P
-        # henry_const is the initial slope in the adsorption isotherm
-        henry_const = loadings[0] / pressures[0]
-
-        # get how many of the points are less than pressure P
-        n_points = numpy.sum(pressures < pressure)
-
-        if n_points == 0:
-            # if this pressure is between 0 and first pressure point...
-            # \int_0^P henry_const P /P dP = henry_const * P ...
-            return henry_const * pressure
-
-        # P > first pressure point
-        area = loadings[0]  # area of first segment \int_0^P_1 n(P)/P dP
-
-        # get area between P_1 and P_k, where P_k < P < P_{k+1}
-        for i in range(n_points - 1):
-            # linear interpolation of isotherm data
-            slope = (loadings[i + 1] - loadings[i]) / (pressures[i + 1] - pressures[i])
-            intercept = loadings[i] - slope * pressures[i]
-            # add area of this segment
-            area += slope * (pressures[i + 1] - pressures[i]) + intercept * \
-                numpy.log(pressures[i + 1] / pressures[i])
-
-        # finally, area of last segment
-        slope = (
-            self.loading_at(
-                pressure,
-                branch=branch,
-                pressure_unit=pressure_unit,
-                pressure_mode=pressure_mode,
-                loading_unit=loading_unit,
-                loading_basis=loading_basis,
-                material_unit=material_unit,
-                material_basis=material_basis,
-                interp_fill=interp_fill
-            ) - loadings[n_points - 1]
-        ) / (pressure - pressures[n_points - 1])
+        # Look up the spreading pressure in the precomputed table
+        spreading_pressure = table(pressure, interp_fill=interp_fill)
+
+        # The spreading pressure is in the same units as the loading
+        if material_basis or material_unit:
+            if not material_basis:
+                material_basis = self.material_basis
 
-        intercept = loadings[n_points - 1] - \
-            slope * pressures[n_points - 1]
-        area += slope * (pressure - pressures[n_points - 1]) + intercept * \
-            numpy.log(pressure / pressures[n_points - 1])
+            spreading_pressure = c_material(
+                spreading_pressure,
+                basis_from=self.material_basis,
+                basis_to=material_basis,
+                unit_from=self.material_unit,
+                unit_to=material_unit,
+                material=self.material
+            )
 
-        return area
+        if loading_basis or loading_unit:
+            if not loading_basis:
+                loading_basis = self.loading_basis
+
+            # These must be specified
+            # in the case of fractional conversions
+            if not material_basis:
+                material_basis = self.material_basis
+            if not material_unit:
+                material_unit = self.material_unit
+
+            spreading_pressure = c_loading(
+                spreading_pressure,
+                basis_from=self.loading_basis,
+                basis_to=loading_basis,
+                unit_from=self.loading_unit,
+                unit_to=loading_unit,
+                adsorbate=self.adsorbate,
+                temp=self.temperature,
+                basis_material=material_basis,
+                unit_material=material_unit,
+            )
+
+        return spreading_pressure
+
+    def pressure_at_spreading_pressure(
+        self,
+        spreading_pressure: t.List[float],
+        branch: str = 'ads',
+        pressure_unit: str = None,
+        pressure_mode: str = None,
+        interp_fill: t.Union[float, t.Tuple[float, float], str] = None,
+    ) -> numpy.ndarray:
+        r"""
+        Calculate the bulk adsorbate pressure at a reduced spreading pressure.
+
+        This is the inverse of :meth:`spreading_pressure_at`, using the same
+        cached integral of the isotherm data. It is useful in IAST, where
+        the pressure of each pure component at the spreading pressure of the
+        mixture is needed.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            Spreading pressure, :math:`\Pi`, in internal isotherm loading units.
+        branch : {'ads', 'des'}
+            The branch of the use for calculation. Defaults to adsorption.
+        pressure_unit : str
+            Unit the pressure is returned in. If ``None``, it defaults to
+            internal isotherm units.
+        pressure_mode : str
+            The mode the pressure is returned in. If ``None``, it defaults to
+            internal isotherm mode.
+        interp_fill : array-like or (array-like, array_like) or “extrapolate”, optional
+            Parameter to determine what to do outside data bounds, as in
+            :meth:`spreading_pressure_at`.
+
+        Returns
+        -------
+        float or array
+            Pressure at which the spreading pressure is reached.
+
+        """
+        table = self._spreading_pressure_table(branch)
+
+        spreading_pressure = numpy.asarray(spreading_pressure)
+        if interp_fill is None and \
+                numpy.any(spreading_pressure > table.spreading_pressure[-1]):
+            raise CalculationError(
+                "The spreading pressure requested is above the one at the highest "
+                "pressure in the isotherm data. Pass an `interp_fill` to extrapolate."
+            )
+
+        pressure = table.inverse(spreading_pressure, interp_fill=interp_fill)
+
+        # Ensure pressure is in correct units and mode requested
+        if pressure_mode or pressure_unit:
+            if not pressure_mode:
+                pressure_mode = self.pressure_mode
+
+            pressure = c_pressure(
+                pressure,
+                mode_from=self.pressure_mode,
+                mode_to=pressure_mode,
+                unit_from=self.pressure_unit,
+                unit_to=pressure_unit,
+                adsorbate=self.adsorbate,
+                temp=self.temperature
+            )
+
+        return pressure
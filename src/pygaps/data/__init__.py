@@ -2,8 +2,8 @@
 Loading some data at import-time.
 
 Here is where objects such as adsorbates or materials are imported to be
-available for pyGAPS. These are populated at import-time. Also defines the
-internal database location.
+available for pyGAPS. These are populated from the internal database when
+first used. Also defines the internal database location.
 """
 # flake8: noqa
 # isort:skip_file
@@ -19,6 +19,8 @@ except ImportError:
 
 from contextlib import ExitStack
 import atexit
+import functools
+import threading
 
 # We use an exit stack and register it at interpreter exit to cleanup anything needed
 file_manager = ExitStack()
@@ -26,22 +28,145 @@ atexit.register(file_manager.close)
 ref = importlib_resources_files('pygaps.data') / 'default.db'
 DATABASE = file_manager.enter_context(importlib_resources.as_file(ref))
 
-# Lists of pygaps data
-MATERIAL_LIST = []
-ADSORBATE_LIST = []
 
+class _Catalogue(list):
+    """
+    A list of pygaps data, filled from the internal database when first used.
 
-def load_data():
-    """Will proceed with filling the data store."""
+    Reading the database at import time is a noticeable share of the import
+    time of pyGAPS, so it is only done when the list is first accessed.
 
-    from pygaps.parsing.sqlite import adsorbates_from_db
+    Lookups by name go through an index of the lookup keys of each object
+    (for example, all adsorbate aliases), which is kept up to date when objects
+    are added to or removed from the list. Changing the name or aliases of an
+    object already in the list is not tracked.
+
+    Parameters
+    ----------
+    load : callable
+        Returns the objects stored in the database.
+    keys : callable
+        Returns the lookup keys of an object.
+    fold : callable, optional
+        Normalises a name before it is looked up, for example lowercasing it.
+    """
+    def __init__(self, load, keys, fold=None):
+        super().__init__()
+        self._load = load
+        self._keys = keys
+        self._fold = fold if fold else str
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._index = None
+        self._names = None
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                # only marked as loaded on success, so a failed read is retried
+                list.extend(self, self._load())
+                self._loaded = True
+                self._index = None
+
+    def _ensure_indexed(self):
+        self._ensure_loaded()
+        if self._index is None:
+            index, names = {}, {}
+            for item in list.__iter__(self):
+                self._add_keys(item, index, names)
+            self._index, self._names = index, names
+
+    def _add_keys(self, item, index, names):
+        # The first object in the list takes precedence, like a linear search
+        for key in self._keys(item):
+            index.setdefault(key, item)
+        names.setdefault(item.name, item)
+
+    def get(self, name: str, default=None):
+        """Return the object matching a name, or default if none does."""
+        self._ensure_indexed()
+        return self._index.get(self._fold(name), default)
+
+    def __contains__(self, item):
+        self._ensure_indexed()
+        if isinstance(item, str):
+            return self._fold(item) in self._index
+        name = getattr(item, 'name', None)
+        if isinstance(name, str):
+            return name in self._names
+        return list.__contains__(self, item)
+
+    def append(self, item):
+        self._ensure_loaded()
+        list.append(self, item)
+        if self._index is not None:
+            self._add_keys(item, self._index, self._names)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+        return self
+
+    __iadd__ = extend
+
+
+def _lazy(method):
+    """Wrap a list method to load the catalogue before it is called."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._ensure_loaded()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _reindexed(method):
+    """Wrap a list method which changes the list, so that it is indexed again."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._ensure_loaded()
+        result = method(self, *args, **kwargs)
+        self._index = None
+        return result
+
+    return wrapper
+
+
+for _name in (
+    '__eq__', '__ge__', '__getitem__', '__gt__', '__iter__', '__le__', '__len__', '__lt__',
+    '__mul__', '__ne__', '__add__', '__repr__', '__reversed__', '__rmul__', 'copy', 'count',
+    'index'
+):
+    setattr(_Catalogue, _name, _lazy(getattr(list, _name)))
+for _name in (
+    '__delitem__', '__imul__', '__setitem__', 'clear', 'insert', 'pop', 'remove', 'reverse',
+    'sort'
+):
+    setattr(_Catalogue, _name, _reindexed(getattr(list, _name)))
+del _name
+
+
+def _load_materials():
     from pygaps.parsing.sqlite import materials_from_db
+    return materials_from_db(verbose=False)
 
-    global MATERIAL_LIST
-    global ADSORBATE_LIST
 
-    MATERIAL_LIST.extend(materials_from_db(verbose=False))
-    ADSORBATE_LIST.extend(adsorbates_from_db(verbose=False))
+def _load_adsorbates():
+    from pygaps.parsing.sqlite import adsorbates_from_db
+    return adsorbates_from_db(verbose=False)
+
+
+# Lists of pygaps data
+MATERIAL_LIST = _Catalogue(_load_materials, keys=lambda mat: [mat.name])
+ADSORBATE_LIST = _Catalogue(_load_adsorbates, keys=lambda ads: ads.alias, fold=str.lower)
+
+
+def load_data():
+    """Fill the data store now, instead of when it is first used."""
+    MATERIAL_LIST._ensure_loaded()
+    ADSORBATE_LIST._ensure_loaded()
 
 
 # TODO These methods actually WILL not work if there's a Zip file or
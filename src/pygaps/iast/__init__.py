@@ -3,6 +3,7 @@
 # isort:skip_file
 from pygaps.iast.pgiast import iast_point
 from pygaps.iast.pgiast import iast_point_fraction
+from pygaps.iast.pgiast import iast_batch
 from pygaps.iast.pgiast import iast_binary_svp
 from pygaps.iast.pgiast import iast_binary_vle
 from pygaps.iast.pgiast import reverse_iast
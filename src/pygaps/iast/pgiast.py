@@ -80,21 +80,16 @@ def iast_binary_vle(
     y_data = numpy.linspace(0.01, 0.99, npoints)
     binary_fractions = numpy.array((y_data, 1 - y_data)).transpose()
 
-    # Generate the array of loadings
-    component_loadings = numpy.zeros((npoints, 2))
-
     # Run IAST
-    for index, fraction in enumerate(binary_fractions):
-        component_loadings[index, :] = iast_point_fraction(
-            isotherms,
-            fraction,
-            total_pressure,
-            branch=branch,
-            warningoff=warningoff,
-            adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
-        )
+    component_loadings = iast_batch(
+        isotherms,
+        binary_fractions * total_pressure,
+        branch=branch,
+        warningoff=warningoff,
+        adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
+    )
 
-    x_data = [x[0] / (x[0] + x[1]) for x in component_loadings]
+    x_data = component_loadings[:, 0] / numpy.sum(component_loadings, axis=1)
 
     # Add start and end points
     x_data = numpy.concatenate([[0], x_data, [1]])
@@ -180,21 +175,17 @@ def iast_binary_svp(
     pressures = numpy.asarray(pressures)
     mole_fractions = numpy.asarray(mole_fractions)
 
-    # Generate the array of partial pressures
-    component_loadings = numpy.zeros((len(pressures), 2))
-
-    for index, pressure in enumerate(pressures):
-        component_loadings[index, :] = iast_point_fraction(
-            isotherms,
-            mole_fractions,
-            pressure,
-            branch=branch,
-            warningoff=warningoff,
-            adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
-        )
+    # Run IAST on the array of partial pressures
+    component_loadings = iast_batch(
+        isotherms,
+        numpy.outer(pressures, mole_fractions),
+        branch=branch,
+        warningoff=warningoff,
+        adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
+    )
 
-    selectivities = [(x[0] / mole_fractions[0]) / (x[1] / mole_fractions[1])
-                     for x in component_loadings]
+    selectivities = (component_loadings[:, 0] / mole_fractions[0]) / \
+        (component_loadings[:, 1] / mole_fractions[1])
 
     if verbose:
         plot_iast_svp(
@@ -470,6 +461,221 @@ def iast_point(
     return loadings
 
 
+def iast_batch(
+    isotherms,
+    partial_pressures,
+    branch="ads",
+    warningoff=False,
+    adsorbed_mole_fraction_guess=None,
+    tolerance=1e-10,
+    max_iterations=50,
+):
+    """
+    Perform IAST calculations for many gas phase compositions at once.
+
+    Each row of `partial_pressures` is an independent IAST problem, equivalent
+    to a call to :func:`iast_point`. All rows are solved together with a
+    vectorised Newton scheme on the adsorbed phase mole fractions, which
+    makes this function much faster than repeated calls to `iast_point`
+    when many compositions are needed. Any row which the Newton scheme
+    cannot converge is re-solved individually with `iast_point`.
+
+    Pass a list of pure-component adsorption isotherms `isotherms`.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms
+        e.g. [methane_isotherm, ethane_isotherm, ...]
+    partial_pressures : 2D array
+        Partial pressures of gas components, with one row for each
+        composition and one column for each component,
+        e.g. [[1.5, 5], [2.5, 4], ...].
+    branch : str
+        which branch of the isotherm to use
+    warningoff: bool, optional
+        When False, logger.warning will print when the IAST
+        calculation result required extrapolation of the pure-component
+        adsorption isotherm beyond the highest pressure in the data.
+    adsorbed_mole_fraction_guess : array, optional
+        Starting guesses for adsorbed phase mole fractions that
+        `iast` solves for. Either a single guess used for all rows,
+        or an array with the same shape as `partial_pressures`.
+    tolerance : float, optional
+        Convergence criterion for the largest spreading pressure difference
+        between components, relative to the spreading pressure.
+    max_iterations : int, optional
+        Maximum number of Newton iterations.
+
+    Returns
+    -------
+    loadings : 2D array
+        Predicted uptakes of each component for each row
+        (mmol/g or equivalent in isotherm units).
+
+    """
+    # Parameter checks
+    for isotherm in isotherms:
+        if isinstance(isotherm, ModelIsotherm):
+            if not is_model_iast(isotherm.model.name):
+                raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
+    if any(iso.pressure_mode.startswith("relative") for iso in isotherms):
+        raise ParameterError("IAST only runs with isotherms on an absolute pressure basis.")
+
+    n_components = len(isotherms)  # number of components in the mixture
+    if n_components == 1:
+        raise ParameterError("Pass at least two isotherms.")
+
+    partial_pressures = numpy.atleast_2d(numpy.asarray(partial_pressures, dtype=float))
+    if partial_pressures.ndim != 2 or partial_pressures.shape[1] != n_components:
+        raise ParameterError(
+            "Partial pressures should be an array with one column per isotherm. Example use:\n"
+            "iast_batch([iso1, iso2, iso3], [[p1, p2, p3], [p1, p2, p3], ...])"
+        )
+    if numpy.any(partial_pressures <= 0):
+        raise ParameterError("All partial pressures should be positive.")
+
+    n_points = partial_pressures.shape[0]
+
+    # Starting guess for the adsorbed mole fractions
+    if adsorbed_mole_fraction_guess is None:
+        # Default guess: pure-component loadings at these partial pressures.
+        loading_guess = numpy.column_stack([
+            isotherms[i].loading_at(partial_pressures[:, i], branch=branch)
+            for i in range(n_components)
+        ])
+        fractions = loading_guess / numpy.sum(loading_guess, axis=1, keepdims=True)
+    else:
+        adsorbed_mole_fraction_guess = numpy.asarray(adsorbed_mole_fraction_guess, dtype=float)
+        numpy.testing.assert_almost_equal(
+            1.0, numpy.sum(adsorbed_mole_fraction_guess, axis=-1), decimal=4
+        )
+        fractions = numpy.broadcast_to(adsorbed_mole_fraction_guess,
+                                       partial_pressures.shape).copy()
+    fraction_guess = fractions.copy()
+
+    # A bad default guess (e.g. zero loading) is replaced by an equimolar one
+    invalid = ~numpy.all(numpy.isfinite(fractions) & (fractions > 0), axis=1)
+    fractions[invalid] = 1.0 / n_components
+
+    # Solve all rows at once, iterating only on those not yet converged
+    converged = numpy.zeros(n_points, dtype=bool)
+    active = numpy.arange(n_points)
+    for _ in range(max_iterations):
+        x = fractions[active]
+        p = partial_pressures[active]
+        pressure0 = p / x
+        try:
+            spreading = numpy.column_stack([
+                isotherms[i].spreading_pressure_at(pressure0[:, i], branch=branch)
+                for i in range(n_components)
+            ])
+        except (CalculationError, ValueError):
+            # some of the points are outside the isotherm range
+            break
+
+        # Residuals: spreading pressure difference between component i and i+1
+        residual = spreading[:, :-1] - spreading[:, 1:]
+        scale = numpy.max(numpy.abs(spreading), axis=1)
+        done = numpy.all(numpy.abs(residual) <= tolerance * scale[:, None], axis=1)
+        converged[active[done]] = True
+        if numpy.all(done):
+            active = active[:0]
+            break
+
+        x, p, pressure0, residual = x[~done], p[~done], pressure0[~done], residual[~done]
+        active = active[~done]
+
+        # Derivative of spreading pressure of each component with respect
+        # to its adsorbed mole fraction, from d(Pi)/dp = n(p)/p
+        try:
+            loading0 = numpy.column_stack([
+                isotherms[i].loading_at(pressure0[:, i], branch=branch)
+                for i in range(n_components)
+            ])
+        except ValueError:
+            break
+        grad = -loading0 / x
+
+        # Jacobian of residuals with respect to the first n-1 mole fractions,
+        # with the last fraction defined as 1 - sum of the others
+        n_active = len(active)
+        jacobian = numpy.zeros((n_active, n_components - 1, n_components - 1))
+        diag = numpy.arange(n_components - 1)
+        jacobian[:, diag, diag] = grad[:, :-1]
+        jacobian[:, diag[:-1], diag[1:]] = -grad[:, 1:-1]
+        jacobian[:, -1, :] += grad[:, -1:]
+
+        try:
+            step = numpy.linalg.solve(jacobian, -residual[..., None])[..., 0]
+        except numpy.linalg.LinAlgError:
+            break
+        step = numpy.column_stack([step, -numpy.sum(step, axis=1)])
+
+        # Damp step so that all mole fractions stay positive
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            limit = numpy.where(step < 0, -0.9 * x / step, numpy.inf)
+        alpha = numpy.minimum(1.0, numpy.min(limit, axis=1))
+
+        fractions[active] = x + alpha[:, None] * step
+
+        # Rows with non-finite values cannot be recovered by Newton
+        finite = numpy.all(numpy.isfinite(fractions[active]), axis=1)
+        active = active[finite]
+
+    # Rows which did not converge are solved one at a time
+    for index in numpy.flatnonzero(~converged):
+        loadings = iast_point(
+            isotherms,
+            partial_pressures[index],
+            branch=branch,
+            warningoff=True,
+            adsorbed_mole_fraction_guess=None
+            if adsorbed_mole_fraction_guess is None else fraction_guess[index],
+        )
+        fractions[index] = loadings / numpy.sum(loadings)
+
+    if numpy.any((fractions < 0.0) | (fractions > 1.0)):
+        raise CalculationError(
+            textwrap.dedent(
+                """
+                Some adsorbed mole fractions are below 0 or over 1. Try a different
+                starting guess for the adsorbed mole fractions by passing an array
+                'adsorbed_mole_fraction_guess' into this function.
+                e.g. adsorbed_mole_fraction_guess=[0.2, 0.8]"""
+            )
+        )
+
+    pressure0 = partial_pressures / fractions
+
+    # solve for the total gas adsorbed
+    inverse_loading = numpy.zeros(n_points)
+    for i in range(n_components):
+        inverse_loading += fractions[:, i] / isotherms[i].loading_at(pressure0[:, i], branch=branch)
+    loading_total = 1.0 / inverse_loading
+
+    # get loading of each component by multiplying by mole fractions
+    loadings = fractions * loading_total[:, None]
+
+    # print warning if had to extrapolate isotherm in spreading pressure
+    if not warningoff:
+        for i in range(n_components):
+            max_pressure = isotherms[i].pressure(branch=branch).max()
+            n_extrapolated = numpy.sum(pressure0[:, i] > max_pressure)
+            if n_extrapolated:
+                logger.warning(
+                    textwrap.dedent(
+                        f"""
+                        WARNING:
+                        Component {i:d}: p0 > {max_pressure:.4g} for {n_extrapolated} points,
+                        the highest pressure exhibited in the pure-component
+                        isotherm data. Thus, pyGAPS had to extrapolate the
+                        isotherm data to achieve these IAST results."""
+                    )
+                )
+
+    return loadings
+
+
 def reverse_iast(
     isotherms,
     adsorbed_mole_fractions,
@@ -8,6 +8,11 @@ If adding a custom model, it should be also added below as a string.
 """
 import typing as t
 import importlib
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
 
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.modelling.base_model import IsothermBaseModel
@@ -61,6 +66,9 @@ _IAST_MODELS = [
     "TemkinApprox",
     "Toth",
     "JensenSeaton",
+    "Virial",
+    "FHVST",
+    "WVST",
 ]
 
 
@@ -180,6 +188,9 @@ def model_iso(
     param_guess: dict = None,
     param_bounds: dict = None,
     optimization_params: dict = None,
+    workers: int = None,
+    executor=None,
+    rmse_cutoff: float = None,
     verbose: bool = False,
 ):
     """
@@ -204,12 +215,96 @@ def model_iso(
         Dictionary to be passed to the minimization function to use in fitting model to data.
         See `here
         <https://docs.scipy.org/doc/scipy/reference/optimize.html#module-scipy.optimize>`__.
+    workers : int, optional
+        When guessing, number of processes used to fit the models concurrently.
+    executor : concurrent.futures.Executor, optional
+        When guessing, an executor on which to fit the models concurrently.
+    rmse_cutoff : float, optional
+        When guessing, stop fitting further models once one has a RMSE lower than this value.
     verbose : bool
         Prints out extra information about steps taken.
     """
     from pygaps.core.modelisotherm import ModelIsotherm
     return ModelIsotherm.from_pointisotherm(
         isotherm,
+        branch=branch,
+        model=model,
+        param_guess=param_guess,
+        param_bounds=param_bounds,
+        optimization_params=optimization_params,
+        workers=workers,
+        executor=executor,
+        rmse_cutoff=rmse_cutoff,
+        verbose=verbose,
+    )
+
+
+def model_isotherms(
+    isotherms,
+    branch: str = 'ads',
+    model: t.Union[str, t.List[str], t.Any] = None,
+    param_guess: dict = None,
+    param_bounds: dict = None,
+    optimization_params: dict = None,
+    n_jobs: int = None,
+    chunk_size: int = 1,
+    verbose: bool = False,
+):
+    """
+    Fits many PointIsotherms with a model, in parallel.
+
+    The fits are distributed over a process pool and the results are
+    returned as they complete, which is not necessarily the order of
+    the isotherms. An isotherm which cannot be fitted does not stop
+    the others: the error is returned in its place.
+
+    Parameters
+    ----------
+    isotherms : iterable of PointIsotherm
+        The isotherms to model. Can be a generator, it is consumed
+        as the fits progress.
+    branch : [None, 'ads', 'des'], optional
+        Branch of isotherm to model. Defaults to adsorption branch.
+    model : str, list, 'guess'
+        The model to be used to describe the isotherms, as in :func:`model_iso`.
+    param_guess : dict, optional
+        Starting guess for model parameters in the data fitting routine.
+    param_bounds : dict, optional
+        Bounds for model parameters in the data fitting routine.
+    optimization_params : dict, optional
+        Dictionary to be passed to the minimization function to use in fitting model to data.
+        See `here
+        <https://docs.scipy.org/doc/scipy/reference/optimize.html#module-scipy.optimize>`__.
+    n_jobs : int, optional
+        Number of processes to use. If ``None`` or 1, the isotherms are fitted
+        in the current process. If -1, all available processors are used.
+    chunk_size : int, optional
+        Number of isotherms sent to a process at a time. Larger chunks reduce
+        the communication overhead for quick fits.
+    verbose : bool
+        Prints out extra information about steps taken.
+
+    Yields
+    ------
+    index : int
+        Position of the isotherm in ``isotherms``.
+    model_isotherm : ModelIsotherm or None
+        The fitted isotherm, or None if the fit failed.
+    error : Exception or None
+        The error raised while fitting the isotherm, if any.
+
+    Examples
+    --------
+    >>> results = [None] * len(isotherms)
+    >>> for index, model_isotherm, error in model_isotherms(isotherms, model='Langmuir', n_jobs=4):
+    ...     results[index] = model_isotherm
+    """
+    if chunk_size < 1:
+        raise ParameterError("The chunk size should be a positive integer.")
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+
+    fit_args = dict(
         branch=branch,
         model=model,
         param_guess=param_guess,
@@ -217,3 +312,54 @@ def model_iso(
         optimization_params=optimization_params,
         verbose=verbose,
     )
+
+    chunks = _chunks(isotherms, chunk_size)
+
+    if n_jobs is None or n_jobs <= 1:
+        for start, chunk in chunks:
+            yield from _model_chunk(start, chunk, fit_args)
+        return
+
+    def chunk_results(future, start, size):
+        try:
+            return future.result()
+        except Exception as err:  # the worker itself failed
+            return [(start + i, None, err) for i in range(size)]
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        # only keep a few chunks in flight, to consume the isotherms lazily
+        pending = {}
+        for start, chunk in chunks:
+            future = executor.submit(_model_chunk, start, chunk, fit_args)
+            pending[future] = (start, len(chunk))
+            if len(pending) >= 2 * n_jobs:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from chunk_results(future, *pending.pop(future))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from chunk_results(future, *pending.pop(future))
+
+
+def _chunks(isotherms, chunk_size):
+    """Split an iterable of isotherms in indexed chunks."""
+    iterator = iter(isotherms)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _model_chunk(start, isotherms, fit_args):
+    """Fit a chunk of isotherms, returning the result or error for each."""
+    results = []
+    for index, isotherm in enumerate(isotherms, start):
+        try:
+            results.append((index, model_iso(isotherm, **fit_args), None))
+        except Exception as err:
+            results.append((index, None, err))
+    return results
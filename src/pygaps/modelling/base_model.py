@@ -1,13 +1,15 @@
 """Base class for all isotherm models."""
 
 import abc
+import copy
+import typing as t
 
 import numpy
-from scipy import optimize
 
 from pygaps import logger
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
+from pygaps.utilities.isotherm_interpolator import ModelInterpolator
 
 
 class IsothermBaseModel():
@@ -22,6 +24,14 @@ class IsothermBaseModel():
     calculates: str = None  # loading/pressure
     param_names: "tuple[str]" = ()
     param_default_bounds: "tuple[tuple[float,float]]" = ()
+    # relative tolerance of the interpolation table of the model
+    table_tolerance: float = 1e-6
+    # analytic derivative of the model function to each parameter,
+    # if None the fitting routine uses finite differences
+    jacobian: "t.Callable[[numpy.ndarray, numpy.ndarray], dict[str, numpy.ndarray]]" = None
+    # model function evaluated for an array of parameters, see ``param_array``
+    loading_kernel: "t.Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]" = None
+    pressure_kernel: "t.Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]" = None
 
     #
     # Instance specific
@@ -35,6 +45,8 @@ class IsothermBaseModel():
     loading_range: "tuple[float,float]" = None
     # Model fit on the provided data
     rmse: float = None
+    # The (pressure, loading) data the model was fitted on, if available
+    fit_data: "tuple[numpy.ndarray, numpy.ndarray]" = None
 
     def __init__(self, **params):
         """Populate instance-specific parameters."""
@@ -72,6 +84,10 @@ class IsothermBaseModel():
         self.loading_range = params.pop('loading_range', (numpy.nan, numpy.nan))
         self.rmse = params.pop('rmse', numpy.nan)
 
+        # Interpolation table, built on demand
+        self._table = None
+        self._table_params = None
+
     def __init_parameters__(self, params):
         """Initialize model parameters from isotherm data."""
 
@@ -96,6 +112,38 @@ class IsothermBaseModel():
 
         return ret_string
 
+    @property
+    def param_array(self) -> numpy.ndarray:
+        """Model parameters as an array, in the order of ``param_names``."""
+        return numpy.array([self.params[param] for param in self.param_names], dtype=float)
+
+    @staticmethod
+    def split_params(theta: numpy.ndarray, values: numpy.ndarray) -> "list[numpy.ndarray]":
+        """
+        Split an array of model parameters into one array per parameter.
+
+        Used by the model kernels. If ``theta`` is a 2D array of M parameter
+        sets, each parameter is shaped to broadcast with ``values`` so the
+        kernel returns an array of shape (M, N).
+
+        Parameters
+        ----------
+        theta : array
+            Model parameters in the order of ``param_names``.
+        values : array
+            The pressure or loading passed to the kernel.
+
+        Returns
+        -------
+        list
+            The value of each parameter.
+        """
+        theta = numpy.asarray(theta, dtype=float)
+        if theta.ndim < 2:
+            return list(theta)
+        trailing = (1, ) * numpy.ndim(values)
+        return [param.reshape(param.shape + trailing) for param in numpy.moveaxis(theta, -1, 0)]
+
     def to_dict(self):
         """Convert model to a dictionary."""
         return {
@@ -155,6 +203,57 @@ class IsothermBaseModel():
         """
         return
 
+    def table(self) -> ModelInterpolator:
+        """
+        Return an interpolation table of the model.
+
+        The table is built for the current parameters, and is cached
+        until they change. It is used by models where the loading or
+        spreading pressure cannot be calculated analytically.
+
+        Returns
+        -------
+        ModelInterpolator
+            The table of loading and spreading pressure.
+        """
+        params = tuple(self.params.items())
+        if self._table is None or self._table_params != params:
+            if self.calculates == "loading":
+                self._table = ModelInterpolator(
+                    self.loading,
+                    self.calculates,
+                    self.pressure_range[1],
+                    self.table_tolerance,
+                )
+            else:
+                self._table = ModelInterpolator(
+                    self.pressure,
+                    self.calculates,
+                    self.loading_range[1],
+                    self.table_tolerance,
+                )
+            self._table_params = params
+        return self._table
+
+    def pressure_at_spreading_pressure(self, spreading_pressure: float) -> float:
+        """
+        Calculate the gas pressure at which a spreading pressure is reached.
+
+        This is the inverse of the spreading pressure function,
+        computed from the interpolation table of the model.
+
+        Parameters
+        ----------
+        spreading_pressure : float
+            The spreading pressure at which to calculate the pressure.
+
+        Returns
+        -------
+        float
+            Pressure at specified spreading pressure.
+        """
+        return self.table().pressure_at_spreading_pressure(spreading_pressure)
+
     def initial_guess(self, pressure: "list[float]", loading: "list[float]"):
         """
         Return initial guess for fitting.
@@ -230,29 +329,46 @@ class IsothermBaseModel():
         if verbose:
             logger.info(f"Attempting to model using {self.name}.")
 
-        param_names = list(self.params)
+        param_names = list(self.param_names)
         guess = numpy.array([param_guess[p] for p in param_names])
         bounds = [[self.param_bounds[p][0] for p in param_names],
                   [self.param_bounds[p][1] for p in param_names]]
 
         if self.calculates == "loading":
             fit_func_base = lambda pr, ld: self.loading(pr) - ld
+            fit_kernel = lambda x, pr, ld: self.loading_kernel(pr, x) - ld
+            has_kernel = self.loading_kernel is not None
+            fit_jac_base = lambda x, pr, ld: self.jacobian(pr, x)
             model_range = self.loading_range[1] - self.loading_range[0]
         elif self.calculates == "pressure":
             fit_func_base = lambda pr, ld: self.pressure(ld) - pr
+            fit_kernel = lambda x, pr, ld: self.pressure_kernel(ld, x) - pr
+            has_kernel = self.pressure_kernel is not None
+            fit_jac_base = lambda x, pr, ld: self.jacobian(ld, x)
             model_range = self.pressure_range[1] - self.pressure_range[0]
 
         def fit_func(x, pressure, loading):
+            if has_kernel:  # evaluated without writing to the parameter dict
+                return fit_kernel(x, pressure, loading)
             for i, _ in enumerate(param_names):
                 self.params[param_names[i]] = x[i]
             return fit_func_base(pressure, loading)
 
+        def fit_jac(x, pressure, loading):
+            jacobian = fit_jac_base(x, pressure, loading)
+            return numpy.column_stack([
+                numpy.broadcast_to(jacobian[param], numpy.shape(pressure))
+                for param in param_names
+            ])
+
         fit_args = {
             "fun": fit_func,  # fitting function
             "x0": guess,  # initial guess
             "bounds": bounds,  # supply the bounds of the parameters
             "args": (pressure, loading),  # extra arguments to the fit function
         }
+        if self.jacobian is not None:
+            fit_args["jac"] = fit_jac  # analytic jacobian of the fit function
         if optimization_params:
             fit_args.update(optimization_params)
 
@@ -271,6 +387,7 @@ class IsothermBaseModel():
     def fit_leastsq(self, leastsq_args: dict):
         """Try fitting parameters using least squares."""
         try:
+            from scipy import optimize
             opt_res = optimize.least_squares(**leastsq_args)
         except ValueError as err:
             raise CalculationError(
@@ -286,3 +403,169 @@ class IsothermBaseModel():
                 f"\n{leastsq_args['x0']}\n"
             )
         return opt_res
+
+    def fit_samples(
+        self,
+        pressure: numpy.ndarray,
+        loading: numpy.ndarray,
+        weights: numpy.ndarray = None,
+        param_guess: dict = None,
+        optimization_params: dict = None,
+    ) -> numpy.ndarray:
+        """
+        Fit the model to many samples of the same data at once.
+
+        The data the model calculates (loading or pressure) can be an (M, N)
+        array of M samples, and ``weights`` an (M, N) array of how many times
+        each point counts in a sample. Models with a kernel and the template
+        fitting function are refitted together, with a Levenberg-Marquardt
+        iteration on all the samples starting from ``param_guess``. Samples
+        which do not converge, and other models, are then fitted one by one.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressures of each point.
+        loading : ndarray
+            The loading for each point.
+        weights : ndarray, optional
+            Integer weights of each point in each sample.
+        param_guess : dict, optional
+            The starting point of each fit, defaults to the current parameters.
+        optimization_params : dict
+            Custom parameters to pass to SciPy.optimize.least_squares.
+
+        Returns
+        -------
+        ndarray
+            An (M, n_params) array of parameters, NaN where the fit failed.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        loading = numpy.asarray(loading, dtype=float)
+        if self.calculates == "loading":
+            x, y, kernel = pressure, loading, self.loading_kernel
+        else:
+            x, y, kernel = loading, pressure, self.pressure_kernel
+        if weights is None:
+            weights = numpy.ones_like(y)
+        shape = numpy.broadcast_shapes(numpy.shape(y), numpy.shape(weights))
+        if len(shape) != 2:
+            raise ParameterError("Pass the samples as an array of shape (M, N).")
+        y = numpy.broadcast_to(y, shape)
+        weights = numpy.broadcast_to(weights, shape)
+
+        if param_guess is None:
+            param_guess = self.params
+        guess = numpy.array([param_guess[param] for param in self.param_names], dtype=float)
+        theta = numpy.tile(guess, (shape[0], 1))
+        converged = numpy.zeros(shape[0], dtype=bool)
+
+        if kernel is not None and type(self).fit is IsothermBaseModel.fit:
+            bounds = numpy.array([self.param_bounds[param] for param in self.param_names]).T
+            jacobian = self._jacobian_array if self.jacobian is not None else None
+            theta, converged = _levenberg_marquardt(kernel, x, y, weights, theta, bounds, jacobian)
+
+        # the rest are fitted separately, repeating weighted points
+        if not converged.all():
+            model = copy.deepcopy(self)
+            guess = dict(zip(self.param_names, guess))
+            for index in numpy.flatnonzero(~converged):
+                points = numpy.repeat(numpy.arange(shape[1]), weights[index].astype(int))
+                sample = (x[points], y[index, points])
+                if self.calculates == "pressure":
+                    sample = sample[::-1]
+                try:
+                    model.fit(*sample, dict(guess), copy.copy(optimization_params))
+                    theta[index] = model.param_array
+                except CalculationError:
+                    theta[index] = numpy.nan
+
+        return theta
+
+    def _jacobian_array(self, values, theta):
+        """The jacobian for M parameter sets, as an (M, N, n_params) array."""
+        derivatives = self.jacobian(values, theta)
+        return numpy.stack([
+            numpy.broadcast_to(derivatives[param], (len(theta), len(values)))
+            for param in self.param_names
+        ], axis=-1)
+
+
+def _levenberg_marquardt(kernel, x, y, weights, theta, bounds, jacobian=None, max_iter=200, tol=1e-10):
+    """
+    Minimise the weighted squared residuals of a kernel for many samples.
+
+    Each row of ``y`` and ``theta`` is an independent problem, stepped together
+    with a damped Gauss-Newton iteration. The ``jacobian`` of the kernel, which
+    returns an (M, N, n_params) array for M parameter sets, is used if given,
+    otherwise a finite difference jacobian. Steps are clipped to the parameter
+    bounds. Returns the parameters and which samples converged.
+    """
+    theta = theta.copy()
+    root_weights = numpy.sqrt(weights)
+    n_samples, n_params = theta.shape
+
+    def residuals(rows, params):
+        with numpy.errstate(all='ignore'):
+            return root_weights[rows] * (kernel(x, params) - y[rows])
+
+    rows = numpy.arange(n_samples)
+    res = residuals(rows, theta)
+    cost = numpy.sum(res**2, axis=1)
+    damping = numpy.full(n_samples, 1e-3)
+    converged = ~numpy.isfinite(cost)  # removed here, failed in the end
+    failed = converged.copy()
+
+    for _ in range(max_iter):
+        rows = numpy.flatnonzero(~converged)
+        if rows.size == 0:
+            break
+        params = theta[rows]
+
+        if jacobian is not None:
+            with numpy.errstate(all='ignore'):
+                jac = root_weights[rows, :, None] * jacobian(x, params)
+        else:
+            # forward differences as in scipy, stepping away from the upper bound
+            step = 1.5e-8 * numpy.maximum(numpy.abs(params), 1.0)
+            step = numpy.where(params + step > bounds[1], -step, step)
+            jac = numpy.empty(res[rows].shape + (n_params, ))
+            for index in range(n_params):
+                stepped = params.copy()
+                stepped[:, index] += step[:, index]
+                jac[..., index] = (residuals(rows, stepped) - res[rows]) / step[:, index, None]
+
+        usable = numpy.isfinite(jac).all(axis=(1, 2))
+        jac[~usable] = 0
+        hessian = numpy.einsum('mni,mnj->mij', jac, jac)
+        gradient = numpy.einsum('mni,mn->mi', jac, res[rows])
+        # parameters held at a bound are not stepped
+        held = ((params <= bounds[0]) & (gradient > 0)) | ((params >= bounds[1]) & (gradient < 0))
+        hessian[held[:, :, None] | held[:, None, :]] = 0
+        gradient[held] = 0
+        scale = numpy.diagonal(hessian, axis1=1, axis2=2)
+        scale = numpy.where(scale > 0, scale, 1.0)
+        hessian[:, numpy.arange(n_params), numpy.arange(n_params)] += damping[rows, None] * scale
+        delta = -numpy.linalg.solve(hessian, gradient[..., None])[..., 0]
+
+        trial = numpy.clip(params + delta, bounds[0], bounds[1])
+        trial_res = residuals(rows, trial)
+        trial_cost = numpy.sum(trial_res**2, axis=1)
+        accept = usable & (trial_cost <= cost[rows])
+
+        small_cost = cost[rows] - trial_cost <= tol * cost[rows]
+        small_step = numpy.all(
+            numpy.abs(trial - params) <= tol * (tol + numpy.abs(params)), axis=1
+        )
+        accepted = rows[accept]
+        theta[accepted] = trial[accept]
+        res[accepted] = trial_res[accept]
+        cost[accepted] = trial_cost[accept]
+        damping[accepted] /= 3
+        damping[rows[~accept]] *= 2
+
+        converged[rows[accept & (small_cost | small_step) & (damping[rows] < 1)]] = True
+        failed[rows[~usable]] = True
+        converged[rows[~usable]] = True
+
+    return theta, converged & ~failed
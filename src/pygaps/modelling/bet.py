@@ -127,11 +127,55 @@ class BET(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        nm = self.params['n_m']
-        N = self.params['N']
-        C = self.params['C']
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        nm, C, N = self.split_params(theta, pressure)
         return nm * C * pressure / ((1.0 - N * pressure) * (1.0 - N * pressure + C * pressure))
 
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        nm, C, N = self.split_params(theta, pressure)
+        denom_1 = 1.0 - N * pressure
+        denom_2 = 1.0 - N * pressure + C * pressure
+        return {
+            "n_m": C * pressure / (denom_1 * denom_2),
+            "C": nm * pressure / denom_2**2,
+            "N": nm * C * pressure**2 * (denom_1 + denom_2) / (denom_1 * denom_2)**2,
+        }
+
     def pressure(self, loading):
         """
         Calculate pressure at specified loading.
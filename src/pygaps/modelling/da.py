@@ -2,7 +2,7 @@
 
 import numpy
 from scipy import constants
-from scipy import integrate
+from scipy import special
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
@@ -78,11 +78,59 @@ class DA(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        nm = self.params['n_m']
-        e = self.params['e']
-        m = self.params['m']
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        nm, e, m = self.split_params(theta, pressure)
         return nm * numpy.exp(-(self.minus_rt * numpy.log(pressure) / e)**m)
 
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        nm, e, m = self.split_params(theta, pressure)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            ratio = self.minus_rt * numpy.log(pressure) / e
+            ratio_m = ratio**m
+            exponential = numpy.exp(-ratio_m)
+            d_e = numpy.where(exponential > 0, nm * exponential * m * ratio_m / e, 0)
+            d_m = numpy.where(exponential > 0, -nm * exponential * special.xlogy(ratio_m, ratio), 0)
+        return {
+            "n_m": exponential,
+            "e": d_e,
+            "m": d_m,
+        }
+
     def pressure(self, loading):
         r"""
         Calculate pressure at specified loading.
@@ -121,7 +169,8 @@ class DA(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the DA model cannot be solved analytically
-        and must be calculated numerically.
+        and is calculated numerically, by interpolating a table of the
+        model which is cached for the current parameters.
 
         Parameters
         ----------
@@ -133,7 +182,7 @@ class DA(IsothermBaseModel):
         float
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self.table().spreading_pressure_at(pressure)
 
     def initial_guess(self, pressure, loading):
         """
@@ -2,7 +2,6 @@
 
 import numpy
 from scipy import constants
-from scipy import integrate
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
@@ -74,10 +73,56 @@ class DR(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        nm = self.params['n_m']
-        e = self.params['e']
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        nm, e = self.split_params(theta, pressure)
         return nm * numpy.exp(-(self.minus_rt * numpy.log(pressure) / e)**2)
 
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        nm, e = self.split_params(theta, pressure)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            potential = self.minus_rt * numpy.log(pressure)
+            exponential = numpy.exp(-(potential / e)**2)
+            d_e = numpy.where(exponential > 0, 2 * nm * exponential * potential**2 / e**3, 0)
+        return {
+            "n_m": exponential,
+            "e": d_e,
+        }
+
     def pressure(self, loading):
         r"""
         Calculate pressure at specified loading.
@@ -115,7 +160,8 @@ class DR(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the DR model cannot be solved analytically
-        and must be calculated numerically.
+        and is calculated numerically, by interpolating a table of the
+        model which is cached for the current parameters.
 
         Parameters
         ----------
@@ -127,7 +173,7 @@ class DR(IsothermBaseModel):
         float
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self.table().spreading_pressure_at(pressure)
 
     def initial_guess(self, pressure, loading):
         """
@@ -64,9 +64,57 @@ class DSLangmuir(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        k1p = self.params["K1"] * pressure
-        k2p = self.params["K2"] * pressure
-        return self.params["n_m1"] * k1p / (1.0 + k1p) + self.params["n_m2"] * k2p / (1.0 + k2p)
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        nm1, K1, nm2, K2 = self.split_params(theta, pressure)
+        k1p = K1 * pressure
+        k2p = K2 * pressure
+        return nm1 * k1p / (1.0 + k1p) + nm2 * k2p / (1.0 + k2p)
+
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        nm1, K1, nm2, K2 = self.split_params(theta, pressure)
+        k1p = K1 * pressure
+        k2p = K2 * pressure
+        return {
+            "n_m1": k1p / (1.0 + k1p),
+            "K1": nm1 * pressure / (1.0 + k1p)**2,
+            "n_m2": k2p / (1.0 + k2p),
+            "K2": nm2 * pressure / (1.0 + k2p)**2,
+        }
 
     def pressure(self, loading):
         """
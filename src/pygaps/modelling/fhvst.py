@@ -1,10 +1,8 @@
 """Flory-Huggins-VST isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
-from pygaps.utilities.exceptions import CalculationError
 
 
 class FHVST(IsothermBaseModel):
@@ -89,7 +87,8 @@ class FHVST(IsothermBaseModel):
 
         Careful!
         For the FH-VST model, the loading has to
-        be computed numerically.
+        be computed numerically. It is interpolated from a table
+        of the model which is cached for the current parameters.
 
         Parameters
         ----------
@@ -101,15 +100,7 @@ class FHVST(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        def fun(x):
-            return self.pressure(x) - pressure
-
-        opt_res = optimize.root(fun, numpy.zeros_like(pressure), method='hybr')
-
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {pressure} failed.")
-
-        return opt_res.x
+        return self.table().loading_at(pressure)
 
     def pressure(self, loading):
         """
@@ -127,9 +118,26 @@ class FHVST(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        nm = self.params["n_m"]
-        K = self.params["K"]
-        a1v = self.params["a1v"]
+        return self.pressure_kernel(loading, self.param_array)
+
+    def pressure_kernel(self, loading, theta):
+        """
+        Calculate pressure at specified loading for one or more parameter sets.
+
+        Parameters
+        ----------
+        loading : array
+            The loadings at which to calculate the pressure.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of pressures.
+
+        Returns
+        -------
+        array
+            Pressure at specified loading.
+        """
+        nm, K, a1v = self.split_params(theta, loading)
         cov = loading / nm
         return (nm / K) * (cov / (1 - cov)) * numpy.exp(a1v**2 * cov / (1 + a1v * cov))
 
@@ -145,7 +153,8 @@ class FHVST(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the FH-VST model cannot be solved analytically
-        and must be calculated numerically.
+        and is calculated numerically, by interpolating a table of the
+        model which is cached for the current parameters.
 
         Parameters
         ----------
@@ -157,7 +166,7 @@ class FHVST(IsothermBaseModel):
         float
             Spreading pressure at specified pressure.
         """
-        return NotImplementedError
+        return self.table().spreading_pressure_at(pressure)
 
     def initial_guess(self, pressure, loading):
         """
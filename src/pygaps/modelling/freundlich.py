@@ -1,6 +1,7 @@
 """Freundlich isotherm model."""
 
 import numpy
+from scipy import special
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
@@ -69,7 +70,52 @@ class Freundlich(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        return self.params["K"] * pressure**(1 / self.params["m"])
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        K, m = self.split_params(theta, pressure)
+        return K * pressure**(1 / m)
+
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        K, m = self.split_params(theta, pressure)
+        p_m = pressure**(1 / m)
+        return {
+            "K": p_m,
+            "m": -K * special.xlogy(p_m, pressure) / m**2,
+        }
 
     def pressure(self, loading):
         r"""
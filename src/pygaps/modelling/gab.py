@@ -53,11 +53,58 @@ class GAB(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        nm = self.params['n_m']
-        C = self.params['C']
-        Kp = self.params['K'] * pressure
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        nm, C, K = self.split_params(theta, pressure)
+        Kp = K * pressure
         return nm * C * Kp / ((1.0 - Kp) * (1.0 - Kp + C * Kp))
 
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        nm, C, K = self.split_params(theta, pressure)
+        Kp = K * pressure
+        denom_1 = 1.0 - Kp
+        denom_2 = 1.0 - Kp + C * Kp
+        return {
+            "n_m": C * Kp / (denom_1 * denom_2),
+            "C": nm * Kp / denom_2**2,
+            "K": nm * C * pressure / (denom_1 * denom_2) *
+            (1.0 + Kp * (denom_2 - (C - 1.0) * denom_1) / (denom_1 * denom_2)),
+        }
+
     def pressure(self, loading):
         """
         Calculate pressure at specified loading.
@@ -43,7 +43,7 @@ class Henry(IsothermBaseModel):
     name = 'Henry'
     formula = r"n(p) = K_H p"
     calculates = 'loading'
-    param_names = ("K")
+    param_names = ("K", )
     param_default_bounds = ((0., numpy.inf), )
 
     def loading(self, pressure):
@@ -60,7 +60,47 @@ class Henry(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        return self.params["K"] * pressure
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        K, = self.split_params(theta, pressure)
+        return K * pressure
+
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        return {"K": pressure}
 
     def pressure(self, loading):
         """
@@ -1,8 +1,7 @@
 """Jensen-Seaton isotherm model."""
 
 import numpy
-from scipy import integrate
-from scipy import optimize
+from scipy import special
 
 from pygaps.modelling.base_model import IsothermBaseModel
 from pygaps.utilities.exceptions import CalculationError
@@ -74,12 +73,62 @@ class JensenSeaton(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        Kp = self.params["K"] * pressure
-        a = self.params["a"]
-        b = self.params["b"]
-        c = self.params["c"]
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        K, a, b, c = self.split_params(theta, pressure)
+        Kp = K * pressure
         return Kp / (1 + (Kp / (a * (1 + b * pressure)))**c)**(1 / c)
 
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        K, a, b, c = self.split_params(theta, pressure)
+        Kp = K * pressure
+        ratio = Kp / (a * (1 + b * pressure))
+        ratio_c = ratio**c
+        denominator = 1 + ratio_c
+        loading = Kp / denominator**(1 / c)
+        return {
+            "K": pressure / denominator**(1 / c + 1),
+            "a": loading * ratio_c / (a * denominator),
+            "b": loading * ratio_c * pressure / ((1 + b * pressure) * denominator),
+            "c": loading * (
+                numpy.log(denominator) / c**2 - special.xlogy(ratio_c, ratio) / (c * denominator)
+            ),
+        }
+
     def pressure(self, loading):
         """
         Calculate pressure at specified loading.
@@ -100,6 +149,7 @@ class JensenSeaton(IsothermBaseModel):
         def fun(x):
             return self.loading(x) - loading
 
+        from scipy import optimize
         opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
 
         if not opt_res.success:
@@ -119,7 +169,8 @@ class JensenSeaton(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the Jensen-Seaton model cannot be solved analytically
-        and must be calculated numerically.
+        and is calculated numerically, by interpolating a table of the
+        model which is cached for the current parameters.
 
         Parameters
         ----------
@@ -131,7 +182,7 @@ class JensenSeaton(IsothermBaseModel):
         float
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self.table().spreading_pressure_at(pressure)
 
     def initial_guess(self, pressure, loading):
         """
@@ -99,8 +99,53 @@ class Langmuir(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        kp = self.params["K"] * pressure
-        return self.params["n_m"] * kp / (1.0 + kp)
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        K, n_m = self.split_params(theta, pressure)
+        kp = K * pressure
+        return n_m * kp / (1.0 + kp)
+
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        K, n_m = self.split_params(theta, pressure)
+        kp = K * pressure
+        return {
+            "n_m": kp / (1.0 + kp),
+            "K": n_m * pressure / (1.0 + kp)**2,
+        }
 
     def pressure(self, loading):
         r"""
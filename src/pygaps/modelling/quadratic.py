@@ -60,11 +60,55 @@ class Quadratic(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        nm = self.params["n_m"]
-        Ka = self.params["Ka"]
-        Kb = self.params["Kb"]
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        nm, Ka, Kb = self.split_params(theta, pressure)
         return nm * (Ka + 2.0 * Kb * pressure) * pressure / (1.0 + Ka * pressure + Kb * pressure**2)
 
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        nm, Ka, Kb = self.split_params(theta, pressure)
+        numerator = (Ka + 2.0 * Kb * pressure) * pressure
+        denominator = 1.0 + Ka * pressure + Kb * pressure**2
+        return {
+            "n_m": numerator / denominator,
+            "Ka": nm * pressure * (denominator - numerator) / denominator**2,
+            "Kb": nm * pressure**2 * (2.0 * denominator - numerator) / denominator**2,
+        }
+
     def pressure(self, loading):
         """
         Calculate pressure at specified loading.
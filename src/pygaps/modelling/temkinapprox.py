@@ -1,7 +1,6 @@
 """Temkin Approximation isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
 from pygaps.utilities.exceptions import CalculationError
@@ -61,12 +60,57 @@ class TemkinApprox(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        n_m = self.params["n_m"]
-        Kp = self.params["K"] * pressure
-        tht = self.params["tht"]
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        n_m, K, tht = self.split_params(theta, pressure)
+        Kp = K * pressure
         lang_load = Kp / (1.0 + Kp)
         return n_m * (lang_load + tht * lang_load**2 * (lang_load - 1))
 
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        n_m, K, tht = self.split_params(theta, pressure)
+        Kp = K * pressure
+        lang_load = Kp / (1.0 + Kp)
+        return {
+            "n_m": lang_load + tht * lang_load**2 * (lang_load - 1),
+            "K": n_m * (1.0 + tht * lang_load * (3.0 * lang_load - 2.0)) * pressure / (1.0 + Kp)**2,
+            "tht": n_m * lang_load**2 * (lang_load - 1),
+        }
+
     def pressure(self, loading):
         """
         Calculate pressure at specified loading.
@@ -87,6 +131,7 @@ class TemkinApprox(IsothermBaseModel):
         def fun(x):
             return self.loading(x) - loading
 
+        from scipy import optimize
         opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
 
         if not opt_res.success:
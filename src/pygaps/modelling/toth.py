@@ -1,7 +1,7 @@
 """Toth isotherm model."""
 
 import numpy
-from scipy import integrate
+from scipy import special
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
@@ -51,11 +51,57 @@ class Toth(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        n_m = self.params["n_m"]
-        Kp = self.params["K"] * pressure
-        t = self.params["t"]
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        n_m, K, t = self.split_params(theta, pressure)
+        Kp = K * pressure
         return n_m * Kp / (1.0 + (Kp)**t)**(1 / t)
 
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        n_m, K, t = self.split_params(theta, pressure)
+        Kp = K * pressure
+        Kp_t = Kp**t
+        loading = n_m * Kp / (1.0 + Kp_t)**(1 / t)
+        return {
+            "n_m": Kp / (1.0 + Kp_t)**(1 / t),
+            "K": n_m * pressure / (1.0 + Kp_t)**(1 / t + 1),
+            "t": loading * (numpy.log1p(Kp_t) / t**2 - special.xlogy(Kp_t, Kp) / (t * (1.0 + Kp_t))),
+        }
+
     def pressure(self, loading):
         r"""
         Calculate pressure at specified loading.
@@ -94,7 +140,8 @@ class Toth(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the Toth model cannot be solved analytically
-        and must be calculated numerically.
+        and is calculated numerically, by interpolating a table of the
+        model which is cached for the current parameters.
 
         Parameters
         ----------
@@ -106,7 +153,7 @@ class Toth(IsothermBaseModel):
         float
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self.table().spreading_pressure_at(pressure)
 
     def initial_guess(self, pressure, loading):
         """
@@ -1,7 +1,6 @@
 """Triple Site Langmuir isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
 from pygaps.utilities.exceptions import CalculationError
@@ -69,12 +68,61 @@ class TSLangmuir(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        k1p = self.params["K1"] * pressure
-        k2p = self.params["K2"] * pressure
-        k3p = self.params["K3"] * pressure
-        return self.params["n_m1"] * k1p / (1.0 + k1p) + \
-            self.params["n_m2"] * k2p / (1.0 + k2p) + \
-            self.params["n_m3"] * k3p / (1.0 + k3p)
+        return self.loading_kernel(pressure, self.param_array)
+
+    def loading_kernel(self, pressure, theta):
+        """
+        Calculate loading at specified pressure for one or more parameter sets.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the loading.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of loadings.
+
+        Returns
+        -------
+        array
+            Loading at specified pressure.
+        """
+        nm1, nm2, nm3, K1, K2, K3 = self.split_params(theta, pressure)
+        k1p = K1 * pressure
+        k2p = K2 * pressure
+        k3p = K3 * pressure
+        return nm1 * k1p / (1.0 + k1p) + nm2 * k2p / (1.0 + k2p) + nm3 * k3p / (1.0 + k3p)
+
+    def jacobian(self, pressure, theta):
+        """
+        Calculate the derivatives of the loading to each model parameter.
+
+        Used for fitting the model.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the loading to each parameter.
+        """
+        nm1, nm2, nm3, K1, K2, K3 = self.split_params(theta, pressure)
+        k1p = K1 * pressure
+        k2p = K2 * pressure
+        k3p = K3 * pressure
+        return {
+            "n_m1": k1p / (1.0 + k1p),
+            "n_m2": k2p / (1.0 + k2p),
+            "n_m3": k3p / (1.0 + k3p),
+            "K1": nm1 * pressure / (1.0 + k1p)**2,
+            "K2": nm2 * pressure / (1.0 + k2p)**2,
+            "K3": nm3 * pressure / (1.0 + k3p)**2,
+        }
 
     def pressure(self, loading):
         """
@@ -96,6 +144,7 @@ class TSLangmuir(IsothermBaseModel):
         def fun(x):
             return self.loading(x) - loading
 
+        from scipy import optimize
         opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
 
         if not opt_res.success:
@@ -1,7 +1,6 @@
 """Virial isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps import logger
 from pygaps.graphing.calc_graphs import virial_plot
@@ -58,7 +57,8 @@ class Virial(IsothermBaseModel):
 
         Careful!
         For the Virial model, the loading has to
-        be computed numerically.
+        be computed numerically. It is interpolated from a table
+        of the model which is cached for the current parameters.
 
         Parameters
         ----------
@@ -70,15 +70,7 @@ class Virial(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        def fun(x):
-            return (self.pressure(x) - pressure)**2
-
-        opt_res = optimize.minimize(fun, pressure, method='Nelder-Mead')
-
-        if not opt_res.success:
-            raise CalculationError(f"Root finding failed. Error: \n\t{opt_res.message}")
-
-        return opt_res.x
+        return self.table().loading_at(pressure)
 
     def pressure(self, loading):
         """
@@ -96,10 +88,52 @@ class Virial(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        return loading * numpy.exp(
-            -numpy.log(self.params['K']) + self.params['A'] * loading +
-            self.params['B'] * loading**2 + self.params['C'] * loading**3
-        )
+        return self.pressure_kernel(loading, self.param_array)
+
+    def pressure_kernel(self, loading, theta):
+        """
+        Calculate pressure at specified loading for one or more parameter sets.
+
+        Parameters
+        ----------
+        loading : array
+            The loadings at which to calculate the pressure.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of pressures.
+
+        Returns
+        -------
+        array
+            Pressure at specified loading.
+        """
+        K, A, B, C = self.split_params(theta, loading)
+        return loading * numpy.exp(-numpy.log(K) + A * loading + B * loading**2 + C * loading**3)
+
+    def jacobian(self, loading, theta):
+        """
+        Calculate the derivatives of the pressure to each model parameter.
+
+        Parameters
+        ----------
+        loading : array
+            The loadings at which to calculate the derivatives.
+        theta : array
+            Model parameters in the order of ``param_names``.
+
+        Returns
+        -------
+        dict
+            Derivative of the pressure to each parameter.
+        """
+        K = self.split_params(theta, loading)[0]
+        pressure = self.pressure_kernel(loading, theta)
+        return {
+            "K": -pressure / K,
+            "A": pressure * loading,
+            "B": pressure * loading**2,
+            "C": pressure * loading**3,
+        }
 
     def spreading_pressure(self, pressure):
         r"""
@@ -112,8 +146,12 @@ class Virial(IsothermBaseModel):
 
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
-        The integral for the Virial model cannot be solved analytically
-        and must be calculated numerically.
+        For the Virial model, the integral can be solved analytically
+        in terms of the loading at the specified pressure.
+
+        .. math::
+
+            \pi = n + \frac{A}{2} n^2 + \frac{2B}{3} n^3 + \frac{3C}{4} n^4
 
         Parameters
         ----------
@@ -125,7 +163,11 @@ class Virial(IsothermBaseModel):
         float
             Spreading pressure at specified pressure.
         """
-        raise NotImplementedError
+        loading = self.loading(pressure)
+        return loading * (
+            1 + self.params['A'] * loading / 2 + 2 * self.params['B'] * loading**2 / 3 +
+            3 * self.params['C'] * loading**3 / 4
+        )
 
     def initial_guess(self, pressure, loading):
         """
@@ -214,8 +256,18 @@ class Virial(IsothermBaseModel):
             return self.params['C'] * L**3 + self.params['B'] * L**2 \
                 + self.params['A'] * L - numpy.log(self.params['K']) - ln_p_over_n
 
+        def fit_jac(x, L, ln_p_over_n):
+            derivatives = {
+                'K': numpy.full(L.shape, -1 / x[param_names.index('K')]),
+                'A': L,
+                'B': L**2,
+                'C': L**3,
+            }
+            return numpy.column_stack([derivatives[param] for param in param_names])
+
         kwargs = dict(
             fun=fit_func,  # fitting function
+            jac=fit_jac,  # analytic jacobian of the fitting function
             x0=guess,  # initial guess
             bounds=bounds,  # bounds of the parameters
             args=(loading, ln_p_over_n),  # extra arguments to the fit function
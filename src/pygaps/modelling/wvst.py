@@ -1,10 +1,8 @@
 """Wilson-VST isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
-from pygaps.utilities.exceptions import CalculationError
 
 
 class WVST(IsothermBaseModel):
@@ -83,7 +81,8 @@ class WVST(IsothermBaseModel):
 
         Careful!
         For the W-VST model, the loading has to
-        be computed numerically.
+        be computed numerically. It is interpolated from a table
+        of the model which is cached for the current parameters.
 
         Parameters
         ----------
@@ -96,15 +95,7 @@ class WVST(IsothermBaseModel):
             Loading at specified pressure.
 
         """
-        def fun(x):
-            return self.pressure(x) - pressure
-
-        opt_res = optimize.root(fun, numpy.zeros_like(pressure), method='hybr')
-
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {pressure} failed.")
-
-        return opt_res.x
+        return self.table().loading_at(pressure)
 
     def pressure(self, loading):
         """
@@ -123,18 +114,33 @@ class WVST(IsothermBaseModel):
             Pressure at specified loading.
 
         """
-        n_m = self.params["n_m"]
-        Lv1 = self.params["Lv1"]
-        L1v = self.params["L1v"]
+        return self.pressure_kernel(loading, self.param_array)
+
+    def pressure_kernel(self, loading, theta):
+        """
+        Calculate pressure at specified loading for one or more parameter sets.
+
+        Parameters
+        ----------
+        loading : array
+            The loadings at which to calculate the pressure.
+        theta : array
+            Model parameters in the order of ``param_names``, or a 2D
+            array of M parameter sets giving an (M, N) array of pressures.
+
+        Returns
+        -------
+        array
+            Pressure at specified loading.
+        """
+        n_m, K, L1v, Lv1 = self.split_params(theta, loading)
         cov = loading / n_m
         covX1minLv1 = (1 - Lv1) * cov
         covX1minL1v = (1 - L1v) * cov
 
         coef = L1v * (1 - covX1minLv1) / (L1v + covX1minL1v)
         expcoef = -((Lv1 * covX1minLv1) / (1 - covX1minLv1)) - (covX1minL1v / (L1v + covX1minL1v))
-        res = (n_m / self.params["K"] * cov / (1 - cov)) * coef * numpy.exp(expcoef)
-
-        return res
+        return (n_m / K * cov / (1 - cov)) * coef * numpy.exp(expcoef)
 
     def spreading_pressure(self, pressure):
         r"""
@@ -148,7 +154,8 @@ class WVST(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the W-VST model cannot be solved analytically
-        and must be calculated numerically.
+        and is calculated numerically, by interpolating a table of the
+        model which is cached for the current parameters.
 
         Parameters
         ----------
@@ -160,7 +167,7 @@ class WVST(IsothermBaseModel):
         float
             Spreading pressure at specified pressure.
         """
-        return NotImplementedError
+        return self.table().spreading_pressure_at(pressure)
 
     def initial_guess(self, pressure, loading):
         """
@@ -17,6 +17,7 @@ from .json import isotherm_to_json
 from .sqlite import isotherms_from_db
 from .sqlite import isotherm_delete_db
 from .sqlite import isotherm_to_db
+from .sqlite import isotherms_to_db
 from .sqlite import adsorbates_from_db
 from .sqlite import adsorbate_delete_db
 from .sqlite import adsorbate_to_db
@@ -5,6 +5,7 @@ This module contains the sql interface for data manipulation.
 import functools
 import json
 import sqlite3
+import typing as t
 
 import pandas
 
@@ -25,7 +26,16 @@ from pygaps.utilities.sqlite_utilities import build_insert
 from pygaps.utilities.sqlite_utilities import build_select
 from pygaps.utilities.sqlite_utilities import build_update
 from pygaps.utilities.sqlite_utilities import check_SQL_bool
-from pygaps.utilities.sqlite_utilities import find_SQL_python_type
+from pygaps.utilities.sqlite_utilities import decode_SQL_array
+from pygaps.utilities.sqlite_utilities import encode_SQL_array
+
+
+def _connect(db_path: str = None) -> sqlite3.Connection:
+    """Open a connection to the database, the internal one by default."""
+    conn = sqlite3.connect(db_path if db_path else DATABASE)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys = ON')
+    return conn
 
 
 def with_connection(func):
@@ -37,15 +47,13 @@ def with_connection(func):
         if kwargs.get('cursor'):
             return func(*args, **kwargs)
 
-        db_path = kwargs.get('db_path', DATABASE)
-        db_path = db_path if db_path else DATABASE
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        # Connections from a session are kept open
+        session = kwargs.get('session')
+        conn = session.connection if session else _connect(kwargs.get('db_path'))
 
         try:
             # Get a cursor object
             cursor = conn.cursor()
-            cursor.execute('PRAGMA foreign_keys = ON')
             ret = func(*args, **kwargs, cursor=cursor)
 
         except sqlite3.IntegrityError as err:
@@ -56,17 +64,81 @@ def with_connection(func):
             conn.rollback()
             raise ParsingError(err) from err
 
+        except BaseException:
+            # a session connection is reused, so nothing can be left pending
+            conn.rollback()
+            raise
+
         else:
             conn.commit()
 
         finally:
-            conn.close()
+            if not session:
+                conn.close()
 
         return ret
 
     return wrapper
 
 
+class Session():
+    """
+    A connection to the database which is kept open between calls.
+
+    Each function in this module otherwise opens and sets up a new
+    connection. A session keeps one connection, tuned for repeated
+    use, and is passed to the functions as the ``session`` argument.
+    Changes are committed after each function call, as without a session.
+
+    Like any sqlite connection, a session should only be used
+    in the thread which created it.
+
+    Parameters
+    ----------
+    db_path : str, None
+        Path to the database. If none is specified, internal database is used.
+    pragmas : dict, optional
+        SQLite pragmas to set on the connection, in addition to or
+        replacing the default ones in ``Session.pragmas``.
+
+    Examples
+    --------
+    >>> with Session(db_path) as session:
+    ...     material_to_db(material, session=session)
+    ...     isotherms = isotherms_from_db(session=session)
+
+    """
+
+    pragmas = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 268435456,  # 256 MB
+        'cache_size': -65536,  # 64 MB
+        'temp_store': 'MEMORY',
+    }
+
+    def __init__(self, db_path: str = None, pragmas: dict = None):
+        self.db_path = db_path if db_path else DATABASE
+        self.connection = _connect(self.db_path)
+        for pragma, value in {**self.pragmas, **(pragmas or {})}.items():
+            self.connection.execute(f'PRAGMA {pragma} = {value};')
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def cursor(self) -> sqlite3.Cursor:
+        """Return a new cursor on the session connection."""
+        return self.connection.cursor()
+
+    def close(self):
+        """Commit any changes and close the connection."""
+        self.connection.commit()
+        self.connection.close()
+
+
 # ---------------------- General functions
 
 
@@ -824,6 +896,15 @@ def material_property_type_delete_db(
 
 # ---------------------- Isotherms
 
+_SQL_INSERT_ISOTHERM_PROPERTIES = build_insert(
+    table='isotherm_properties',
+    to_insert=['iso_id', 'type', 'value'],
+)
+_SQL_INSERT_ISOTHERM_DATA = build_insert(
+    table='isotherm_data',
+    to_insert=['iso_id', 'type', 'dtype', 'data'],
+)
+
 
 @with_connection
 def isotherm_to_db(
@@ -831,6 +912,7 @@ def isotherm_to_db(
     db_path: str = None,
     autoinsert_material: bool = True,
     autoinsert_adsorbate: bool = True,
+    data_encoding: str = "json",
     verbose: bool = True,
     **kwargs: dict,
 ):
@@ -852,12 +934,174 @@ def isotherm_to_db(
     autoinsert_adsorbate: bool, True
         Whether to automatically insert an isotherm adsorbate if it is not found
         in the database.
+    data_encoding : str, 'json'
+        How the isotherm data columns are stored: as JSON text (``json``),
+        numeric columns as raw binary (``binary``) or as compressed
+        binary (``zlib``). All encodings are read back by `isotherms_from_db`.
     verbose : bool, True
         Extra information printed to console.
     """
 
     cursor = kwargs['cursor']
-    # Checks
+    _autoinsert(isotherm, autoinsert_material, autoinsert_adsorbate, db_path, cursor)
+
+    upload_dict, properties, data = _isotherm_rows(isotherm, data_encoding)
+
+    # Upload isotherm info to database
+    db_columns = ["id", "iso_type"] + BaseIsotherm._required_params
+    try:
+        cursor.execute(build_insert(table='isotherms', to_insert=db_columns), upload_dict)
+    except sqlite3.Error as err:
+        raise type(err)(
+            f"""Error inserting isotherm "{upload_dict["id"]}" base properties. """
+            f"""Ensure material "{upload_dict["material"]}", and adsorbate "{upload_dict["adsorbate"]}" """
+            f"""exist in the database. Original error:\n {err}"""
+        ) from None
+
+    # Upload the other isotherm parameters
+    cursor.executemany(_SQL_INSERT_ISOTHERM_PROPERTIES, properties)
+
+    # Then, the isotherm data/model will be uploaded into the data table
+    cursor.executemany(_SQL_INSERT_ISOTHERM_DATA, data)
+
+    if verbose:
+        # Print success
+        logger.info(f"Isotherm uploaded: '{isotherm.iso_id}'")
+
+
+def isotherms_to_db(
+    isotherms: "t.Iterable[BaseIsotherm | PointIsotherm | ModelIsotherm]",
+    db_path: str = None,
+    batch_size: int = 1000,
+    autoinsert_material: bool = True,
+    autoinsert_adsorbate: bool = True,
+    drop_indexes: bool = False,
+    data_encoding: str = "json",
+    verbose: bool = True,
+    session: Session = None,
+) -> int:
+    """
+    Upload many isotherms to the database in bulk.
+
+    The isotherms are inserted with multi-row statements, in a single
+    transaction per batch. The database is switched to WAL journal mode
+    and foreign keys are checked at the end of each batch.
+    If a batch fails, it is rolled back and the previous batches are kept.
+
+    Parameters
+    ----------
+    isotherms : iterable of Isotherms
+        Isotherm, PointIsotherm or ModelIsotherm objects to upload. A generator
+        is consumed one batch at a time.
+    db_path : str, None
+        Path to the database. If none is specified, internal database is used.
+    batch_size : int, 1000
+        Number of isotherms uploaded in each transaction.
+    autoinsert_material: bool, True
+        Whether to automatically insert an isotherm material if it is not found
+        in the database.
+    autoinsert_adsorbate: bool, True
+        Whether to automatically insert an isotherm adsorbate if it is not found
+        in the database.
+    drop_indexes : bool, False
+        Drop the indexes of the isotherm tables during the upload, and
+        recreate them at the end. Faster for large uploads.
+    data_encoding : str, 'json'
+        How the isotherm data columns are stored: as JSON text (``json``),
+        numeric columns as raw binary (``binary``) or as compressed
+        binary (``zlib``). All encodings are read back by `isotherms_from_db`.
+    verbose : bool, True
+        Extra information printed to console.
+    session : Session, optional
+        An open session to upload through, instead of a new connection.
+
+    Returns
+    -------
+    int
+        The number of isotherms uploaded.
+    """
+    if batch_size < 1:
+        raise ParsingError("The batch size must be at least 1.")
+
+    if session:
+        conn = session.connection
+        conn.commit()
+    else:
+        conn = _connect(db_path)
+        conn.execute('PRAGMA journal_mode = WAL')
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None  # transactions are handled below
+    cursor = conn.cursor()
+
+    indexes = []
+    if drop_indexes:
+        indexes = cursor.execute(
+            """SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL
+                AND tbl_name IN ('isotherms', 'isotherm_properties', 'isotherm_data');"""
+        ).fetchall()
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX "{name}";')
+
+    db_columns = ["id", "iso_type"] + BaseIsotherm._required_params
+    uploaded = 0
+
+    try:
+        for batch in grouped(isotherms, batch_size):
+            cursor.execute('BEGIN;')
+            cursor.execute('PRAGMA defer_foreign_keys = ON;')
+            try:
+                rows = []
+                for isotherm in batch:
+                    _autoinsert(isotherm, autoinsert_material, autoinsert_adsorbate, db_path, cursor)
+                    rows.append(_isotherm_rows(isotherm, data_encoding))
+                cursor.executemany(
+                    build_insert(table='isotherms', to_insert=db_columns),
+                    [upload_dict for upload_dict, _, _ in rows],
+                )
+                cursor.executemany(
+                    _SQL_INSERT_ISOTHERM_PROPERTIES,
+                    [prop for _, properties, _ in rows for prop in properties],
+                )
+                cursor.executemany(
+                    _SQL_INSERT_ISOTHERM_DATA,
+                    [datum for _, _, data in rows for datum in data],
+                )
+                cursor.execute('COMMIT;')
+
+            except (sqlite3.IntegrityError, sqlite3.InterfaceError) as err:
+                cursor.execute('ROLLBACK;')
+                raise ParsingError(
+                    f"Error uploading isotherms {uploaded} to {uploaded + len(batch)}, "
+                    f"batch was not uploaded. Original error:\n {err}"
+                ) from err
+            except BaseException:
+                if conn.in_transaction:
+                    cursor.execute('ROLLBACK;')
+                raise
+
+            uploaded += len(batch)
+            if verbose:
+                logger.info(f"Uploaded {uploaded} isotherms.")
+
+    finally:
+        for _, sql in indexes:
+            cursor.execute(sql)
+        if session:
+            conn.isolation_level = isolation_level
+        else:
+            conn.close()
+
+    return uploaded
+
+
+def _autoinsert(
+    isotherm: BaseIsotherm,
+    autoinsert_material: bool,
+    autoinsert_adsorbate: bool,
+    db_path: str,
+    cursor: sqlite3.Cursor,
+):
+    """Insert the material and adsorbate of an isotherm if not already known."""
     if autoinsert_material:
         if isotherm.material not in MATERIAL_LIST:
             material_to_db(isotherm.material, db_path=db_path, cursor=cursor)
@@ -865,7 +1109,13 @@ def isotherm_to_db(
         if isotherm.adsorbate not in ADSORBATE_LIST:
             adsorbate_to_db(isotherm.adsorbate, db_path=db_path, cursor=cursor)
 
-    # The isotherm is going to be inserted into the database
+
+def _isotherm_rows(
+    isotherm: BaseIsotherm,
+    data_encoding: str = "json",
+) -> "tuple[dict, list[dict], list[dict]]":
+    """Build the rows of the isotherm, its properties and its data for upload."""
+
     # Build upload dict
     iso_id = isotherm.iso_id
     upload_dict = {'id': iso_id}
@@ -892,198 +1142,251 @@ def isotherm_to_db(
     if isinstance(material, dict):
         upload_dict['material'] = material['name']
 
-    # Upload isotherm info to database
-    db_columns = ["id", "iso_type"] + BaseIsotherm._required_params
-    try:
-        cursor.execute(build_insert(table='isotherms', to_insert=db_columns), upload_dict)
-    except sqlite3.Error as err:
-        raise type(err)(
-            f"""Error inserting isotherm "{upload_dict["id"]}" base properties. """
-            f"""Ensure material "{upload_dict["material"]}", and adsorbate "{upload_dict["adsorbate"]}" """
-            f"""exist in the database. Original error:\n {err}"""
-        ) from None
-
-    # TODO insert multiple
-    # Upload the other isotherm parameters
-    for key in iso_dict:
+    # The other isotherm parameters
+    properties = []
+    for key, val in iso_dict.items():
         # Deal with bools
-        val = iso_dict[key]
         if isinstance(val, bool):
             val = 'TRUE' if val else 'FALSE'
-        cursor.execute(
-            build_insert(
-                table='isotherm_properties',
-                to_insert=['iso_id', 'type', 'value'],
-            ),
-            {
-                'iso_id': iso_id,
-                'type': key,
-                'value': val
-            },
-        )
-
-    # Then, the isotherm data/model will be uploaded into the data table
-
-    # Build sql request
-    sql_insert = build_insert(table='isotherm_data', to_insert=['iso_id', 'type', 'dtype', 'data'])
+        properties.append({'iso_id': iso_id, 'type': key, 'value': val})
 
+    # The isotherm data/model
+    data = []
     if isinstance(isotherm, PointIsotherm):
-        # Insert standard data fields:
-        cursor.execute(
-            sql_insert, {
-                'iso_id': iso_id,
-                'type': 'pressure',
-                'dtype': 'float',
-                'data': json.dumps(isotherm.pressure().tolist())
-            }
-        )
-        cursor.execute(
-            sql_insert, {
-                'iso_id': iso_id,
-                'type': 'loading',
-                'dtype': 'float',
-                'data': json.dumps(isotherm.loading().tolist())
-            }
-        )
-        # Update or insert other fields:
-        for key in isotherm.other_keys:
-            dtype = find_SQL_python_type(isotherm.other_data(key)[0])
-            data = json.dumps(isotherm.other_data(key).tolist())
-            cursor.execute(
-                sql_insert, {
-                    'iso_id': iso_id,
-                    'type': key,
-                    'dtype': dtype,
-                    'data': data
-                }
-            )
+        # Standard data fields, then other fields
+        columns = {'pressure': isotherm.pressure(), 'loading': isotherm.loading()}
+        columns.update({key: isotherm.other_data(key) for key in isotherm.other_keys})
+        for key, column in columns.items():
+            dtype, encoded = encode_SQL_array(column, data_encoding)
+            data.append({'iso_id': iso_id, 'type': key, 'dtype': dtype, 'data': encoded})
 
     elif isinstance(isotherm, ModelIsotherm):
-        # Insert model parameters
-        cursor.execute(
-            sql_insert, {
-                'iso_id': iso_id,
-                'type': 'model',
-                'dtype': "dict",
-                'data': json.dumps(isotherm.model.to_dict())
-            }
-        )
+        # Model parameters
+        data.append({
+            'iso_id': iso_id,
+            'type': 'model',
+            'dtype': "dict",
+            'data': json.dumps(isotherm.model.to_dict())
+        })
 
-    if verbose:
-        # Print success
-        logger.info(f"Isotherm uploaded: '{isotherm.iso_id}'")
+    return upload_dict, properties, data
 
 
-@with_connection
 def isotherms_from_db(
     criteria: dict = None,
     db_path: str = None,
     verbose: bool = True,
+    iterator: bool = False,
+    chunk_size: int = 100,
+    order_by: "str | list[str]" = None,
+    limit: int = None,
+    offset: int = None,
     **kwargs: dict,
 ) -> "list[BaseIsotherm | PointIsotherm | ModelIsotherm]":
     """
     Get isotherms with the selected criteria from the database.
 
+    All filtering, ordering and limiting is done by the database,
+    so only the selected isotherms are read.
+
     Parameters
     ----------
     criteria : dict, None
-        Dictionary of isotherm parameters on which to filter database from
-        base parameters ('material', 'adsorbate', 'temperature', 'type').
-        For example {'material': 'm1', 'temperature': '77'}. Parameters
-        must exist for the filtering to take place otherwise all
-        results are returned.
+        Dictionary of isotherm parameters on which to filter the database.
+        Keys can be base parameters ('material', 'adsorbate', 'temperature',
+        'iso_type') or any other isotherm property, such as 'user'.
+        Values are either matched exactly, or a ``(min, max)`` tuple selects
+        a range, with None for an open end. For example
+        ``{'material': 'm1', 'temperature': (273, 303), 'user': 'TU'}``.
+        If no criteria are given, all isotherms are returned.
     db_path : str, None
         Path to the database. If none is specified, internal database is used.
     verbose : bool
         Extra information printed to console.
+    iterator : bool, False
+        Return a generator which yields the isotherms one by one instead of
+        a list, reading only ``chunk_size`` isotherms from the database at a time.
+    chunk_size : int, 100
+        Number of isotherms whose properties and data are read together.
+    order_by : str or list of str, None
+        Parameters or properties to order the isotherms by, prefixed
+        with ``-`` for descending order, for example ``'-temperature'``.
+    limit : int, None
+        Maximum number of isotherms returned.
+    offset : int, None
+        Number of isotherms skipped before the first one returned.
 
     Returns
     -------
-    list
+    list or generator
         list of Isotherms
     """
+    cursor = kwargs.get('cursor')
+    if not cursor and kwargs.get('session'):
+        cursor = kwargs['session'].cursor()
 
-    cursor = kwargs['cursor']
+    query = _isotherms_query(criteria if criteria else {}, order_by, limit, offset)
+
+    isotherms = _isotherms_from_db(
+        query,
+        db_path=db_path,
+        chunk_size=chunk_size,
+        cursor=cursor,
+    )
+    if iterator:
+        return isotherms
+
+    isotherms = list(isotherms)
+
+    if verbose:
+        # Print success
+        logger.info(f"Selected {len(isotherms)} isotherms")
+
+    return isotherms
+
+
+def _isotherms_query(
+    criteria: dict,
+    order_by: "str | list[str]" = None,
+    limit: int = None,
+    offset: int = None,
+) -> "tuple[str, list]":
+    """Build the query selecting isotherms, with filters on properties as subqueries."""
+
+    columns = ["id", "iso_type"] + BaseIsotherm._required_params
+    prop_select = """SELECT value FROM "isotherm_properties"
+        WHERE iso_id = "isotherms".id AND type = ?"""
+
+    conditions = []
+    params = []
+    for key, value in criteria.items():
+        if isinstance(value, tuple):
+            if len(value) != 2:
+                raise ParsingError(f"Range of '{key}' should be a (min, max) tuple.")
+            predicates = [(op, val) for op, val in zip((">=", "<="), value) if val is not None]
+        else:
+            # Deal with bools
+            if isinstance(value, bool):
+                value = 'TRUE' if value else 'FALSE'
+            predicates = [("=", value)]
+
+        if key in columns:
+            conditions.extend(f'"isotherms".{key} {op} ?' for op, _ in predicates)
+            params.extend(val for _, val in predicates)
+        else:
+            conditions.append(
+                """EXISTS (SELECT 1 FROM "isotherm_properties"
+                    WHERE iso_id = "isotherms".id AND type = ?"""
+                + "".join(f" AND value {op} ?" for op, _ in predicates) + ")"
+            )
+            params.append(key)
+            params.extend(val for _, val in predicates)
+
+    query = 'SELECT "isotherms".* FROM "isotherms"'
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+
+    if order_by:
+        orders = []
+        for key in [order_by] if isinstance(order_by, str) else order_by:
+            direction = "DESC" if key.startswith("-") else "ASC"
+            key = key.lstrip("-")
+            if key in columns:
+                orders.append(f'"isotherms".{key} {direction}')
+            else:
+                orders.append(f"({prop_select}) {direction}")
+                params.append(key)
+        query += " ORDER BY " + ", ".join(orders)
+
+    if limit is not None or offset is not None:
+        query += " LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset if offset else 0])
+
+    return query + ";", params
 
-    # Default value
-    criteria = criteria if criteria else {}
 
-    # Get isotherm info from database
-    cursor.execute(build_select(table='isotherms', to_select="*", where=criteria.keys()), criteria)
+def _isotherms_from_db(
+    query: "tuple[str, list]",
+    db_path: str = None,
+    chunk_size: int = 100,
+    cursor: sqlite3.Cursor = None,
+):
+    """Yield isotherms from the database, reading them in chunks."""
+
+    # The generator keeps its own connection open until exhausted
+    if cursor is None:
+        conn = _connect(db_path)
+        try:
+            yield from _isotherms_from_db(query, chunk_size=chunk_size, cursor=conn.cursor())
+        finally:
+            conn.close()
+        return
 
-    isotherms = []
-    alldata = cursor.fetchall()
+    # Get isotherm info from database, on a separate cursor
+    # which is read while the other tables are queried
+    iso_cursor = cursor.connection.cursor()
+    iso_cursor.execute(*query)
 
-    for rows in grouped(alldata, 100):  # we are taking 100 isotherms at a time
+    while True:
+        rows = iso_cursor.fetchmany(chunk_size)
+        if not rows:
+            break
 
         ids = tuple(row['id'] for row in rows)
+        placeholders = ','.join('?' * len(ids))
 
-        # Get isotherm properties from database
+        # Get isotherm properties from database, grouped by isotherm
+        isotherm_props = {}
         cursor.execute(
             f"""SELECT iso_id, type, value FROM "isotherm_properties"
-                WHERE iso_id IN ({','.join('?' * len(ids))});""", ids
+                WHERE iso_id IN ({placeholders});""", ids
         )
-        isotherm_props = cursor.fetchall()
+        for iso_id, prop, value in cursor:
+            isotherm_props.setdefault(iso_id, {})[prop] = value
 
-        # Get the properties from the data table
+        # Get the properties from the data table, grouped by isotherm
+        isotherm_data = {}
         cursor.execute(
             f"""SELECT iso_id, type, dtype, data FROM "isotherm_data"
-                WHERE iso_id IN ({','.join('?' * len(ids))});""", ids
+                WHERE iso_id IN ({placeholders});""", ids
         )
-        isotherm_data = cursor.fetchall()
+        for iso_id, data_type, dtype, data in cursor:
+            isotherm_data.setdefault(iso_id, {})[data_type] = (dtype, data)
 
         for row in rows:
+            yield _isotherm_from_row(
+                row,
+                isotherm_props.get(row['id'], {}),
+                isotherm_data.get(row['id'], {}),
+            )
 
-            # Generate the isotherm parameters dictionary
-            iso_params = dict(zip(row.keys(), row))
-            iso_params.update({
-                prop[1]: check_SQL_bool(prop[2])
-                for prop in isotherm_props
-                if prop["iso_id"] == row['id']
-            })
-            iso_params.pop('id')
-
-            # Generate the isotherm data/model
-            if row['iso_type'] == 'pointisotherm':
-
-                iso_data = pandas.DataFrame({
-                    data["type"]: json.loads(data["data"])
-                    for data in isotherm_data
-                    if data["iso_id"] == row['id']
-                })
-
-                # build isotherm object
-                isotherms.append(
-                    PointIsotherm(
-                        isotherm_data=iso_data,
-                        pressure_key="pressure",
-                        loading_key="loading",
-                        **iso_params
-                    )
-                )
-
-            elif row['iso_type'] == 'modelisotherm':
-
-                iso_model = model_from_dict(
-                    next(
-                        json.loads(data['data'])
-                        for data in isotherm_data
-                        if data["iso_id"] == row['id']
-                    )
-                )
-
-                # build isotherm object
-                isotherms.append(ModelIsotherm(model=iso_model, **iso_params))
 
-            else:
-                # build isotherm object
-                isotherms.append(BaseIsotherm(**iso_params))
+def _isotherm_from_row(row: sqlite3.Row, props: dict, data: dict):
+    """Build an isotherm from its database row, properties and encoded data."""
+
+    # Generate the isotherm parameters dictionary
+    iso_params = dict(zip(row.keys(), row))
+    iso_params.update({prop: check_SQL_bool(value) for prop, value in props.items()})
+    iso_params.pop('id')
+
+    # Generate the isotherm data/model, decoded only now
+    if row['iso_type'] == 'pointisotherm':
+        iso_data = pandas.DataFrame({
+            data_type: decode_SQL_array(dtype, values)
+            for data_type, (dtype, values) in data.items()
+        })
+        return PointIsotherm(
+            isotherm_data=iso_data,
+            pressure_key="pressure",
+            loading_key="loading",
+            **iso_params
+        )
 
-    if verbose:
-        # Print success
-        logger.info(f"Selected {len(isotherms)} isotherms")
+    if row['iso_type'] == 'modelisotherm':
+        iso_model = model_from_dict(json.loads(data['model'][1]))
+        return ModelIsotherm(model=iso_model, **iso_params)
 
-    return isotherms
+    return BaseIsotherm(**iso_params)
 
 
 @with_connection
@@ -1,16 +1,45 @@
 """Utilities for interacting with the CoolProp backend."""
 
+import collections
+import typing as t
+import weakref
+
+import numpy
+
 from pygaps import logger
+from pygaps.utilities.exceptions import CalculationError
+from pygaps.utilities.python_utilities import cache_load
+from pygaps.utilities.python_utilities import cache_store
+
+
+class _CoolPropModule():
+    """
+    The CoolProp module, imported when it is first used.
+
+    Importing CoolProp is a large share of the import time of pyGAPS, and is
+    not needed unless thermodynamic properties are calculated.
+    """
+    _module = None
+
+    def __getattr__(self, name):
+        if _CoolPropModule._module is None:
+            import CoolProp
+            logger.debug(f"CoolProp version is '{CoolProp.__version__}'")
+            _CoolPropModule._module = CoolProp
+        return getattr(_CoolPropModule._module, name)
 
-try:
-    import CoolProp as CP
-    logger.debug(f"CoolProp version is '{CP.__version__}'")
-except ImportError:
-    CP = None
+
+CP = _CoolPropModule()
 
 #: The backend which CoolProp uses, normally either HEOS or REFPROP.
 COOLPROP_BACKEND = 'HEOS'
 
+#: The number of calculated properties kept by each adsorbate.
+THERMODYNAMIC_CACHE_SIZE = 256
+
+# All property caches, cleared when the backend changes
+_CACHES = weakref.WeakSet()
+
 
 def thermodynamic_backend():
     global COOLPROP_BACKEND
@@ -21,6 +50,7 @@ def backend_use_refprop():
     """Switch the equation of state used to REFPROP. User should have REFPROP installed."""
     global COOLPROP_BACKEND
     COOLPROP_BACKEND = 'REFPROP'
+    thermodynamic_cache_clear()
     logger.info("Switched to CoolProp REFPROP backend.")
 
 
@@ -28,4 +58,229 @@ def backend_use_coolprop():
     """Switch the equation of state used to HEOS (CoolProp)."""
     global COOLPROP_BACKEND
     COOLPROP_BACKEND = 'HEOS'
+    thermodynamic_cache_clear()
     logger.info("Switched to CoolProp HEOS backend.")
+
+
+def thermodynamic_cache_clear():
+    """Clear the properties calculated by the backend for all adsorbates."""
+    for cache in list(_CACHES):
+        cache.clear()
+
+
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class PropertyCache():
+    """
+    A bounded cache of properties calculated by the thermodynamic backend.
+
+    Values are keyed on the property, its state inputs and the current
+    backend, and the least recently used ones are discarded first.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of values kept, ``THERMODYNAMIC_CACHE_SIZE`` by default.
+    """
+    def __init__(self, maxsize: int = None):
+        self.maxsize = maxsize if maxsize is not None else THERMODYNAMIC_CACHE_SIZE
+        self.hits = 0
+        self.misses = 0
+        self._values = collections.OrderedDict()
+        _CACHES.add(self)
+
+    def get(self, key: tuple, calculate: t.Callable):
+        """Return the cached value for the key, or calculate and store it."""
+        key = (COOLPROP_BACKEND, ) + key
+        try:
+            value = self._values[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable inputs, such as arrays
+            return calculate()
+        else:
+            self.hits += 1
+            self._values.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = calculate()
+        self._values[key] = value
+        while len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all values and reset the statistics."""
+        self._values.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the hit and miss statistics of the cache."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._values))
+
+
+class SaturationTable():
+    """
+    Interpolation tables of the saturation curve properties of a fluid.
+
+    The tables are built once from the thermodynamic backend between the triple
+    point and close to the critical point, after which properties are found by
+    spline interpolation. The nodes are uniform in :math:`(1 - T/T_c)^{1/3}`,
+    which clusters them near the critical point, where the properties change
+    fastest, and the logarithm of each property is interpolated.
+
+    When the table is built, each property is also calculated halfway between
+    the nodes, and the largest relative error of the interpolation is kept in
+    ``errors``. Tables are stored on disk, keyed by backend, fluid and
+    CoolProp version, and reused by later sessions.
+
+    Parameters
+    ----------
+    state : CoolProp.AbstractState
+        The backend state of the fluid.
+    nodes : int, optional
+        Number of nodes of the table.
+    """
+    #: Version of the table format, stored tables of other versions are rebuilt.
+    version = 1
+
+    #: Properties in the table, with their saturated phase, backend output and factor.
+    properties = {
+        'saturation_pressure': (0, 'iP', 1),
+        'surface_tension': (0, 'surface_tension', 1000),
+        'liquid_density': (0, 'iDmass', 1e-3),
+        'liquid_molar_density': (0, 'iDmolar', 1e-6),
+        'gas_density': (1, 'iDmass', 1e-3),
+        'gas_molar_density': (1, 'iDmolar', 1e-6),
+        'enthalpy_liquefaction': (None, 'iHmolar', 1e-3),
+    }
+
+    _exponent = 1 / 3
+    _closest_critical = 1e-4
+
+    def __init__(self, state, nodes: int = 400):
+        self.t_critical = state.T_critical()
+        self.t_min = state.Ttriple()
+        self.t_max = self.t_critical * (1 - self._closest_critical)
+
+        u_max = (1 - self.t_min / self.t_critical)**self._exponent
+        u_min = self._closest_critical**self._exponent
+        self.nodes = numpy.linspace(u_min, u_max, nodes)
+
+        # Properties which the backend cannot calculate everywhere are left out
+        with numpy.errstate(all='ignore'):
+            values = {prop: numpy.log(value) for prop, value in self._calculate(state, self.nodes).items()}
+        self.values = {prop: value for prop, value in values.items() if numpy.all(numpy.isfinite(value))}
+        if 'saturation_pressure' not in self.values:
+            raise CalculationError("Could not tabulate the saturation pressure.")
+
+        # Check the interpolation against the backend between nodes
+        midpoints = (self.nodes[1:] + self.nodes[:-1]) / 2
+        reference = self._calculate(state, midpoints)
+        self.errors = {
+            prop: float(numpy.nanmax(numpy.abs(self._interpolate(prop, midpoints) / reference[prop] - 1)))
+            for prop in self.values
+        }
+        temperature = self.t_critical * (1 - midpoints**(1 / self._exponent))
+        self.errors['saturation_temperature'] = float(
+            numpy.nanmax(numpy.abs(self._temperature(reference['saturation_pressure']) / temperature - 1))
+        )
+
+    def _calculate(self, state, nodes) -> dict:
+        """Calculate all properties with the backend at the nodes."""
+        values = {prop: numpy.full(len(nodes), numpy.nan) for prop in self.properties}
+        for index, temp in enumerate(self.t_critical * (1 - nodes**(1 / self._exponent))):
+            state.update(CP.QT_INPUTS, 0.0, temp)
+            for prop, (phase, output, factor) in self.properties.items():
+                try:
+                    if output == 'surface_tension':
+                        value = state.surface_tension()
+                    elif phase is None:
+                        value = state.saturated_vapor_keyed_output(getattr(CP, output)) - \
+                            state.saturated_liquid_keyed_output(getattr(CP, output))
+                    elif phase == 0:
+                        value = state.saturated_liquid_keyed_output(getattr(CP, output))
+                    else:
+                        value = state.saturated_vapor_keyed_output(getattr(CP, output))
+                except ValueError:
+                    continue
+                values[prop][index] = value * factor
+        return values
+
+    def _interpolate(self, prop: str, nodes):
+        from scipy.interpolate import CubicSpline
+
+        splines = self.__dict__.setdefault('_splines', {})
+        if prop not in splines:
+            splines[prop] = CubicSpline(self.nodes, self.values[prop])
+        return numpy.exp(splines[prop](nodes))
+
+    def _temperature(self, press):
+        """Interpolate the saturation temperature at pressures in Pa."""
+        from scipy.interpolate import CubicSpline
+
+        splines = self.__dict__.setdefault('_splines', {})
+        if 'saturation_temperature' not in splines:
+            # the pressure decreases along the nodes
+            splines['saturation_temperature'] = CubicSpline(
+                self.values['saturation_pressure'][::-1], self.nodes[::-1]
+            )
+        nodes = splines['saturation_temperature'](numpy.log(press))
+        return self.t_critical * (1 - nodes**(1 / self._exponent))
+
+    def lookup(self, prop: str, temp=None, press=None):
+        """
+        Return a property on the saturation curve, at one or more temperatures
+        in K or pressures in Pa. If the property is not tabulated, or a state
+        point is outside the table, None is returned instead.
+        """
+        if prop not in self.values:
+            return None
+
+        if press is not None:
+            press = numpy.asarray(press, dtype=float)
+            p_min, p_max = self._interpolate('saturation_pressure', self.nodes[[-1, 0]])
+            if not numpy.all((p_min <= press) & (press <= p_max)):
+                return None
+            temp = self._temperature(press)
+        else:
+            temp = numpy.asarray(temp, dtype=float)
+            if not numpy.all((self.t_min <= temp) & (temp <= self.t_max)):
+                return None
+
+        value = self._interpolate(prop, (1 - temp / self.t_critical)**self._exponent)
+        return value if numpy.ndim(value) else float(value)
+
+    @classmethod
+    def load(cls, backend: str, fluid: str, state=None):
+        """
+        Return the table of a fluid, from the disk cache if it exists,
+        otherwise built from the backend state and stored.
+        """
+        name = f"saturation-{backend}-{fluid}-{CP.__version__}-v{cls.version}"
+
+        stored = cache_load(name)
+        if stored is not None and {'limits', 'nodes', 'error_names', 'errors'} <= stored.keys():
+            table = cls.__new__(cls)
+            table.t_critical, table.t_min, table.t_max = stored['limits']
+            table.nodes = stored['nodes']
+            table.values = {key[6:]: value for key, value in stored.items() if key.startswith('value_')}
+            table.errors = dict(zip(stored['error_names'].tolist(), stored['errors'].tolist()))
+            return table
+
+        if state is None:
+            state = CP.AbstractState(backend, fluid)
+        table = cls(state)
+        cache_store(
+            name,
+            limits=numpy.array([table.t_critical, table.t_min, table.t_max]),
+            nodes=table.nodes,
+            error_names=numpy.array(list(table.errors)),
+            errors=numpy.array(list(table.errors.values())),
+            **{f"value_{prop}": value for prop, value in table.values.items()},
+        )
+        return table
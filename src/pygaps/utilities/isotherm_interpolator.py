@@ -1,6 +1,9 @@
-"""A class used for isotherm interpolation."""
+"""Classes used for isotherm interpolation."""
 
-from scipy.interpolate import interp1d
+import numpy
+
+from pygaps.utilities.exceptions import CalculationError
+from pygaps.utilities.exceptions import ParameterError
 
 
 class IsothermInterpolator():
@@ -51,6 +54,9 @@ class IsothermInterpolator():
         if known_data is None:
             return
 
+        # scipy.interpolate is slow to import, only needed here
+        from scipy.interpolate import interp1d
+
         # Create the interpolator
         if interp_fill is None:
             self.interp_fun = interp1d(
@@ -72,3 +78,598 @@ class IsothermInterpolator():
     def __call__(self, data):
         """Override direct call to return interpolated data."""
         return self.interp_fun(data)
+
+
+class SpreadingPressureInterpolator():
+    r"""
+    Class used to compute the spreading pressure of a discrete isotherm.
+
+    The isotherm loading is taken as a linear interpolation of the data
+    points, with Henry's law assumed below the first point. The integral
+
+    .. math::
+
+        \Pi(p) = \int_0^p \frac{n(\hat{p})}{\hat{p}} d\hat{p}
+
+    is computed exactly at each datapoint once, and stored as a
+    cumulative table. Any spreading pressure evaluation, as well as the
+    inverse (pressure at a given spreading pressure), then only has to locate
+    the segment in the table and integrate over a single segment.
+
+    Call directly to use.
+
+    Parameters
+    ----------
+    known_data : array
+        The pressure points of the isotherm.
+    interp_data : array
+        The loading corresponding to each pressure point.
+    interp_branch : str, optional
+        Stores which isotherm branch the interpolator is based on.
+
+    """
+    def __init__(
+        self,
+        known_data,
+        interp_data,
+        interp_branch='ads',
+    ):
+        # The branch the internal interpolator is on.
+        self.interp_branch = interp_branch
+
+        pressure = numpy.asarray(known_data, dtype=float)
+        loading = numpy.asarray(interp_data, dtype=float)
+
+        # Only positive pressures can be integrated
+        valid = pressure > 0
+        if not numpy.any(valid):
+            raise CalculationError("No positive pressure points to compute spreading pressure.")
+        order = numpy.argsort(pressure[valid], kind='stable')
+        self.pressure = pressure[valid][order]
+        self.loading = loading[valid][order]
+
+        # Henry's law up to the first point
+        self.henry_const = self.loading[0] / self.pressure[0]
+
+        # Linear segments starting at each datapoint: n = intercept + slope * p
+        # The last segment is the extension of the previous one.
+        d_pressure = numpy.diff(self.pressure)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            slope = numpy.where(d_pressure > 0, numpy.diff(self.loading) / d_pressure, 0)
+        slope = numpy.append(slope, slope[-1] if slope.size else self.henry_const)
+        self.slope = slope
+        self.intercept = self.loading - slope * self.pressure
+
+        # Cumulative spreading pressure at each datapoint
+        segment = self.slope[:-1] * d_pressure + \
+            self.intercept[:-1] * numpy.log(self.pressure[1:] / self.pressure[:-1])
+        self.spreading_pressure = self.loading[0] + numpy.concatenate([[0], numpy.cumsum(segment)])
+
+    @staticmethod
+    def _fill_above(interp_fill):
+        """Get the loading which is assumed above the highest pressure."""
+        if interp_fill is None or isinstance(interp_fill, str):
+            return None
+        fill = numpy.asarray(interp_fill, dtype=float)
+        if fill.size == 2:
+            return fill.flat[1]
+        return fill.flat[0]
+
+    def _integrate(self, pressure, interp_fill):
+        """Return spreading pressure and its derivative to log(p), for p > first point."""
+        index = numpy.searchsorted(self.pressure, pressure, side='left') - 1
+        p_start = self.pressure[index]
+        slope = self.slope[index]
+        intercept = self.intercept[index]
+
+        # Above the highest pressure, a constant fill loading means the last
+        # segment goes from the last point to the fill value at this pressure.
+        fill = self._fill_above(interp_fill)
+        if fill is not None:
+            above = pressure > self.pressure[-1]
+            d_p = pressure[above] - self.pressure[-1]
+            slope = slope.copy()
+            intercept = intercept.copy()
+            slope[above] = (fill - self.loading[-1]) / d_p
+            intercept[above] = self.loading[-1] - slope[above] * self.pressure[-1]
+            d_slope = numpy.zeros(pressure.shape)
+            d_slope[above] = -slope[above] / d_p
+        else:
+            d_slope = 0
+
+        log_ratio = numpy.log(pressure / p_start)
+        value = self.spreading_pressure[index] + slope * (pressure - p_start) + \
+            intercept * log_ratio
+        derivative = pressure * (
+            slope + intercept / pressure + d_slope * (pressure - p_start - p_start * log_ratio)
+        )
+        return value, derivative
+
+    def __call__(self, pressure, interp_fill=None):
+        """
+        Compute the spreading pressure at the pressures given.
+
+        Parameters
+        ----------
+        pressure : float or array
+            Pressure at which to compute spreading pressure.
+        interp_fill : float or (float, float) or “extrapolate”, optional
+            The loading assumed above the highest pressure, as in
+            ``scipy.interpolate.interp1d``. If "extrapolate" or ``None``,
+            the last segment of the isotherm is extended.
+
+        Returns
+        -------
+        float or array
+            Spreading pressure at the pressures given.
+
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        result = numpy.empty(pressure.shape)
+
+        # Henry region
+        below = pressure <= self.pressure[0]
+        result[below] = self.henry_const * pressure[below]
+
+        # Datapoint table and a single segment
+        result[~below] = self._integrate(pressure[~below], interp_fill)[0]
+
+        if result.ndim == 0:
+            return result[()]
+        return result
+
+    def inverse(self, spreading_pressure, interp_fill=None, tolerance=1e-12, max_iterations=100):
+        """
+        Compute the pressure at which the spreading pressures given are reached.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            Spreading pressure for which to compute pressure.
+        interp_fill : float or (float, float) or “extrapolate”, optional
+            The loading assumed above the highest pressure, as in
+            ``scipy.interpolate.interp1d``. If "extrapolate" or ``None``,
+            the last segment of the isotherm is extended.
+        tolerance : float, optional
+            Tolerance in the logarithm of the pressure.
+        max_iterations : int, optional
+            Maximum number of Newton iterations.
+
+        Returns
+        -------
+        float or array
+            Pressure corresponding to each spreading pressure.
+
+        """
+        spreading_pressure = numpy.asarray(spreading_pressure, dtype=float)
+        result = numpy.empty(spreading_pressure.shape)
+
+        # Henry region
+        below = spreading_pressure <= self.spreading_pressure[0]
+        result[below] = spreading_pressure[below] / self.henry_const
+
+        # The table gives a bracket of the solution, unbounded after the last point
+        target = spreading_pressure[~below]
+        index = numpy.searchsorted(self.spreading_pressure, target, side='left') - 1
+        lower = numpy.log(self.pressure[index])
+        upper = numpy.full(index.shape, numpy.inf)
+        bounded = index < len(self.pressure) - 1
+        upper[bounded] = numpy.log(self.pressure[index[bounded] + 1])
+
+        # Safeguarded Newton iterations on log(p)
+        log_p = numpy.where(bounded, 0.5 * (lower + upper), lower + 1)
+        for _ in range(max_iterations):
+            value, derivative = self._integrate(numpy.exp(log_p), interp_fill)
+            residual = value - target
+            lower = numpy.where(residual < 0, log_p, lower)
+            upper = numpy.where(residual > 0, log_p, upper)
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                log_p_new = log_p - residual / derivative
+            # Fall back on bisection (or expansion) if Newton leaves the bracket
+            outside = ~((log_p_new > lower) & (log_p_new < upper))
+            log_p_new[outside] = numpy.where(
+                numpy.isfinite(upper[outside]),
+                0.5 * (lower[outside] + upper[outside]),
+                lower[outside] + 1,
+            )
+            converged = (numpy.abs(log_p_new - log_p) < tolerance) | (residual == 0)
+            log_p = numpy.where(residual == 0, log_p, log_p_new)
+            if numpy.all(converged):
+                break
+
+        result[~below] = numpy.exp(log_p)
+
+        if result.ndim == 0:
+            return result[()]
+        return result
+
+
+class ModelInterpolator():
+    r"""
+    Class used to tabulate an isotherm model with fixed parameters.
+
+    The model function (loading as a function of pressure, or pressure
+    as a function of loading) is evaluated on a logarithmic grid, which is
+    refined until a cubic Hermite interpolation of the loading agrees
+    with the model within the requested tolerance. The spreading pressure
+
+    .. math::
+
+        \Pi(p) = \int_0^p \frac{n(\hat{p})}{\hat{p}} d\hat{p}
+
+    is then integrated over each grid cell with Gauss-Legendre quadrature
+    and stored as a cumulative table. Loading, spreading pressure
+    and the pressure at a given spreading pressure are interpolated
+    from the table, which is extended on demand.
+    The spreading pressure at the start of the table is integrated on a
+    coarse grid spanning many decades below it. Further down, and when
+    interpolating below the table, the model is assumed to follow a power
+    law (Henry's law in most cases).
+
+    Parameters
+    ----------
+    function : callable
+        The model function. It must accept arrays.
+    calculates : {'loading', 'pressure'}
+        Whether the function calculates the loading from the pressure,
+        or the pressure from the loading.
+    reference : float, optional
+        A typical input of the function (pressure or loading),
+        used as the upper end of the initial table.
+    tolerance : float, optional
+        Relative tolerance of the interpolated loading.
+
+    """
+
+    # Decades of the function input spanned by the initial table
+    _decades = 6
+    # Initial spacing of the grid, in log units
+    _spacing = 0.5
+    # Smallest cell of the grid, in log units
+    _min_cell = 1e-9
+    # Step used for the numerical derivative, in log units
+    _step = 1e-5
+    # Decades of the function input integrated below the table
+    _tail_decades = 30
+    # Gauss-Legendre nodes and weights used to integrate each cell
+    _nodes, _weights = numpy.polynomial.legendre.leggauss(5)
+
+    def __init__(
+        self,
+        function,
+        calculates,
+        reference=1.0,
+        tolerance=1e-6,
+    ):
+        if calculates not in ('loading', 'pressure'):
+            raise ParameterError(
+                f"Model tables are built on 'loading' or 'pressure' functions, not '{calculates}'."
+            )
+        self.function = function
+        self.calculates = calculates
+        self.tolerance = tolerance
+
+        if not (numpy.isfinite(reference) and reference > 0):
+            reference = 1.0
+        x_hi = numpy.log(reference)
+        self._build(x_hi - self._decades * numpy.log(10), x_hi)
+
+    def _evaluate(self, x):
+        """Return log pressure, loading and the loading derivative to log pressure."""
+        x = numpy.asarray(x, dtype=float)
+        points = numpy.exp(numpy.stack([x, x - self._step, x + self._step]))
+        with numpy.errstate(all='ignore'):
+            if self.calculates == 'loading':
+                loading = numpy.asarray(self.function(points), dtype=float)
+                log_p = x
+                derivative = (loading[2] - loading[1]) / (2 * self._step)
+                loading = loading[0]
+            else:
+                log_ps = numpy.log(numpy.asarray(self.function(points), dtype=float))
+                log_p = log_ps[0]
+                loading = points[0]
+                derivative = loading * 2 * self._step / (log_ps[2] - log_ps[1])
+        return log_p, loading, derivative
+
+    def _valid(self, log_p, loading, derivative):
+        """Check where the model gives a finite loading (and an increasing pressure)."""
+        with numpy.errstate(invalid='ignore'):
+            valid = numpy.isfinite(log_p) & numpy.isfinite(derivative) & (loading > 0)
+            if self.calculates == 'pressure':
+                valid &= derivative > 0
+        return valid
+
+    def _truncate(self, x, log_p, loading, derivative):
+        """Keep the first range of the grid where the model is valid."""
+        valid = self._valid(log_p, loading, derivative)
+        if not numpy.any(valid):
+            raise CalculationError("The model does not give a valid loading in the range tabulated.")
+        start = numpy.argmax(valid)
+        with numpy.errstate(invalid='ignore'):
+            increasing = valid[start + 1:] & (numpy.diff(log_p[start:]) > 0)
+        stop = start + 1 + (numpy.argmin(increasing) if not numpy.all(increasing) else increasing.size)
+
+        # the table cannot be extended below underflowing loadings
+        self._floor = start > 0
+        self.domain_max = stop < x.size
+
+        values = [arr[start:stop] for arr in (x, log_p, loading, derivative)]
+        if self.domain_max:
+            # find the edge of the valid range by bisection
+            lower, upper = x[stop - 1], x[stop]
+            found = None
+            for _ in range(60):
+                middle = 0.5 * (lower + upper)
+                point = self._evaluate(middle)
+                if self._valid(*point) and point[0] > values[1][-1]:
+                    lower, found = middle, point
+                else:
+                    upper = middle
+            if found is not None:
+                values = [numpy.append(arr, val) for arr, val in zip(values, (lower, *found))]
+
+        if values[0].size < 2:
+            raise CalculationError("The model does not give a valid loading in the range tabulated.")
+        return values
+
+    def _build(self, x_lo, x_hi):
+        """Tabulate the model between two (logarithmic) function inputs."""
+        x = numpy.linspace(x_lo, x_hi, max(int(numpy.ceil((x_hi - x_lo) / self._spacing)), 2) + 1)
+        x, log_p, loading, derivative = self._truncate(x, *self._evaluate(x))
+
+        # Refine cells where the interpolation does not match the model
+        pending = numpy.ones(x.size - 1, dtype=bool)
+        while numpy.any(pending):
+            index = numpy.flatnonzero(pending)
+            x_mid = 0.5 * (x[index] + x[index + 1])
+            log_p_mid, loading_mid, derivative_mid = self._evaluate(x_mid)
+
+            # the model is not valid or monotonic inside a cell, the table stops there
+            with numpy.errstate(invalid='ignore'):
+                invalid = ~(
+                    self._valid(log_p_mid, loading_mid, derivative_mid) &
+                    (log_p_mid > log_p[index]) & (log_p_mid < log_p[index + 1])
+                )
+            if numpy.any(invalid):
+                cell = index[invalid][0]
+                if cell == 0:
+                    raise CalculationError(
+                        "The model does not give a valid loading in the range tabulated."
+                    )
+                keep = index < cell
+                index, x_mid = index[keep], x_mid[keep]
+                log_p_mid, loading_mid, derivative_mid = \
+                    log_p_mid[keep], loading_mid[keep], derivative_mid[keep]
+                x, log_p, loading, derivative = \
+                    x[:cell + 1], log_p[:cell + 1], loading[:cell + 1], derivative[:cell + 1]
+                pending = pending[:cell]
+                self.domain_max = True
+
+            estimate = _hermite(
+                log_p[index],
+                log_p[index + 1],
+                numpy.log(loading[index]),
+                numpy.log(loading[index + 1]),
+                derivative[index] / loading[index],
+                derivative[index + 1] / loading[index + 1],
+                log_p_mid,
+            )
+            refine = ~(numpy.abs(estimate - numpy.log(loading_mid)) <= self.tolerance) & \
+                (x[index + 1] - x[index] > self._min_cell)
+
+            split = numpy.zeros(pending.size, dtype=bool)
+            split[index[refine]] = True
+            x = numpy.insert(x, index[refine] + 1, x_mid[refine])
+            log_p = numpy.insert(log_p, index[refine] + 1, log_p_mid[refine])
+            loading = numpy.insert(loading, index[refine] + 1, loading_mid[refine])
+            derivative = numpy.insert(derivative, index[refine] + 1, derivative_mid[refine])
+            pending = numpy.repeat(split, numpy.where(split, 2, 1))
+
+        # Spreading pressure in each cell, starting from the integral below the table
+        exponent = derivative[0] / loading[0]
+        cell = self._integrate(log_p, loading)
+        spreading_pressure = self._tail(x[0], loading[0] / exponent) + \
+            numpy.concatenate([[0], numpy.cumsum(cell)])
+
+        self.x = x
+        self.log_pressure = log_p
+        self.loading = loading
+        self.spreading_pressure = spreading_pressure
+        self.exponent = exponent
+
+        # Splines in log-log space, exact in the Henry region
+        from scipy.interpolate import CubicHermiteSpline
+        log_loading = numpy.log(loading)
+        log_spreading = numpy.log(spreading_pressure)
+        self._loading_spline = CubicHermiteSpline(log_p, log_loading, derivative / loading)
+        self._spreading_spline = CubicHermiteSpline(log_p, log_spreading, loading / spreading_pressure)
+        self._inverse_spline = CubicHermiteSpline(log_spreading, log_p, spreading_pressure / loading)
+
+    def _integrate(self, log_p, loading):
+        """Integrate the spreading pressure over each cell of a grid."""
+        if self.calculates == 'loading':
+            half = 0.5 * numpy.diff(log_p)
+            nodes = (log_p[:-1] + half)[:, None] + half[:, None] * self._nodes
+            with numpy.errstate(all='ignore'):
+                return half * numpy.sum(self._weights * self.function(numpy.exp(nodes)), axis=1)
+        # integrate by parts, as int(n dlnp) = [n lnp] - int(lnp dn)
+        half = 0.5 * numpy.diff(loading)
+        nodes = (loading[:-1] + half)[:, None] + half[:, None] * self._nodes
+        with numpy.errstate(all='ignore'):
+            return numpy.diff(loading * log_p) - \
+                half * numpy.sum(self._weights * numpy.log(self.function(nodes)), axis=1)
+
+    def _tail(self, x_0, power_law):
+        """
+        Integrate the spreading pressure below the table, on a coarse grid
+        far enough down that the power law below it no longer matters.
+        Returns the power law estimate if the model is not valid there.
+        """
+        x = x_0 - self._spacing * numpy.arange(int(self._tail_decades * numpy.log(10) / self._spacing), -1, -1)
+        log_p, loading, derivative = self._evaluate(x)
+        valid = self._valid(log_p, loading, derivative)
+        with numpy.errstate(invalid='ignore'):
+            valid[1:] &= numpy.diff(log_p) > 0
+        # only the valid range up to the bottom of the table is used
+        start = x.size - numpy.argmin(valid[::-1]) if not numpy.all(valid) else 0
+        if start > x.size - 2:
+            return power_law
+        log_p, loading, derivative = log_p[start:], loading[start:], derivative[start:]
+        tail = numpy.sum(self._integrate(log_p, loading))
+        if start == 0:
+            tail += loading[0]**2 / derivative[0]
+        if not numpy.isfinite(tail):
+            return power_law
+        return tail
+
+    def _cover(self, log_p_min, log_p_max):
+        """Extend the table to cover the requested range of log pressure."""
+        for _ in range(20):
+            below = log_p_min < self.log_pressure[0] and not self._floor
+            above = log_p_max > self.log_pressure[-1]
+            if not (below or above):
+                return
+            if above and self.domain_max:
+                raise CalculationError(
+                    f"The model is only valid up to a pressure of {numpy.exp(self.log_pressure[-1]):.4g}."
+                )
+            # the log input changes with the log pressure as the exponent of the power law
+            slope_lo = 1 if self.calculates == 'loading' else self.exponent
+            slope_hi = 1 if self.calculates == 'loading' else \
+                numpy.clip(self._loading_spline(self.log_pressure[-1], 1), 1e-3, 1)
+            x_lo, x_hi = self.x[0], self.x[-1]
+            if below:
+                x_lo -= (self.log_pressure[0] - log_p_min) * slope_lo + numpy.log(10)
+            if above:
+                x_hi += (log_p_max - self.log_pressure[-1]) * slope_hi + numpy.log(2)
+            domain_max = self.domain_max
+            self._build(x_lo, x_hi)
+            # the top of the table is still the edge of the model
+            self.domain_max |= domain_max
+        raise CalculationError("Could not extend the model table to the pressure requested.")
+
+    def _from_table(self, spline, x, x_0, y_0, slope):
+        """Evaluate a log-log spline, or the power law below the table."""
+        return numpy.where(x < x_0, y_0 + slope * (x - x_0), spline(numpy.maximum(x, x_0)))
+
+    def loading_at(self, pressure):
+        """
+        Compute the loading at the pressures given.
+
+        Parameters
+        ----------
+        pressure : float or array
+            Pressure at which to compute loading.
+
+        Returns
+        -------
+        float or array
+            Loading at the pressures given.
+
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        result = numpy.zeros(pressure.shape)
+        positive = pressure > 0
+        if numpy.any(positive):
+            log_p = numpy.log(pressure[positive])
+            self._cover(log_p.min(), log_p.max())
+            result[positive] = numpy.exp(
+                self._from_table(
+                    self._loading_spline,
+                    log_p,
+                    self.log_pressure[0],
+                    numpy.log(self.loading[0]),
+                    self.exponent,
+                )
+            )
+
+        if result.ndim == 0:
+            return result[()]
+        return result
+
+    def spreading_pressure_at(self, pressure):
+        """
+        Compute the spreading pressure at the pressures given.
+
+        Parameters
+        ----------
+        pressure : float or array
+            Pressure at which to compute spreading pressure.
+
+        Returns
+        -------
+        float or array
+            Spreading pressure at the pressures given.
+
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        result = numpy.zeros(pressure.shape)
+        positive = pressure > 0
+        if numpy.any(positive):
+            log_p = numpy.log(pressure[positive])
+            self._cover(log_p.min(), log_p.max())
+            result[positive] = numpy.exp(
+                self._from_table(
+                    self._spreading_spline,
+                    log_p,
+                    self.log_pressure[0],
+                    numpy.log(self.spreading_pressure[0]),
+                    self.exponent,
+                )
+            )
+
+        if result.ndim == 0:
+            return result[()]
+        return result
+
+    def pressure_at_spreading_pressure(self, spreading_pressure):
+        """
+        Compute the pressure at which the spreading pressures given are reached.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            Spreading pressure for which to compute pressure.
+
+        Returns
+        -------
+        float or array
+            Pressure corresponding to each spreading pressure.
+
+        """
+        spreading_pressure = numpy.asarray(spreading_pressure, dtype=float)
+        result = numpy.zeros(spreading_pressure.shape)
+        positive = spreading_pressure > 0
+        if numpy.any(positive):
+            target = spreading_pressure[positive].max()
+            # the spreading pressure grows at least as fast as the last loading
+            while target > self.spreading_pressure[-1]:
+                self._cover(
+                    self.log_pressure[0],
+                    self.log_pressure[-1] +
+                    (target - self.spreading_pressure[-1]) / self.loading[-1],
+                )
+            log_spreading = numpy.log(spreading_pressure[positive])
+            result[positive] = numpy.exp(
+                self._from_table(
+                    self._inverse_spline,
+                    log_spreading,
+                    numpy.log(self.spreading_pressure[0]),
+                    self.log_pressure[0],
+                    1 / self.exponent,
+                )
+            )
+
+        if result.ndim == 0:
+            return result[()]
+        return result
+
+
+def _hermite(x_0, x_1, y_0, y_1, d_0, d_1, x):
+    """Evaluate the cubic Hermite polynomial on a cell."""
+    h = x_1 - x_0
+    t = (x - x_0) / h
+    t2 = t * t
+    t3 = t2 * t
+    return (2 * t3 - 3 * t2 + 1) * y_0 + (t3 - 2 * t2 + t) * h * d_0 + \
+        (-2 * t3 + 3 * t2) * y_1 + (t3 - t2) * h * d_1
@@ -1,10 +1,18 @@
 """Collections of various python utilities."""
 
 import importlib
+import os
+import pathlib
+import re
 import sys
+import tempfile
 import warnings
 from collections import abc
 
+import numpy
+
+from pygaps import logger
+
 
 def _one_pass(iters):
     i = 0
@@ -72,6 +80,54 @@ class SimpleWarning():
         return True
 
 
+def cache_dir() -> pathlib.Path:
+    """
+    Return the folder where calculated tables are stored between sessions.
+
+    It is set by the ``PYGAPS_CACHE_DIR`` environment variable, otherwise
+    it is a ``pygaps`` folder in the user cache directory.
+    """
+    path = os.environ.get("PYGAPS_CACHE_DIR")
+    if path:
+        return pathlib.Path(path)
+    path = os.environ.get("XDG_CACHE_HOME")
+    if path:
+        return pathlib.Path(path) / "pygaps"
+    return pathlib.Path.home() / ".cache" / "pygaps"
+
+
+def _cache_path(name: str) -> pathlib.Path:
+    return cache_dir() / (re.sub(r"[^\w.-]", "_", name) + ".npz")
+
+
+def cache_load(name: str) -> "dict | None":
+    """Return the arrays stored in the cache under a name, or None if they cannot be read."""
+    path = _cache_path(name)
+    if not path.exists():
+        return None
+    try:
+        with numpy.load(path) as stored:
+            return {key: stored[key] for key in stored.files}
+    except (OSError, ValueError) as err:
+        logger.debug(f"Could not read cached file '{path}': {err}")
+        return None
+
+
+def cache_store(name: str, **arrays):
+    """
+    Store arrays in the cache under a name. The file is replaced atomically,
+    and failures are only logged, as the cache is not required.
+    """
+    path = _cache_path(name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix='.npz', delete=False) as file:
+            numpy.savez(file, **arrays)
+        os.replace(file.name, path)
+    except OSError as err:
+        logger.debug(f"Could not store cached file '{path}': {err}")
+
+
 def _load_lazy(fullname):
     """
     This lazy load was used for non-critical modules to speed import time.
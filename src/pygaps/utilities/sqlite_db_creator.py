@@ -1,11 +1,16 @@
 """Generate the default sqlite database."""
 
 import json
+import sqlite3
 
 import pygaps
+from pygaps import logger
 from pygaps.parsing import sqlite as pgp_sqlite
+from pygaps.utilities.sqlite_db_pragmas import PRAGMA_ISOTHERM_INDEXES
 from pygaps.utilities.sqlite_db_pragmas import PRAGMAS
 from pygaps.utilities.sqlite_utilities import db_execute_general
+from pygaps.utilities.sqlite_utilities import decode_SQL_array
+from pygaps.utilities.sqlite_utilities import encode_SQL_array
 
 
 def db_create(path: str, verbose: bool = False):
@@ -49,3 +54,67 @@ def db_create(path: str, verbose: bool = False):
     pgp_sqlite.isotherm_type_to_db({'type': 'isotherm'}, db_path=path)
     pgp_sqlite.isotherm_type_to_db({'type': 'pointisotherm'}, db_path=path)
     pgp_sqlite.isotherm_type_to_db({'type': 'modelisotherm'}, db_path=path)
+
+
+def db_create_indexes(path: str, verbose: bool = False):
+    """
+    Create the isotherm query indexes in a database which lacks them.
+
+    Databases created with older versions have no indexes on the isotherm
+    tables, which makes filtered queries scan every isotherm.
+
+    Parameters
+    ----------
+    path : str
+        Path of the database.
+    verbose : bool
+        Print out extra information.
+
+    """
+    db_execute_general(PRAGMA_ISOTHERM_INDEXES, path, verbose=verbose)
+
+
+def db_migrate_data(path: str, encoding: str = "binary", verbose: bool = False) -> int:
+    """
+    Re-encode the isotherm data stored in a database.
+
+    Converts the data columns of all point isotherms to the selected encoding,
+    for example to store the JSON data of an older database as binary.
+    Model isotherms and isotherm properties are unchanged.
+
+    Parameters
+    ----------
+    path : str
+        Path of the database.
+    encoding : str
+        One of ``json``, ``binary`` or ``zlib``.
+    verbose : bool
+        Print out extra information.
+
+    Returns
+    -------
+    int
+        The number of data columns converted.
+
+    """
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            updates = []
+            for row_id, dtype, data in conn.execute(
+                """SELECT id, dtype, data FROM "isotherm_data" WHERE dtype != 'dict';"""
+            ):
+                new_dtype, new_data = encode_SQL_array(decode_SQL_array(dtype, data), encoding)
+                if new_dtype != dtype:
+                    updates.append((new_dtype, new_data, row_id))
+            conn.executemany('UPDATE "isotherm_data" SET dtype = ?, data = ? WHERE id = ?;', updates)
+
+        # Reclaim the space freed by the conversion
+        conn.execute('VACUUM;')
+    finally:
+        conn.close()
+
+    if verbose:
+        logger.info(f"Converted {len(updates)} data columns to '{encoding}'.")
+
+    return len(updates)
@@ -127,6 +127,19 @@ PRAGMA_ISOTHERM_DATA = """
     );
 """
 
+# Indexes used when querying isotherms
+
+PRAGMA_ISOTHERM_INDEXES = """
+    CREATE INDEX IF NOT EXISTS "isotherms_material_adsorbate_temperature"
+        ON "isotherms" (`material`, `adsorbate`, `temperature`);
+
+    CREATE INDEX IF NOT EXISTS "isotherm_properties_iso_id_type"
+        ON "isotherm_properties" (`iso_id`, `type`);
+
+    CREATE INDEX IF NOT EXISTS "isotherm_data_iso_id"
+        ON "isotherm_data" (`iso_id`);
+"""
+
 # List of pragmas
 
 PRAGMAS = [
@@ -140,4 +153,5 @@ PRAGMAS = [
     PRAGMA_ISOTHERMS,
     PRAGMA_ISOTHERM_PROPERTIES,
     PRAGMA_ISOTHERM_DATA,
+    PRAGMA_ISOTHERM_INDEXES,
 ]
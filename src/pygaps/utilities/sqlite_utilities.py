@@ -1,6 +1,10 @@
 """General functions for SQL query building."""
 
+import json
 import sqlite3
+import zlib
+
+import numpy
 
 from pygaps import logger
 from pygaps.utilities.exceptions import ParsingError
@@ -199,3 +203,71 @@ def find_SQL_python_type(val):
         if isinstance(val, supported_type):
             return supported_type.__name__
     raise ParsingError(f"Cannot store data of type {type(val)} in the database.")
+
+
+DATA_ENCODINGS = ["json", "binary", "zlib"]
+
+
+def encode_SQL_array(array, encoding: str = "json"):
+    """
+    Encode a data column for storage in the database.
+
+    With the ``json`` encoding, columns are stored as a JSON text array,
+    tagged with the python type of the values. With the ``binary`` encoding,
+    numeric columns are stored as raw little-endian bytes, tagged with their
+    dtype, and ``zlib`` further compresses the bytes. Non-numeric columns
+    are always stored as JSON.
+
+    Parameters
+    ----------
+    array : array-like
+        The column to encode.
+    encoding : str
+        One of ``json``, ``binary`` or ``zlib``.
+
+    Returns
+    -------
+    tuple
+        The dtype tag and the encoded data.
+
+    """
+    if encoding not in DATA_ENCODINGS:
+        raise ParsingError(f"Data encoding must be one of {DATA_ENCODINGS}, not '{encoding}'.")
+
+    array = numpy.asarray(array)
+
+    if encoding == "json" or array.dtype.kind not in "biuf":
+        values = array.tolist()
+        return find_SQL_python_type(values[0] if values else None), json.dumps(values)
+
+    array = array.astype(array.dtype.newbyteorder('<'), copy=False)
+    data = array.tobytes()
+    dtype = array.dtype.str
+    if encoding == "zlib":
+        data = zlib.compress(data)
+        dtype = f"zlib:{dtype}"
+    return dtype, data
+
+
+def decode_SQL_array(dtype: str, data):
+    """
+    Decode a data column stored in the database.
+
+    Parameters
+    ----------
+    dtype : str
+        The dtype tag of the column.
+    data : str or bytes
+        A JSON text array or an array of bytes, as stored by `encode_SQL_array`.
+
+    Returns
+    -------
+    list or numpy.ndarray
+        The decoded column.
+
+    """
+    if isinstance(data, bytes):
+        if dtype.startswith("zlib:"):
+            dtype, data = dtype[5:], zlib.decompress(data)
+        return numpy.frombuffer(data, dtype=dtype)
+    return json.loads(data)
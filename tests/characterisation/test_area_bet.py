@@ -14,8 +14,10 @@ All pre-calculated data for characterisation can be found in the
 import logging
 
 import pytest
+from numpy import array
 from numpy import isclose
 from numpy import linspace
+from scipy import stats
 
 import pygaps.characterisation.area_bet as ab
 import pygaps.parsing.json as pgpj
@@ -61,6 +63,52 @@ class TestAreaBET():
         with pytest.raises(pgEx.CalculationError):
             ab.area_BET_raw(P[4:], L[4:], 1)
 
+    def test_bet_windows(self):
+        """Test the scan of all BET regions."""
+        P = [0.001, 0.004, 0.009, 0.042, 0.093, 0.124, 0.156, 0.186]
+        L = [118, 135, 146, 172, 189, 195, 200, 203]
+        windows = ab.bet_windows(P, L, 1, min_corr=0)
+        assert len(windows['minimum']) > 0
+        assert all(windows['points'][:-1] >= windows['points'][1:])
+        assert all(windows['c_const'] > 0)
+
+        for index in range(len(windows['minimum'])):
+            minimum, maximum = windows['minimum'][index], windows['maximum'][index]
+            pressure, loading = P[minimum:maximum + 1], L[minimum:maximum + 1]
+            fit = stats.linregress(pressure, ab.bet_transform(array(pressure), array(loading)))
+            assert isclose(windows['slope'][index], fit.slope)
+            assert isclose(windows['intercept'][index], fit.intercept)
+            assert isclose(windows['corr_coef'][index], fit.rvalue)
+            assert loading[0] < windows['n_monolayer'][index] < loading[-1]
+
+        # a region with a decreasing Rouquerol plot is not valid
+        P[-1], L[-1] = 0.3, 150
+        windows = ab.bet_windows(P, L, 1, min_corr=0)
+        assert all(windows['maximum'] < len(P) - 1)
+
+    def test_area_BET_scan(self):
+        """Test the choice of the best scanned region."""
+        sample = DATA['MCM-41']
+        filepath = DATA_N77_PATH / sample['file']
+        isotherm = pgpj.isotherm_from_json(filepath)
+
+        result = ab.area_BET(isotherm, scan=True)
+        windows = result['windows']
+        assert result['p_limit_indices'] == (windows['minimum'][0], windows['maximum'][0])
+        assert isclose(result['area'], windows['area'][0])
+        assert isclose(result['area'], sample['bet_area'], 0.1, 0.1)
+
+        # scan within pressure limits
+        result = ab.area_BET(isotherm, p_limits=[0.05, 0.30], scan=True)
+        pressure = isotherm.pressure(pressure_mode='relative')
+        assert pressure[result['windows']['minimum']].min() >= 0.05
+
+        # the raw function returns the regions it scanned
+        raw = ab.area_BET_raw(pressure, isotherm.loading(loading_unit='mol'), 0.162, p_limits=[0.05, 0.30], scan=True)
+        assert len(raw) == 10
+        assert (raw[-1]['minimum'] == result['windows']['minimum']).all()
+        assert (raw[6], raw[7]) == result['p_limit_indices']
+
     @pytest.mark.parametrize('sample', [sample for sample in DATA])
     def test_area_bet(self, sample):
         """Test calculation with several model isotherms."""
@@ -4,7 +4,7 @@ This test module has tests relating to Dubinin plots.
 All functions in /calculations/dr_da_plots.py are tested here.
 The purposes are:
 
-    - testing the user-facing API function (dr_plot, da_plot)
+    - testing the user-facing API function (dr_plot, da_plot, da_plot_batch)
     - testing individual low level functions against known results.
 
 Functions are tested against pre-calculated values on real isotherms.
@@ -86,6 +86,50 @@ class TestDAPlot():
             assert isclose(da_vol, sample['da_volume'], err_relative, err_absolute)
             assert isclose(da_pot, sample['da_potential'], err_relative, err_absolute)
 
+    def test_da_exponent(self):
+        """Test the exponent search finds the smallest slope error."""
+        import numpy as np
+        from scipy import stats
+
+        pressure = np.geomspace(1e-6, 0.1, 30)
+        log_p = -np.log(pressure)
+        logv = -0.01 * log_p**2.4 - 1 + 0.01 * np.sin(log_p)
+        weights = np.ones(len(log_p))
+
+        exps = np.linspace(1, 3, 201)
+        stderr = [stats.linregress(log_p**exp, logv).stderr for exp in exps]
+        assert np.allclose(drda._da_regression(log_p, logv, weights, exps)[3], stderr)
+
+        exp = drda._da_exponent(log_p, logv, weights)
+        assert isclose(exp, exps[np.argmin(stderr)], atol=0.01)
+        assert isclose(exp, 2.4, atol=0.05)
+
+    def test_da_plot_batch(self):
+        """Test the batch fits are the same as single fits."""
+        isotherms = [
+            pgpj.isotherm_from_json(DATA_N77_PATH / DATA[sample]['file'])
+            for sample in ['Takeda 5A', 'UiO-66(Zr)', 'MCM-41']
+        ]
+        with pytest.raises(pgEx.ParameterError):
+            drda.da_plot_batch([])
+        with pytest.raises(pgEx.ParameterError):
+            drda.da_plot_batch(isotherms, p_limits=[[0, 0.1], [0, 0.2]])
+
+        res = drda.da_plot_batch(isotherms, p_limits=[0, 0.1])
+        for index, isotherm in enumerate(isotherms):
+            single = drda.da_plot(isotherm, p_limits=[0, 0.1])
+            for key in ['pore_volume', 'adsorption_potential', 'exponent', 'corr_coef']:
+                assert isclose(res[key][index], single[key])
+            assert tuple(res['p_limits'][index]) == single['p_limits']
+
+        # many pressure ranges of the same isotherm
+        limits = [[0, 0.01], [0, 0.1], [1e-4, 0.2]]
+        res = drda.da_plot_batch(isotherms[:1], exp=2, p_limits=limits)
+        for index, p_limits in enumerate(limits):
+            single = drda.dr_plot(isotherms[0], p_limits=p_limits)
+            assert res['exponent'][index] == 2
+            assert isclose(res['pore_volume'][index], single['pore_volume'])
+
     @mpl_cleanup
     def test_da_output(self):
         """Test verbosity."""
@@ -67,6 +67,122 @@ class TestPSDKernel():
                 principal_peak, sample['psd_micro_pore_size'], err_relative, err_absolute
             )
 
+    def test_psd_dft_solvers(self):
+        """Test the solvers for the kernel fit."""
+        sample = DATA['Takeda 5A']
+        filepath = DATA_N77_PATH / sample['file']
+        isotherm = pgp.isotherm_from_json(filepath)
+
+        with pytest.raises(pgEx.ParameterError):
+            psdk.psd_dft(isotherm, solver='test')
+
+        results = {
+            solver: psdk.psd_dft(isotherm, solver=solver)
+            for solver in ['nnls', 'active-set', 'slsqp']
+        }
+        for result in results.values():
+            assert np.allclose(
+                result['pore_volume_cumulative'][-1],
+                results['nnls']['pore_volume_cumulative'][-1],
+                rtol=1e-3,
+            )
+        assert np.allclose(
+            results['active-set']['pore_distribution'],
+            results['nnls']['pore_distribution'],
+        )
+
+        # regularisation makes the distribution smaller and smoother
+        regularized = psdk.psd_dft(isotherm, solver='tikhonov', solver_params={'regularization': 10})
+        assert np.linalg.norm(regularized['pore_distribution']) < np.linalg.norm(
+            results['nnls']['pore_distribution']
+        )
+        psdk.psd_dft(isotherm, solver='tikhonov')
+
+        # a custom solver can be passed
+        def solver(matrix, loading):
+            assert matrix.shape[0] == len(loading)
+            return np.zeros(matrix.shape[1])
+
+        result = psdk.psd_dft(isotherm, solver=solver, bspline_order=0)
+        assert np.all(result['kernel_loading'] == 0)
+
+    def test_psd_dft_kernel_cache(self, tmp_path, monkeypatch):
+        """Test kernels are parsed once, and their loadings kept for each pressure grid."""
+        from scipy import interpolate
+
+        from pygaps.data import KERNELS
+
+        monkeypatch.setenv('PYGAPS_CACHE_DIR', str(tmp_path))
+        monkeypatch.setattr(psdk, '_LOADED', {})
+        path = KERNELS['DFT-N2-77K-carbon-slit']
+        kernel = psdk._load_kernel(path)
+        assert psdk._load_kernel(path) is kernel
+        assert len(list(tmp_path.glob('kernel-*.npz'))) == 1
+
+        pressure = np.linspace(1e-4, 0.9, 50)
+        matrix = kernel.matrix(pressure)
+        assert matrix.shape == (len(pressure), len(kernel.pore_widths))
+        assert not matrix.flags.writeable
+        assert kernel.matrix(list(pressure)) is matrix
+        assert kernel.matrix(pressure[1:]) is not matrix
+
+        column = interpolate.interp1d(kernel.pressure, kernel.loading[:, 10], kind='cubic')
+        assert np.allclose(matrix[:, 10], column(pressure))
+
+        # the parsed kernel is read from the cache
+        monkeypatch.setattr(psdk, '_LOADED', {})
+        stored = psdk._load_kernel(path)
+        assert stored is not kernel
+        assert np.array_equal(stored.loading, kernel.loading)
+        assert np.array_equal(stored.pore_widths, kernel.pore_widths)
+
+    def test_psd_dft_batch(self):
+        """Test the batch fit is the same as fitting each isotherm on the kernel points."""
+        isotherms = [
+            pgp.isotherm_from_json(DATA_N77_PATH / DATA[sample]['file'])
+            for sample in ['MCM-41', 'Takeda 5A', 'UiO-66(Zr)']
+        ]
+        with pytest.raises(pgEx.ParameterError):
+            psdk.psd_dft_batch([])
+        with pytest.raises(pgEx.CalculationError):
+            psdk.psd_dft_batch(isotherms, p_limits=(0.5, 0.5))
+
+        result = psdk.psd_dft_batch(isotherms)
+        assert result['pore_distribution'].shape == (3, len(result['pore_widths']))
+        assert result['kernel_loading'].shape == (3, len(result['pressure']))
+
+        kernel_units = {
+            'loading_basis': 'molar',
+            'loading_unit': 'mmol',
+            'material_basis': 'mass',
+            'material_unit': 'g',
+            'pressure_mode': 'relative',
+        }
+        for index, isotherm in enumerate(isotherms):
+            loading = isotherm.loading_at(result['pressure'], **kernel_units)
+            pore_widths, pore_dist, _, _ = psdk.psd_dft_kernel_fit(
+                result['pressure'],
+                loading,
+                psdk.KERNELS['DFT-N2-77K-carbon-slit'],
+                solver='active-set',
+            )
+            assert np.allclose(pore_widths, result['pore_widths'])
+            assert np.allclose(pore_dist, result['pore_distribution'][index])
+
+        parallel = psdk.psd_dft_batch(isotherms, n_jobs=2)
+        assert np.allclose(parallel['pore_distribution'], result['pore_distribution'])
+
+    def test_nnls_normal(self):
+        """Test the active-set solver against scipy."""
+        from scipy import optimize
+        rng = np.random.default_rng(0)
+        matrix = np.abs(rng.normal(size=(60, 20))).cumsum(axis=0)
+        loading = matrix @ np.maximum(rng.normal(size=20), 0) + rng.normal(size=60)
+        assert np.allclose(
+            psdk._solve_active_set(matrix, loading),
+            optimize.nnls(matrix, loading)[0],
+        )
+
     @mpl_cleanup
     def test_psd_dft_verbose(self):
         """Test verbosity."""
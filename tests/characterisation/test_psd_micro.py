@@ -90,6 +90,22 @@ class TestPSDMicro():
             0.001
         )
 
+        # all points are solved at once, stopping after the first unrealistic pore size
+        pressure = np.linspace(0.01, 1, 100)
+        widths = pmic._solve_hk(pressure, lambda x: np.log(x / 20), 0.1, 1)
+        assert len(widths) == np.searchsorted(pressure, 0.5, side='right') + 1
+        assert widths[-2] <= 10 < widths[-1]
+        assert np.allclose(widths, 20 * pressure[:len(widths)], rtol=1e-5)
+
+        # below the minimum of the potential, the pore size at the minimum is used
+        def potential(x):
+            return np.log(x) + 0.1 / x
+
+        widths = pmic._solve_hk(pressure, potential, 0.01, 1)
+        reachable = pressure > np.exp(potential(0.1))
+        assert np.allclose(widths[~reachable], 0.1, rtol=0.01)
+        assert np.allclose(potential(widths[reachable]), np.log(pressure[reachable]))
+
     def test_psd_micro_hk(self):
         """Test H-K psd model with blank arrays"""
 
@@ -102,6 +102,11 @@ class TestCLI():
 
         assert isinstance(pgp.isotherm_from_json(outpath), pygaps.ModelIsotherm)
 
+        command = ["pygaps", "-md", "guess", "-w", 2, "--rmse-cutoff", 0.1, path]
+        out, err, exitcode = capture(command)
+        print(out, err)
+        assert exitcode == 0
+
     def test_convert(self, basic_pointisotherm, tmp_path_factory):
 
         tempdir = tmp_path_factory.mktemp('cli')
@@ -26,6 +26,12 @@ def pytest_runtest_setup(item):
 # Global fixtures
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the pyGAPS cache of each test in a temporary folder."""
+    monkeypatch.setenv('PYGAPS_CACHE_DIR', str(tmp_path / 'cache'))
+
+
 @pytest.fixture(scope='function')
 def isotherm_parameters():
     """Create a dictionary with all parameters for an isotherm."""
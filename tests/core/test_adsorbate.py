@@ -1,7 +1,11 @@
 """Tests relating to the Adsorbate class."""
 
+import pickle
+import subprocess
+import sys
 import warnings
 
+import numpy
 import pytest
 
 import pygaps
@@ -25,6 +29,39 @@ class TestAdsorbate():
         assert 'i' + ads == 'iTest'
         assert hash(ads) == hash('Test')
 
+    def test_adsorbate_list_lazy(self):
+        """The adsorbate list and CoolProp are only loaded when first used."""
+        script = "; ".join([
+            "import sys",
+            "import pygaps",
+            "assert not pygaps.ADSORBATE_LIST._loaded",
+            "assert 'CoolProp' not in sys.modules",
+            "assert 'pygaps.parsing.sqlite' not in sys.modules",
+            "assert 'nitrogen' in pygaps.ADSORBATE_LIST",
+            "assert pygaps.ADSORBATE_LIST._loaded",
+            "assert pygaps.Adsorbate.find('nitrogen').p_critical() > 0",
+        ])
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+    def test_adsorbate_list_load_retry(self):
+        """A failed read of the database is retried when the list is next used."""
+        from pygaps.data import _Catalogue
+
+        calls = []
+
+        def load():
+            calls.append(None)
+            if len(calls) == 1:
+                raise OSError("database is locked")
+            return [pygaps.Adsorbate('Test')]
+
+        catalogue = _Catalogue(load, lambda item: [item.name.lower()], str.lower)
+        with pytest.raises(OSError):
+            catalogue.get('test')
+        assert 'test' in catalogue
+        assert len(catalogue) == 1
+        assert len(calls) == 2
+
     def test_adsorbate_alias(self):
         """Aliasing tests."""
         ads = pygaps.Adsorbate(name='Test', alias=['Test2'])
@@ -66,6 +103,25 @@ class TestAdsorbate():
         with pytest.raises(ParameterError):
             pygaps.Adsorbate.find('not_uploaded')
 
+    def test_adsorbate_list_index(self):
+        """Check lookups in the adsorbate list follow changes to the list."""
+        first = pygaps.Adsorbate("IndexTest", alias=["idx"])
+        second = pygaps.Adsorbate("IndexTest2", alias=["IDX"])
+
+        pygaps.ADSORBATE_LIST.extend([first, second])
+        assert pygaps.Adsorbate.find('IDX') is first
+        assert 'indextest2' in pygaps.ADSORBATE_LIST
+        assert second in pygaps.ADSORBATE_LIST
+
+        pygaps.ADSORBATE_LIST.remove(first)
+        assert pygaps.Adsorbate.find('idx') is second
+        assert first not in pygaps.ADSORBATE_LIST
+
+        pygaps.ADSORBATE_LIST.pop()
+        assert 'idx' not in pygaps.ADSORBATE_LIST
+        with pytest.raises(ParameterError):
+            pygaps.Adsorbate.find('IndexTest2')
+
     def test_adsorbate_find_equals(self):
         """Check standard adsorbates can be found."""
         ads = pygaps.Adsorbate.find('N2')
@@ -73,6 +129,95 @@ class TestAdsorbate():
         assert ads == 'nitrogen'
         assert ads == 'Nitrogen'
 
+    def test_adsorbate_pickle(self):
+        """Check adsorbates can be pickled after using the thermodynamic backend."""
+        ads = pygaps.Adsorbate.find('N2')
+        ads.backend
+        ads_copy = pickle.loads(pickle.dumps(ads))
+        assert ads_copy == ads
+        assert ads_copy.molar_mass() == ads.molar_mass()
+
+    def test_adsorbate_property_cache(self):
+        """Check backend properties are cached until the backend changes."""
+        ads = pygaps.Adsorbate('CacheTest', backend_name='nitrogen')
+        sat_p = ads.saturation_pressure(77.355)
+        assert ads.saturation_pressure(77.355) == sat_p
+        assert ads.saturation_pressure(77.355, unit='bar') == pytest.approx(sat_p / 1e5)
+        assert ads.saturation_pressure(87) != sat_p
+        ads.enthalpy_liquefaction(77.355)
+        ads.enthalpy_liquefaction(press=1e5)
+        assert ads.cache_info()[:2] == (2, 4)
+
+        # a full cache discards the oldest values
+        ads._cache.maxsize = 2
+        ads.saturation_pressure(90)
+        assert ads.cache_info().currsize == 2
+
+        pickled = pickle.loads(pickle.dumps(ads))
+        assert pickled.cache_info().currsize == 0
+
+        pygaps.backend_use_coolprop()
+        assert ads.cache_info() == (0, 0, 2, 0)
+        assert ads.saturation_pressure(77.355) == sat_p
+
+    @pytest.mark.parametrize(
+        'prop', [
+            'saturation_pressure',
+            'surface_tension',
+            'liquid_density',
+            'liquid_molar_density',
+            'gas_density',
+            'gas_molar_density',
+            'enthalpy_liquefaction',
+        ]
+    )
+    def test_adsorbate_property_array(self, prop):
+        """Check backend properties can be calculated for arrays of state points."""
+        ads = pygaps.Adsorbate('ArrayTest', backend_name='nitrogen')
+        temps = numpy.array([[70, 77.355], [80, 70]])
+        result = getattr(ads, prop)(temps)
+        assert result.shape == temps.shape
+        ads.cache_clear()
+        expected = [[getattr(ads, prop)(temp) for temp in row] for row in temps.tolist()]
+        assert numpy.allclose(result, expected)
+
+    def test_adsorbate_enthalpy_pressure_array(self):
+        """Check enthalpy of liquefaction for an array of pressures."""
+        ads = pygaps.Adsorbate('ArrayTest', backend_name='nitrogen')
+        press = numpy.array([2e4, 1e5, 5e5])
+        result = ads.enthalpy_liquefaction(press=press)
+        ads.cache_clear()
+        assert numpy.allclose(result, [ads.enthalpy_liquefaction(press=p) for p in press])
+        assert numpy.all(numpy.diff(result) < 0)
+
+    def test_adsorbate_fast_thermo(self, tmp_path, monkeypatch):
+        """Check saturation properties interpolated from stored tables."""
+        monkeypatch.setenv('PYGAPS_CACHE_DIR', str(tmp_path))
+        ads = pygaps.Adsorbate('TableTest', backend_name='nitrogen')
+        temps = numpy.linspace(70, 120, 7)
+        expected = ads.saturation_pressure(temps)
+        enthalpy = ads.enthalpy_liquefaction(press=expected)
+        near_critical = ads.gas_density(126.19)
+
+        ads.fast_thermo = True
+        ads.cache_clear()
+        table = ads.saturation_table()
+        assert max(table.errors.values()) < 1e-5
+        assert numpy.allclose(ads.saturation_pressure(temps), expected, rtol=1e-6)
+        assert numpy.allclose(ads.enthalpy_liquefaction(press=expected), enthalpy, rtol=1e-6)
+        assert ads.cache_info().currsize == 0
+
+        # outside the table the backend is used
+        assert ads.gas_density(126.19) == near_critical
+        assert ads.cache_info().currsize == 1
+
+        # the table is stored and read back
+        assert len(list(tmp_path.glob('saturation-*.npz'))) == 1
+        stored = pygaps.Adsorbate('TableTest', backend_name='nitrogen').saturation_table()
+        assert stored is not table
+        assert stored.errors == table.errors
+        assert stored.lookup('liquid_density', 77) == pytest.approx(table.lookup('liquid_density', 77))
+
     def test_adsorbate_formula(self):
         """Check that formula is correctly latexed."""
         ads = pygaps.Adsorbate.find('N2')
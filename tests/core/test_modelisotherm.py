@@ -1,5 +1,8 @@
 """Tests relating to the ModelIsotherm class."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
 import pandas
 import pytest
 from pandas.testing import assert_series_equal
@@ -24,6 +27,23 @@ class TestModelConvenience():
     def test_model_isotherm(self, basic_pointisotherm):
         pgm.model_iso(basic_pointisotherm, model="Henry")
 
+    @pytest.mark.parametrize('n_jobs, chunk_size', [(None, 1), (2, 1), (2, 3)])
+    def test_model_isotherms(self, basic_pointisotherm, n_jobs, chunk_size):
+        isotherms = [basic_pointisotherm] * 4 + ['not an isotherm'] + [basic_pointisotherm]
+        results = list(
+            pgm.model_isotherms(isotherms, model="Henry", n_jobs=n_jobs, chunk_size=chunk_size)
+        )
+        assert sorted(r[0] for r in results) == list(range(len(isotherms)))
+        for index, isotherm, error in results:
+            if index == 4:
+                assert isotherm is None and error is not None
+            else:
+                assert error is None
+                assert isotherm.model.params['K'] == pytest.approx(1)
+
+        with pytest.raises(pgEx.ParameterError):
+            next(pgm.model_isotherms(isotherms, model="Henry", chunk_size=0))
+
 
 @pytest.mark.core
 class TestModelIsotherm():
@@ -141,6 +161,66 @@ class TestModelIsotherm():
                 isotherm, model=['Henry', 'DummyModel'], verbose=True
             )
 
+    def test_isotherm_create_guess_concurrent(self):
+        """Check isotherm guessing can be done in parallel."""
+
+        filepath = DATA_N77_PATH / DATA['MCM-41']['file']
+        isotherm = pgp.isotherm_from_json(filepath)
+
+        serial = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model='guess')
+        concurrent = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model='guess', workers=2)
+        assert concurrent.model.name == serial.model.name
+        assert concurrent.model.params == pytest.approx(serial.model.params)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            concurrent = pgm.model_iso(isotherm, model='guess', executor=executor)
+        assert concurrent.model.name == serial.model.name
+
+        # early cutoff returns the first model below the cutoff
+        cutoff = pygaps.ModelIsotherm.from_pointisotherm(
+            isotherm, model=['Langmuir', 'DSLangmuir'], rmse_cutoff=1
+        )
+        assert cutoff.model.name == 'Langmuir'
+
+    @pytest.mark.parametrize('model', ['Langmuir', 'Virial'])
+    @pytest.mark.parametrize('method', ['residuals', 'pairs'])
+    def test_isotherm_fit_uncertainty(self, model, method):
+        """Check the bootstrap uncertainty of model parameters."""
+
+        filepath = DATA_N77_PATH / DATA['MCM-41']['file']
+        isotherm = pgp.isotherm_from_json(filepath)
+        model_isotherm = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model=model)
+
+        result = model_isotherm.fit_uncertainty(n_samples=100, method=method, seed=1)
+        assert result['n_failed'] == 0
+        for param, value in model_isotherm.model.params.items():
+            assert len(result['params'][param]) == 100
+            low, high = result['params_interval'][param]
+            assert low <= high
+        low, high = result['loading_interval']
+        assert len(result['pressure']) == len(result['loading']) == len(low) == 50
+        valid = numpy.isfinite(result['loading'])
+        assert (low[valid] <= high[valid]).all()
+
+        # same samples give the same result in parallel
+        parallel = model_isotherm.fit_uncertainty(n_samples=100, method=method, seed=1, n_jobs=2)
+        for param in model_isotherm.model.params:
+            assert parallel['params'][param] == pytest.approx(result['params'][param])
+
+        with pytest.raises(pgEx.ParameterError):
+            model_isotherm.fit_uncertainty(method='wrong')
+        with pytest.raises(pgEx.ParameterError):
+            model_isotherm.fit_uncertainty(confidence=95)
+
+    def test_isotherm_fit_uncertainty_unfitted(self):
+        """Check the uncertainty requires the fitted data."""
+        model = pygaps.modelling.get_isotherm_model('Henry', parameters={'K': 1})
+        model_isotherm = pygaps.ModelIsotherm(
+            model=model, material='Test', temperature=303, adsorbate='nitrogen'
+        )
+        with pytest.raises(pgEx.ParameterError):
+            model_isotherm.fit_uncertainty()
+
     ##########################
 
     @pytest.mark.parametrize(
@@ -265,6 +345,26 @@ class TestModelIsotherm():
         assert basic_modelisotherm.spreading_pressure_at(inp, **parameters
                                                          ) == pytest.approx(expected, 1e-5)
 
+    @pytest.mark.parametrize(
+        'inp, expected, parameters',
+        [
+            (1, 1, dict()),
+            pytest.param(1, 1, {'branch': 'des'}, marks=pytest.mark.xfail),  # Wrong branch
+            (1, 100000, dict(pressure_unit='Pa')),
+        ]
+    )
+    def test_isotherm_pressure_at_spreading_pressure(
+        self,
+        use_adsorbate,
+        basic_modelisotherm,
+        inp,
+        parameters,
+        expected,
+    ):
+        """Check the ModelIsotherm inverse spreading pressure calculation."""
+        assert basic_modelisotherm.pressure_at_spreading_pressure(inp, **parameters
+                                                                  ) == pytest.approx(expected, 1e-5)
+
     @mpl_cleanup
     def test_isotherm_print_parameters(self, basic_modelisotherm):
         """Checks isotherm can print its own info."""
@@ -1,5 +1,6 @@
 """Tests relating to the PointIsotherm class."""
 
+import numpy
 import pandas
 import pytest
 from pandas.testing import assert_series_equal
@@ -399,6 +400,47 @@ class TestPointIsotherm():
         assert basic_pointisotherm.spreading_pressure_at(inp, **parameters
                                                          ) == pytest.approx(expected, 1e-5)
 
+    @pytest.mark.parametrize(
+        'inp, parameters', [
+            ([0.5, 1, 2.2, 5.5], dict()),
+            ([0.5, 1, 2.2, 5.5], dict(branch='ads')),
+            ([[0.5, 1], [2.2, 4.5]], dict(branch='des', interp_fill='extrapolate')),
+            ([50000, 100000, 550000], dict(pressure_unit='Pa', loading_unit='mol')),
+        ]
+    )
+    def test_isotherm_spreading_pressure_at_array(
+        self,
+        basic_pointisotherm,
+        inp,
+        parameters,
+    ):
+        """Check the PointIsotherm spreading pressure calculation on arrays."""
+        expected = [[basic_pointisotherm.spreading_pressure_at(p, **parameters)
+                     for p in numpy.ravel(inp)]]
+        result = basic_pointisotherm.spreading_pressure_at(inp, **parameters)
+        assert result.shape == numpy.shape(inp)
+        assert numpy.ravel(result) == pytest.approx(numpy.ravel(expected), 1e-10)
+
+    def test_isotherm_spreading_pressure_inverse(self, basic_pointisotherm):
+        """Check the PointIsotherm spreading pressure table and its inverse."""
+        pressure = [0.5, 1.5, 3.2, 5.9]
+        spreading = basic_pointisotherm.spreading_pressure_at(pressure)
+        assert spreading == pytest.approx(pressure, 1e-8)
+        assert basic_pointisotherm.pressure_at_spreading_pressure(spreading
+                                                                  ) == pytest.approx(pressure, 1e-8)
+
+        # Extrapolation is needed above the highest pressure
+        with pytest.raises(pgEx.CalculationError):
+            basic_pointisotherm.spreading_pressure_at(7)
+        spreading = basic_pointisotherm.spreading_pressure_at(7, interp_fill=6)
+        assert spreading == pytest.approx(6 + 6 * numpy.log(7 / 6), 1e-8)
+        assert basic_pointisotherm.pressure_at_spreading_pressure(spreading, interp_fill=6
+                                                                  ) == pytest.approx(7, 1e-8)
+
+        # The table is rebuilt after conversion
+        basic_pointisotherm.convert_loading(unit_to='mol')
+        assert basic_pointisotherm.spreading_pressure_at(1) == pytest.approx(0.001, 1e-8)
+
     ##########################
 
     @pytest.mark.parametrize(
@@ -287,9 +287,9 @@ MODEL_DATA = {
             ],
             'loading': [0.0, 0.2, 0.4, 0.6, 1.0, 2.0],
             'spreading_pressure':
-            [0.0, 15.77393361, 18.77393361, 20.77393361, 25.0, 30.62232981],
+            [0.0, 0.200020653, 0.400086187, 0.60020412, 1.000641667, 2.003733333],
             'spreading_pressure_mark':
-            pytest.mark.xfail,
+            pytest.mark.okay,
         }
     },
     'FHVST': {
@@ -306,8 +306,8 @@ MODEL_DATA = {
         'test_values': {
             'pressure': [0.0, 0.10134005, 0.534198619, 44.75474093],
             'loading': [0.0, 0.2, 1.0, 20.0],
-            'spreading_pressure': [0.0, 15.77393361, 25.0, 39.62232981],
-            'spreading_pressure_mark': pytest.mark.xfail,
+            'spreading_pressure': [0.0, 0.201330429, 1.032999299, 36.28313737],
+            'spreading_pressure_mark': pytest.mark.okay,
         }
     },
     'WVST': {
@@ -326,8 +326,8 @@ MODEL_DATA = {
         'test_values': {
             'pressure': [0.0, 0.101346218, 0.534999558],
             'loading': [0.0, 0.2, 1.0],
-            'spreading_pressure': [0.0, 15.77393361, 25.0],
-            'spreading_pressure_mark': pytest.mark.xfail,
+            'spreading_pressure': [0.0, 0.201338541, 1.033995703],
+            'spreading_pressure_mark': pytest.mark.okay,
         }
     }
 }
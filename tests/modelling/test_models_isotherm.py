@@ -123,3 +123,152 @@ class TestIsothermModels():
         )
         # for param in param_real:
         #     assert numpy.isclose(model.params[param], param_real[param], 0.01)
+
+    @pytest.mark.parametrize("m_name", MODEL_DATA.keys())
+    def test_models_kernel(self, m_name):
+        """Test each model's kernel with many parameter sets."""
+
+        model = models.get_isotherm_model(m_name)
+        model.params = dict(MODEL_DATA[m_name]['test_parameters'])
+        test_values = MODEL_DATA[m_name]['test_values']
+        if model.calculates == 'loading':
+            x = numpy.array(test_values['pressure'])
+            func, kernel = model.loading, model.loading_kernel
+        else:
+            x = numpy.array(test_values['loading'])
+            func, kernel = model.pressure, model.pressure_kernel
+
+        # the existing methods are the kernel for the current parameters
+        theta = model.param_array
+        assert kernel(x, theta) == pytest.approx(func(x))
+        assert kernel(x[1], theta) == pytest.approx(func(x[1]))
+
+        # M parameter sets give an M x N array
+        thetas = theta * numpy.array([[1.0], [1.01], [0.99]])
+        result = kernel(x, thetas)
+        assert result.shape == (3, len(x))
+        for row, params in zip(result, thetas):
+            model.params = dict(zip(model.param_names, params))
+            assert row == pytest.approx(func(x))
+
+    @pytest.mark.parametrize("m_name", ["Langmuir", "Toth", "JensenSeaton", "Virial", "FHVST"])
+    def test_models_fit_samples(self, m_name):
+        """Test fitting many samples of a model together."""
+
+        model = models.get_isotherm_model(m_name)
+        params = dict(MODEL_DATA[m_name]['test_parameters'])
+        test_values = MODEL_DATA[m_name]['test_values']
+        pressure = numpy.array(test_values['pressure'])
+        loading = numpy.array(test_values['loading'])
+        model.params = dict(params)
+
+        # perturbed data, fitted together and one by one
+        noise = numpy.random.default_rng(0).normal(1, 0.01, (5, len(pressure)))
+        if model.calculates == 'loading':
+            samples = (pressure, loading * noise)
+        else:
+            samples = (pressure * noise, loading)
+        theta = model.fit_samples(*samples)
+        assert theta.shape == (5, len(params))
+
+        # the fit is at least as good as fitting each sample
+        for index, row in enumerate(theta):
+            pressure, loading = [data[index] if data.ndim > 1 else data for data in samples]
+            # some samples need more evaluations than the default to converge
+            model.fit(pressure, loading, params, optimization_params={'max_nfev': 5000})
+            if model.calculates == 'loading':
+                residuals = [model.loading_kernel(pressure, th) - loading for th in (row, model.param_array)]
+            else:
+                residuals = [model.pressure_kernel(loading, th) - pressure for th in (row, model.param_array)]
+            assert numpy.sum(residuals[0]**2) <= numpy.sum(residuals[1]**2) * (1 + 1e-6)
+
+    @pytest.mark.parametrize(
+        "m_name", [key for key in MODEL_DATA if models.get_isotherm_model(key).jacobian]
+    )
+    def test_models_jacobian(self, m_name):
+        """Test each model's jacobian against finite differences."""
+
+        model = models.get_isotherm_model(m_name)
+        params = dict(MODEL_DATA[m_name]['test_parameters'])
+        test_values = MODEL_DATA[m_name]['test_values']
+        x = numpy.array(test_values['pressure' if model.calculates == 'loading' else 'loading'])
+        func = model.loading if model.calculates == 'loading' else model.pressure
+
+        # the jacobian only depends on the parameters passed, not on the model's
+        model.params = {param: numpy.nan for param in params}
+        jacobian = model.jacobian(x, numpy.array([params[param] for param in model.param_names]))
+
+        for param, value in params.items():
+            step = abs(value) * 1e-6 or 1e-8
+            model.params = dict(params, **{param: value + step})
+            upper = func(x)
+            model.params = dict(params, **{param: value - step})
+            lower = func(x)
+            assert numpy.broadcast_to(jacobian[param], x.shape) == pytest.approx(
+                (upper - lower) / (2 * step), rel=1e-4, abs=1e-8
+            )
+
+        # several parameter sets at once, as used by fit_samples
+        theta = numpy.array([[params[param] for param in model.param_names]] * 2, dtype=float)
+        theta[1] *= 1.1
+        stacked = model.jacobian(x, theta)
+        for row in range(2):
+            single = model.jacobian(x, theta[row])
+            for param in params:
+                assert numpy.broadcast_to(stacked[param], (2, ) + x.shape)[row] == pytest.approx(
+                    numpy.broadcast_to(single[param], x.shape)
+                )
+
+    @pytest.mark.parametrize("m_name", ["Toth", "JensenSeaton", "Virial", "FHVST", "WVST"])
+    def test_models_table(self, m_name):
+        """Test the interpolation table of numerical models."""
+
+        model = models.get_isotherm_model(m_name)
+        model.params = dict(MODEL_DATA[m_name]['test_parameters'])
+        test_values = MODEL_DATA[m_name]['test_values']
+        pressure = numpy.array(test_values['pressure'])
+
+        # arrays are supported and the table is cached
+        s_pressure = model.spreading_pressure(pressure)
+        assert s_pressure == pytest.approx([model.spreading_pressure(p) for p in pressure])
+        table = model.table()
+        assert model.table() is table
+
+        # inverse of spreading pressure
+        assert model.pressure_at_spreading_pressure(s_pressure) == pytest.approx(pressure, 1e-4)
+
+        # the table is recalculated when parameters change
+        model.params[model.param_names[1]] *= 2
+        assert model.table() is not table
+        assert model.spreading_pressure(pressure[-1]) != pytest.approx(s_pressure[-1])
+
+    @pytest.mark.parametrize("t", [0.3, 0.6])
+    @pytest.mark.parametrize("pressure", [1e-6, 1e-4, 1e-2])
+    def test_models_table_low_pressure(self, t, pressure):
+        """Test the spreading pressure at low pressure, where the model is not yet linear."""
+        from scipy import integrate
+
+        model = models.get_isotherm_model("Toth")
+        model.params = {'n_m': 5, 'K': 2, 't': t}
+        model.pressure_range = (0, 100)
+
+        expected = integrate.quad(
+            lambda p: model.loading(p) / p,
+            0,
+            pressure,
+            points=[pressure * 1e-12, pressure * 1e-8, pressure * 1e-4],
+            epsabs=0,
+            epsrel=1e-12,
+            limit=1000,
+        )[0]
+        assert model.spreading_pressure(pressure) == pytest.approx(expected, rel=model.table_tolerance)
+
+    def test_models_table_range(self):
+        """Test the table is limited to the range where the model is valid."""
+
+        model = models.get_isotherm_model("Virial")
+        model.params = {'K': 5, 'A': -1, 'B': 0, 'C': 0}
+        # the pressure has a maximum at a loading of 1
+        assert model.pressure(model.loading(0.07)) == pytest.approx(0.07, 1e-4)
+        with pytest.raises(pgEx.CalculationError):
+            model.loading(0.1)
@@ -1,11 +1,15 @@
 """Tests sqlite database utilities."""
 
+import copy
+import sqlite3
+
 import pytest
 
 import pygaps
 from pygaps.parsing import sqlite as pgsql
 from pygaps.utilities.exceptions import ParsingError
 from pygaps.utilities.sqlite_db_creator import db_create
+from pygaps.utilities.sqlite_db_creator import db_migrate_data
 from pygaps.utilities.sqlite_db_creator import db_execute_general
 
 
@@ -252,3 +256,189 @@ class TestDatabase():
 
         # Convenience function test
         basic_modelisotherm.to_db(db_file)
+
+    def test_isotherms_iterator(self, db_file, basic_pointisotherm, basic_modelisotherm):
+        """Test reading isotherms one by one from the database."""
+
+        isotherms = pgsql.isotherms_from_db(db_path=db_file)
+        assert basic_pointisotherm in isotherms
+        assert basic_modelisotherm in isotherms
+
+        iterated = pgsql.isotherms_from_db(db_path=db_file, iterator=True, chunk_size=1)
+        assert not isinstance(iterated, list)
+        assert list(iterated) == isotherms
+
+        # the criteria are applied to the isotherms table
+        iterated = pgsql.isotherms_from_db(
+            criteria={'iso_type': 'modelisotherm'}, db_path=db_file, iterator=True
+        )
+        assert list(iterated) == [basic_modelisotherm]
+
+    def test_isotherms_bulk(self, db_file, basic_pointisotherm, basic_modelisotherm):
+        """Test uploading many isotherms at once."""
+
+        def generate(indices):
+            for index in indices:
+                isotherm = copy.deepcopy(basic_pointisotherm if index % 2 else basic_modelisotherm)
+                isotherm.properties['bulk_index'] = index
+                yield isotherm
+
+        def bulk_uploaded():
+            with sqlite3.connect(db_file) as conn:
+                return conn.execute(
+                    "SELECT iso_id FROM isotherm_properties WHERE type = 'bulk_index'"
+                ).fetchall()
+
+        db_execute_general('CREATE INDEX "test_index" ON "isotherm_data" ("iso_id");', db_file)
+        uploaded = pgsql.isotherms_to_db(
+            generate(range(7)), db_path=db_file, batch_size=3, drop_indexes=True
+        )
+        assert uploaded == 7
+        assert len(bulk_uploaded()) == 7
+
+        # the indexes are recreated
+        with sqlite3.connect(db_file) as conn:
+            assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'test_index'").fetchone()
+
+        # a failed batch is rolled back, the previous ones are kept
+        with pytest.raises(ParsingError):
+            pgsql.isotherms_to_db(generate([10, 11, 12, 13, 14, 1]), db_path=db_file, batch_size=3)
+        assert len(bulk_uploaded()) == 10
+
+        for iso_id, in bulk_uploaded():
+            pgsql.isotherm_delete_db(iso_id, db_path=db_file)
+        db_execute_general('DROP INDEX "test_index";', db_file)
+
+    def test_session(self, db_file, basic_pointisotherm, material_data):
+        """Test reusing one connection between calls."""
+        basic_material = pygaps.Material(**{**material_data, 'name': 'TEST-SESSION'})
+
+        with pgsql.Session(db_file) as session:
+            assert session.cursor().execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            assert session.cursor().execute('PRAGMA foreign_keys').fetchone()[0] == 1
+
+            pgsql.material_to_db(basic_material, session=session)
+            assert basic_material in pgsql.materials_from_db(session=session)
+
+            # errors are raised and rolled back as without a session
+            with pytest.raises(ParsingError):
+                pgsql.material_to_db(basic_material, session=session)
+
+            isotherm = copy.deepcopy(basic_pointisotherm)
+            isotherm.properties['session'] = 'single'
+            pgsql.isotherm_to_db(isotherm, session=session)
+            assert isotherm in pgsql.isotherms_from_db(session=session)
+            pgsql.isotherm_delete_db(isotherm, session=session)
+
+            isotherm.properties['session'] = 'bulk'
+            assert pgsql.isotherms_to_db([isotherm], session=session) == 1
+            pgsql.isotherm_delete_db(isotherm, session=session)
+
+            # other errors are also rolled back
+            failing = copy.deepcopy(isotherm)
+            failing.material = 'TEST-SESSION-ROLLBACK'
+            failing.properties['unhashable'] = {'a': 1}
+            with pytest.raises(sqlite3.ProgrammingError):
+                pgsql.isotherm_to_db(failing, session=session)
+            assert not session.connection.in_transaction
+            pgsql.adsorbates_from_db(session=session)
+            assert 'TEST-SESSION-ROLLBACK' not in [
+                material.name for material in pgsql.materials_from_db(session=session)
+            ]
+
+            # a batch failing on any error leaves nothing behind
+            failing = copy.deepcopy(isotherm)
+            failing.material = 'TEST-SESSION-ROLLBACK'
+            with pytest.raises(AttributeError):
+                pgsql.isotherms_to_db([failing, 'not an isotherm'], session=session)
+            assert not session.connection.in_transaction
+            assert 'TEST-SESSION-ROLLBACK' not in [
+                material.name for material in pgsql.materials_from_db(session=session)
+            ]
+            assert failing not in pgsql.isotherms_from_db(session=session)
+
+            pgsql.material_delete_db(basic_material, session=session)
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            session.cursor()
+
+    def test_isotherm_data_encoding(self, db_file, basic_pointisotherm):
+        """Test storing isotherm data as binary and migrating old data."""
+
+        def stored_dtypes(isotherm):
+            with sqlite3.connect(db_file) as conn:
+                return dict(
+                    conn.execute(
+                        'SELECT type, dtype FROM "isotherm_data" WHERE iso_id = ?', (isotherm.iso_id, )
+                    ).fetchall()
+                )
+
+        isotherms = []
+        for encoding in ['json', 'binary', 'zlib']:
+            isotherm = copy.deepcopy(basic_pointisotherm)
+            isotherm.properties['encoding'] = encoding
+            pgsql.isotherm_to_db(isotherm, db_path=db_file, data_encoding=encoding)
+            isotherms.append(isotherm)
+
+        assert stored_dtypes(isotherms[0])['pressure'] == 'float'
+        assert stored_dtypes(isotherms[1])['pressure'] == '<f8'
+        assert stored_dtypes(isotherms[2])['pressure'] == 'zlib:<f8'
+        assert stored_dtypes(isotherms[2])['text_data'] == 'str'
+
+        def read_back():
+            return pgsql.isotherms_from_db(criteria={'iso_type': 'pointisotherm'}, db_path=db_file)
+
+        for isotherm in isotherms:
+            assert isotherm in read_back()
+
+        # older JSON data can be converted in place
+        assert db_migrate_data(db_file, encoding='binary') > 0
+        assert stored_dtypes(isotherms[0])['pressure'] == '<f8'
+        assert stored_dtypes(isotherms[0])['enthalpy'] == '<f8'
+        for isotherm in isotherms:
+            assert isotherm in read_back()
+
+        db_migrate_data(db_file, encoding='json')
+        for isotherm in isotherms:
+            assert stored_dtypes(isotherm)['pressure'] == 'float'
+            pgsql.isotherm_delete_db(isotherm, db_path=db_file)
+
+    def test_isotherms_query(self, db_file, basic_pointisotherm):
+        """Test filtering, ordering and limiting isotherms in the database."""
+        isotherms = []
+        for index in range(6):
+            isotherm = copy.deepcopy(basic_pointisotherm)
+            isotherm.temperature = 100 + 10 * index
+            isotherm.properties['query_index'] = index
+            isotherm.properties['query_even'] = index % 2 == 0
+            isotherms.append(isotherm)
+        pgsql.isotherms_to_db(isotherms, db_path=db_file)
+
+        def query(**kwargs):
+            return [
+                iso.properties['query_index'] for iso in pgsql.isotherms_from_db(
+                    db_path=db_file,
+                    order_by=kwargs.pop('order_by', 'query_index'),
+                    **kwargs,
+                )
+            ]
+
+        assert query(criteria={'query_index': (None, None)}) == [0, 1, 2, 3, 4, 5]
+        assert query(criteria={'query_index': (2, 4)}) == [2, 3, 4]
+        assert query(criteria={'query_index': (None, 1), 'temperature': 100}) == [0]
+        assert query(criteria={'temperature': (115, 135), 'query_even': True}) == [2]
+        assert query(criteria={'query_index': (0, None)}, order_by='-temperature', limit=2) == [5, 4]
+        assert query(criteria={'query_index': (0, None)}, limit=2, offset=3) == [3, 4]
+        assert query(criteria={'query_index': (0, None)}, offset=4) == [4, 5]
+
+        with pytest.raises(ParsingError):
+            query(criteria={'temperature': (1, 2, 3)})
+
+        # property filters go through the index
+        sql, params = pgsql._isotherms_query({'query_index': 1})
+        with sqlite3.connect(db_file) as conn:
+            plan = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        assert any('isotherm_properties_iso_id_type' in row[-1] for row in plan)
+
+        for isotherm in isotherms:
+            pgsql.isotherm_delete_db(isotherm, db_path=db_file)
@@ -65,7 +65,7 @@ class TestIAST():
             pgi.iast_point_fraction([ch4, c2h6], [0.1], 1)
 
         # Raises "model cannot be used with IAST"
-        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Virial')
+        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Freundlich')
         with pytest.raises(pgEx.ParameterError):
             pgi.iast_point_fraction([ch4_m, c2h6], [0.6, 0.4], 1)
 
@@ -100,6 +100,41 @@ class TestIAST():
         pgi.iast_point_fraction(load_iast, [0.5, 0.5], 1, verbose=True)
 
 
+@pytest.mark.prediction
+class TestIASTBatch():
+    """Test batch IAST calculations."""
+    def test_iast_batch_checks(self, load_iast):
+        """Checks for built-in safeguards."""
+
+        ch4, c2h6 = load_iast
+
+        # Raises "not enough components error"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_batch([ch4], [[0.1]])
+
+        # Raises "different dimensions of arrays"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_batch([ch4, c2h6], [[0.1], [0.2]])
+
+        # Raises "non-positive pressures"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_batch([ch4, c2h6], [[0.1, 0], [0.2, 0.3]])
+
+    @pytest.mark.parametrize('models', [False, True])
+    def test_iast_batch(self, load_iast, load_iast_models, models):
+        """Test that the batch solver agrees with single point IAST."""
+
+        isotherms = load_iast_models if models else load_iast
+        fractions = numpy.linspace(0.05, 0.95, 10)
+        partial_pressures = numpy.column_stack([fractions, 1 - fractions])
+
+        loadings = pgi.iast_batch(isotherms, partial_pressures)
+        expected = [pgi.iast_point(isotherms, p) for p in partial_pressures]
+
+        assert loadings.shape == partial_pressures.shape
+        assert numpy.allclose(loadings, expected, rtol=1e-6)
+
+
 @pytest.mark.modelling
 class TestReverseIAST():
     """Test reverse IAST calculations."""
@@ -121,7 +156,7 @@ class TestReverseIAST():
             pgi.reverse_iast([ch4, c2h6], [0.1, 0.4], 1)
 
         # Raises "model cannot be used with IAST"
-        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Virial')
+        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Freundlich')
         with pytest.raises(pgEx.ParameterError):
             pgi.reverse_iast([ch4_m, c2h6], [0.6, 0.4], 1)
 
@@ -1,4 +1,5 @@
 """Test sqlite utilities."""
+import numpy
 import pytest
 
 import pygaps.utilities.sqlite_utilities as squ
@@ -45,3 +46,28 @@ def test_select_unnamed():
 def test_delete():
     delete = r'DELETE FROM "table" WHERE a = :a AND b = :b'
     assert delete == squ.build_delete(tb, s1)
+
+
+@pytest.mark.utilities
+@pytest.mark.parametrize('encoding', squ.DATA_ENCODINGS)
+@pytest.mark.parametrize(
+    'column', [
+        numpy.linspace(0, 1, 5),
+        numpy.arange(5),
+        numpy.array([True, False]),
+        numpy.array(['a', 'b']),
+    ]
+)
+def test_encode_array(column, encoding):
+    dtype, data = squ.encode_SQL_array(column, encoding)
+    if encoding != 'json' and column.dtype.kind != 'U':
+        assert isinstance(data, bytes)
+    decoded = squ.decode_SQL_array(dtype, data)
+    numpy.testing.assert_array_equal(decoded, column)
+
+
+@pytest.mark.utilities
+def test_encode_array_json_tags():
+    assert squ.encode_SQL_array([1.0, 2.0]) == ('float', '[1.0, 2.0]')
+    with pytest.raises(squ.ParsingError):
+        squ.encode_SQL_array([1.0], 'pickle')